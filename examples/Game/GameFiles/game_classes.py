@@ -7,6 +7,7 @@ Script Overview:
 - Implements logic for projectile movement and behavior when on target.
 - Defines the 'MainActor' class representing the main character in the game.
 - Implements logic for character movement, animation selection, and projectile creation.
+- Fireballs are drawn from an ActorPool kept on the game, so repeated launches reuse actors and their loaded animations.
 - Defines the 'red_square' class representing red square actors in the game.
 - Implements logic for the movement of red square actors within the game environment.
 
@@ -66,22 +67,28 @@ class MainActor(AnimatedActor):
             
         if not self.launched_fireball and self.game.pressed_status[pg.K_SPACE]:
             try:
-                p = Projectile(self.center_, size = [50,50], 
-                               death_timer_limit = .075)
-                
+                # the pool lives on the game, which is not saved
+                if not hasattr(self.game, 'fireball_pool'):
+                    self.game.fireball_pool = ActorPool(self.make_fireball, capacity = 4)
+                p = self.game.fireball_pool.acquire(position = np.array(self.center_))
                 p.position = [y-x for x,y in zip(p.size, p.center())]
-                
-                self.widget.add_actor(p)
-                p.AddAnimation(os.path.join(self.game.assets_folder, 'fireball'), 
-                               frame_wait = 10, scale = 2,
-                               colorkey = (3,5,7))
                 p.target = [round(x) for x in self.widget.cursor_loc]
+                self.widget.add_actor(p)
                 p.rotate_animations()
                 self.launched_fireball = True
                 
             except Exception as err:
                 raise(err)
             #pg.quit()
+    
+    def make_fireball(self):
+        p = Projectile(self.center_, size = [50,50], 
+                       death_timer_limit = .075)
+        p.AddAnimation(os.path.join(self.game.assets_folder, 'fireball'), 
+                       path = self.game.handler.path,
+                       frame_wait = 10, scale = 2,
+                       colorkey = (3,5,7))
+        return p
             
     def movement(self):
         self.center_ = self.center()
@@ -33,6 +33,7 @@ from PyGame_ClassExt_smongan1.utilities import *
 from PyGame_ClassExt_smongan1.BaseClasses import *
 from PyGame_ClassExt_smongan1.AnimationClasses import *
 from PyGame_ClassExt_smongan1.RPGElements import *
+from PyGame_ClassExt_smongan1.Pooling import ActorPool
 
 import time
 import numpy as np
@@ -103,7 +104,9 @@ if __name__ == "__main__":
         raise(e)
     finally:
         pg.quit()
-    print(sum(handle.times)/len(handle.times))
+    frame_stats = handle.stats.get_summary()
+    print(frame_stats['frame'])
+    print('jank frames:', frame_stats['jank_frames'], 'of', frame_stats['total_frames'])
     # Run until the user asks to quit
 
     # Done! Time to quit.
@@ -194,15 +194,24 @@ def get_all_deep_files(files):
     glob_path = os.path.join(files, '**')
     return get_all_deep_files(glob(glob_path))
 
+def change_file_loc(wid_f, file_loc):
+    if wid_f.file_loc == file_loc: return
+    wid_f.file_loc = file_loc
+    wid_f.game.events.publish('file_loc_changed', source = wid_f, file_loc = file_loc)
+
 class LoadThread(Thread):
     def run(self):
-        print("importing documents")
-        print(os.getcwd())
-        import_documents()
-        print("building case")
-        if self.files:
-            self.files = get_all_deep_files(self.files)
-            self.value = Case(self.files)
+        try:
+            print("importing documents")
+            print(os.getcwd())
+            import_documents()
+            print("building case")
+            if self.files:
+                self.files = get_all_deep_files(self.files)
+                self.value = Case(self.files)
+        finally:
+            # queued events are delivered by the game thread at the end of its update
+            self.events.publish('case_loaded', source = self)
         
 class SquareButton(Button):
     
@@ -228,18 +237,13 @@ class SquareChangeLayer(ChangeLayerButton, SquareButton):
         None
     
 class SizeChanger(Widget):
-
+    event_handlers = {'scroll' : 'on_scroll'}
     
-    def update_scroll(self):
+    def on_scroll(self, event):
         if isinstance(self.scroll_bar, str):
             self.scroll_bar = self.layer.get_component(self.scroll_bar)
-            self.prev_pos = self.scroll_bar.get_relative_position()
-        if not hasattr(self.scroll_bar, 'scroll_range'):
-            return
-        pos = self.scroll_bar.get_relative_position()
-        if self.prev_pos == pos: return
-        self.prev_pos = pos
-        self.scroll_pos[1] = pos*(self.orig_size[1] - self.size[1])
+        if not event.source is self.scroll_bar: return
+        self.scroll_pos[1] = event.position*(self.orig_size[1] - self.size[1])
     
     def update(self):
         if not self.initialized:
@@ -297,9 +301,8 @@ class DocumentPath(SquareButton):
         #wbopen(path)
         
 class DocumentShower(Actor):
-    def logic(self):
-        if not self.widget.new_results: return
-        self.widget.new_results = False
+    def init_draw(self):
+        super().init_draw()
         self.document_button.render_font()
         self.document_button.resize()
         self.widget.resize(self.document_button.size[1])
@@ -331,16 +334,18 @@ class search_button(ChangeLayerButton, SquareButton):
             self.search_bars2 = [self.game.get_component(x)
                                for x in ['textbox_search_bar',
                                          'textbox_search_bar2']]
-        self.results_wid.new_results = True
         for x in self.search_bars:
             if x: text = x.text
         for x in self.search_bars2:
             if x:  x.text = text
         self.results_wid.results2 = self.game.case.search(text)
         self.results_wid.results = self.results_wid.results2['sentences']
+        self.game.events.publish('new_results', source = self.results_wid)
         self.game.change_layer(self.results_wid.layer.id)
         
 class LoadingScreen(Widget):
+    event_handlers = {'case_loaded' : 'on_case_loaded'}
+    
     def logic(self):
         if self.load_bar_orig is None:
             for graphic in self.graphics:
@@ -353,13 +358,17 @@ class LoadingScreen(Widget):
         size2 = np.array(self.load_bar.surf.get_size())
         self.load_bar.surf.fill((255,255,255))
         self.load_bar.surf.blit(temp, (size2 - size1)/2)
+        self.load_bar.mark_dirty()
         self.rot_cnt += 1
-        if self.thread.is_alive(): return
+        
+    def on_case_loaded(self, event):
+        if not event.source is self.thread: return
         print('joining')
         self.thread.join()
         self.game.case = self.thread.value
         self.game.change_layer(self.next_layer)
-        self.load_bar.surf = self.load_bar_orig.copy()
+        if not self.load_bar_orig is None:
+            self.load_bar.surf = self.load_bar_orig.copy()
         
     def update_init(self):
         if self.first_screen:
@@ -376,6 +385,7 @@ class BuildCase(ChangeLayerButton):
         thread = LoadThread()
         thread.value = None
         thread.files = self.layer.get_component('widget_case_files').case_files
+        thread.events = self.game.events
         print("thread starting")
         thread.start()
         loading_wid.thread = thread
@@ -383,14 +393,18 @@ class BuildCase(ChangeLayerButton):
         self.game.change_layer('Main_menu')
         
 class FileShower(Actor):
+    event_handlers = {'file_loc_changed' : 'show_files'}
     
-    def logic(self):
+    def init_draw(self):
+        super().init_draw()
+        self.show_files()
+    
+    def show_files(self, event = None):
         wid_file = self.widget
-        if self.prev_file == wid_file.file_loc: return
-        self.prev_file = wid_file.file_loc
+        if not event is None and not event.source is wid_file: return
         tags = [x for x in wid_file.buttons.values()]
         tags += [x for x in wid_file.graphics.values()]
-        for x in tags: x.__del__()
+        for x in tags: x.destroy()
         files = glob(os.path.join(wid_file.file_loc,'**'))
         if not files: return
         button_size = [wid_file.size[0], 40]
@@ -405,17 +419,16 @@ class FileShower(Actor):
             button = create_file_button(file, loc, wid_file)
             
 class FileShower2(Actor):
+    event_handlers = {'case_files_changed' : 'show_case_files'}
     
-    def logic(self):
-        if not self.widget.files_changed: return
-        self.widget.files_changed = False
-        button_keys = [key for key in self.widget.buttons]
+    def show_case_files(self, event):
+        if not event.source is self.widget: return
         temp = set(self.widget.case_files)
         if temp == self.prev_files: return
         self.prev_files = temp
         tags = [x for x in self.widget.buttons.values()]
         tags += [x for x in self.widget.graphics.values()]
-        for x in tags: x.__del__()
+        for x in tags: x.destroy()
         if not self.widget.case_files: return
         button_size = [100, 25]
         locs = centered_buttons_locs_vert(button_size, len(self.widget.case_files), 
@@ -429,12 +442,12 @@ class FileShower2(Actor):
             button = create_file_button2(file, loc, self.widget)
             
 class ResultsShower(Actor):
+    event_handlers = {'new_results' : 'show_results'}
     
-    def logic(self):
-        if not self.widget.new_results: return
-        self.widget.new_results = False
+    def show_results(self, event):
+        if not event.source is self.widget: return
         tags = [x for x in self.widget.buttons.values()]
-        for x in tags: x.__del__()
+        for x in tags: x.destroy()
         if not self.widget.results: return
         search_bar = self.game.get_component('textbox_search_bar')
         txt = search_bar.text
@@ -474,14 +487,14 @@ class AddToCase(LeftSideText):
         wid = self.layer.get_component('widget_case_files')
         wid.case_files.append(ref_button.file)
         wid.case_files = sorted(set(wid.case_files))
-        wid.files_changed = True
+        self.game.events.publish('case_files_changed', source = wid)
         
 class FolderButton(LeftSideText):
     
     def run_pressed(self):
         if self.double_click():
             if os.path.isdir(self.file):
-                self.widget.file_loc = self.file
+                change_file_loc(self.widget, self.file)
                 self.browse_tb.text = self.file
         
         create_add_to_case_button(self)
@@ -500,13 +513,15 @@ class RemoveCase(SquareButton):
     def run_pressed(self):
         wid = self.layer.get_component('widget_case_files')
         b_keys = [x for x in wid.buttons]
+        removed = False
         for button_key in b_keys:
             button = wid.buttons[button_key]
             if button.is_selected:
                 wid.case_files.remove(button.file)
-                button.__del__()
-                if not wid.files_changed:
-                    wid.files_changed = True
+                button.destroy()
+                removed = True
+        if removed:
+            self.game.events.publish('case_files_changed', source = wid)
 
 class SearchBar(Textbox):
     
@@ -531,14 +546,14 @@ class UpOneDir(SquareButton):
         path = self.wid_f.file_loc
         path = os.path.split(path)
         path = os.path.join(*path[:-1])
-        self.wid_f.file_loc = path
+        change_file_loc(self.wid_f, path)
         self.browse_tb.text = path
         
 class ChangeDir(Textbox):
 
     def on_enter(self):
         if os.path.isdir(self.text):
-            self.wid_f.file_loc = self.text
+            change_file_loc(self.wid_f, self.text)
             self.invalid_path = False
         else:
             self.invalid_path = True
@@ -561,7 +576,7 @@ class ChangeDir(Textbox):
             self.widget.add_graphic(g)
         elif g_id in self.widget.graphics:
             g = self.widget.graphics[g_id]
-            g.__del__()
+            g.destroy()
  
 
 
@@ -573,8 +588,7 @@ def setup_search_results(gui):
     results_widget = make_widget_dict(size, position, color, 
                                   actors = actors)
     results_widget['id'] = 'widget_case_results'
-    results_widget['other'] = {'new_results' : True,
-                               'results' : [],
+    results_widget['other'] = {'results' : [],
                                'scroll_bar' : 'actor_results_scroll_bar',
                                'orig_size' : size}
     
@@ -669,8 +683,7 @@ def setup_document_menu(gui):
                                        buttons = buttons,
                                        actors = actors)
     document_widget['class'] = SizeChanger
-    document_widget['other'] = {'new_results' : True,
-                               'results' : [],
+    document_widget['other'] = {'results' : [],
                                'scroll_bar' : 'actor_results_scroll_bar',
                                'orig_size' : size}
     position = [size[0] + position[0] + 10, position[1]]
@@ -768,7 +781,6 @@ def setup_main_menu(gui):
     file_browse.id = 'textbox_dir_browse'
     case_button_widget['textboxs'] = [file_browse]
     fshower = FileShower([0,0],[0,0])
-    fshower.prev_file = ''
     file_explorer_widget = make_widget_dict(size, position, color, 
                                   actors = [fshower])
     file_explorer_widget['id'] = 'widget_files'
@@ -800,7 +812,6 @@ def setup_main_menu(gui):
                                   actors = [fshower2])
     case_explorer_widget['id'] = 'widget_case_files'
     case_explorer_widget['other'] = {'case_files' : [],
-                                     'files_changed' : False,
                                      'scroll_bar' : 'actor_case_scroll_bar',
                                      'orig_size' : size}
     case_explorer_widget['class'] = SizeChanger
@@ -848,6 +859,7 @@ def setup_loading_screen(gui):
     thread = LoadThread()
     thread.value = None
     thread.files = []
+    thread.events = gui.events
     print("thread starting")
     thread.start()
             
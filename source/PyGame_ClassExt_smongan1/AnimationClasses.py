@@ -44,6 +44,7 @@ from glob import glob
 from PyGame_ClassExt_smongan1.BaseClasses import *
 from PyGame_ClassExt_smongan1.utilities import *
 from math import atan2
+from collections import OrderedDict
 import pygame as pg
 import copy
 import numpy as np
@@ -78,6 +79,8 @@ class AnimatedActor(Actor):
         Rotate the animations of the actor based on a given direction or tags.
     - update_effects(self):
         Update the effects associated with the animated actor.
+    - reset_state(self):
+        Reset the actor and its animations so a pooled actor can be reused.
     - draw_shadow(self):
         Draw the shadow of the animated actor based on its animation frames.
     
@@ -106,6 +109,20 @@ class AnimatedActor(Actor):
     animated_actor.draw()
     animated_actor.draw_shadow()
     """
+    __slots__ = ('animations', 'asset_folders', 'effects', 'effects_cnt', 'default_none_animation',
+                 'animation', 'prev_animation', 'first_animation', 'sheer_amt')
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.animations = None
+        self.asset_folders = []
+        self.effects = dict()
+        self.effects_cnt = 0
+        self.default_none_animation = 'DEFAULT_NONE_ANIMATION'
+        self.animation = None
+        self.prev_animation = None
+        self.first_animation = None
+        self.sheer_amt = None
     
     def AddAnimation(self, asset_folder, scale = 1, path = None,
                      colorkey = None, frame_wait = None):
@@ -131,12 +148,9 @@ class AnimatedActor(Actor):
         self.default_none_animation = 'DEFAULT_NONE_ANIMATION'
         self.animation = animation_name
         self.prev_animation = self.animation
+        self.first_animation = self.animation
         
     def AddEffect(self, effect, effect_name = None):
-        if not hasattr(self, 'effects'):
-            self.effects = dict()
-            self.effects_cnt = 0
-            
         if effect_name is None:
             effect_name = "effect_" + str(self.effects_cnt)
             self.effects_cnt += 1
@@ -150,12 +164,13 @@ class AnimatedActor(Actor):
         if self.animation == self.default_none_animation:
             return None
         if not self.animation is None and self.animation in self.animations:
-            self.surf = None
-            for animation_frame in self.animations[self.animation]:
-                if self.surf is None:
-                    self.surf = next(animation_frame)
-                else:
-                    self.surf.blit(next(animation_frame), [0,0])
+            frames = [next(animation_frame) for animation_frame in self.animations[self.animation]]
+            self.surf = frames[0]
+            if len(frames) > 1:
+                # frames are shared between actors through the frame cache, blit onto a copy
+                self.surf = self.surf.copy()
+                for frame in frames[1:]:
+                    self.surf.blit(frame, [0,0])
             size = np.array(self.surf.get_size())
             if not size is self.size:
                 
@@ -178,14 +193,22 @@ class AnimatedActor(Actor):
                         animation.rotate_to_direction(direction)
     
     def update_effects(self):
-        if not hasattr(self, 'effects'):
-            return None
         for effect in self.effects:
             next(self.effects[effect])
     
+    def reset_state(self):
+        super().reset_state()
+        if self.animations is None:
+            return None
+        for animations in self.animations.values():
+            for animation in animations:
+                animation.reset()
+        self.animation = self.prev_animation = self.first_animation
+    
     def draw_shadow(self):
         if self.animation is None:
             return None
+        shadow_rect = None
         for animation in self.animations[self.prev_animation]:
             if (not self.widget.sheer_amt is None and 
                 self.sheer_amt != self.widget.sheer_amt):
@@ -193,7 +216,7 @@ class AnimatedActor(Actor):
                 animation.redraw_shadows()
             shadow_size = (animation.shadow_size *
                                               self.widget.shadow_stretch)
-            if not hasattr(self, 'shadow_size'):
+            if self.shadow_size is None:
                 self.shadow_size = shadow_size
                 self.shadow = pg.transform.scale(animation.shadow,
                                                   shadow_size)
@@ -206,9 +229,11 @@ class AnimatedActor(Actor):
                 self.shadow = pg.transform.scale(animation.shadow,
                                                   self.shadow_size)
                 self.shadow_offset = self.size - shadow_size
-            self.widget.surf.blit(self.shadow, self.position +
-                                               self.blit_offset + 
-                                               self.shadow_offset)
+            rect = self.widget.surf.blit(self.shadow, self.draw_position() + 
+                                                      self.shadow_offset)
+            if shadow_rect is None: shadow_rect = rect
+            else: shadow_rect.union_ip(rect)
+        return shadow_rect
         
 class Animation():
     """
@@ -226,6 +251,10 @@ class Animation():
     - prev_target (numpy.array or None): The previous target position of the actor.
     - direction (numpy.array): The direction vector for frame rotation.
     - spec (dict): A dictionary storing animation specifications.
+    - frame_cache (collections.OrderedDict): Class level cache of the decoded frames, shadows and specifications,
+      keyed by the animation folder, scale, size and colorkey, so each folder is read from disk once.
+      Least recently used first.
+    - max_cached_animations (int): Number of entries kept in frame_cache before the least recently used is dropped.
     
     Methods:
     - __next__(self): Get the next animation frame based on time elapsed and frame specifications.
@@ -234,6 +263,9 @@ class Animation():
     - add_spec(self, spec_file): Add animation specifications from a file.
     - kill_after_last_frame_check(self): Check if the animation should end and trigger actor death.
     - redraw_shadows(self): Redraw shadow frames based on the actor's sheer amount.
+    - load_frames(self, animation_dir, scale, size, colorkey=None): Read the specifications, frames and shadows of a folder from disk.
+    - reset(self): Restore the unrotated frames and rewind to the first frame.
+    - clear_frame_cache(cls): Drop every cached folder, called when the game shuts down.
     
     Usage Example:
     ```python
@@ -253,6 +285,8 @@ class Animation():
     # Redraw shadow frames with updated sheer amount
     animation.redraw_shadows()
     """
+    frame_cache = OrderedDict()
+    max_cached_animations = 128
     
     def __init__(self, animation_dir, scale, size, colorkey = None):
         identifiers = animation_dir.replace('\\', '/').split('_')
@@ -266,6 +300,22 @@ class Animation():
         self.direction = [0,0]
         self.spec = {'time_per_frame' : 1/20,
                      'repeat' : True}
+        cache_key = (animation_dir, str(scale), str(np.array(size).tolist()), str(colorkey))
+        frame_cache = Animation.frame_cache
+        if cache_key in frame_cache:
+            frame_cache.move_to_end(cache_key)
+        else:
+            frame_cache[cache_key] = self.load_frames(animation_dir, scale, size, colorkey)
+            # every scale and size gets its own entry, so the cache is bounded
+            while len(frame_cache) > Animation.max_cached_animations:
+                frame_cache.popitem(last = False)
+        spec, frames, shadow_frames = frame_cache[cache_key]
+        self.spec.update(spec)
+        self.base_frames = frames
+        self.base_shadow_frames = shadow_frames
+        self.reset()
+        
+    def load_frames(self, animation_dir, scale, size, colorkey = None):
         files_in_folder = glob(animation_dir + '/' + '**')
         for animation_frame_fname in files_in_folder:
             if animation_frame_fname.endswith('dat'):
@@ -279,15 +329,26 @@ class Animation():
             if 'colorkey' in self.spec:
                 colorkey = self.spec['colorkey']
             
-        self.animation_frames = [
-                load_image(animation_frame_fname, '', scale = scale, 
-                           size = size, colorkey = colorkey)[0]
-                for animation_frame_fname in files_in_folder
-                if not animation_frame_fname.endswith('dat')]
-        self.shadow_frames = [make_shadow(x) for x in self.animation_frames]
+        frames = tuple(load_image(animation_frame_fname, '', scale = scale, 
+                                  size = size, colorkey = colorkey)[0]
+                       for animation_frame_fname in files_in_folder
+                       if not animation_frame_fname.endswith('dat'))
+        return dict(self.spec), frames, tuple(make_shadow(x) for x in frames)
+    
+    @classmethod
+    def clear_frame_cache(cls):
+        Animation.frame_cache.clear()
+    
+    def reset(self):
+        self.animation_frames = list(self.base_frames)
+        self.shadow_frames = list(self.base_shadow_frames)
         self.shadow = self.shadow_frames[0]
         self.shadow_sizes = [x.get_size() for x in self.shadow_frames]
         self.shadow_size = self.shadow_sizes[0]
+        self.animation_index = 0
+        self.wait_time = 0
+        self.prev_target = None
+        self.direction = [0,0]
         
     def __next__(self):
         if (self.spec['time_per_frame'] is None) or (self.wait_time >= 
@@ -387,11 +448,11 @@ class HoverWidget(Widget):
     - update_buttons(self): Update button components within the widget.
     - update_textboxs(self): Update textbox components within the widget.
     - update_graphics(self): Update graphic components within the widget.
-    - get_component(self, component_id): Get a component by its ID.
+    - get_component(self, component_id): Get a component in the widget by its ID or registry handle.
     - get_all_components(self): Get a list of all components in the widget.
     - get_component_dict(self): Get a dictionary of components categorized by type.
     - get_all_ids(self): Get a list of all component IDs in the widget.
-    - remove_component(self, component_id): Remove a component from the widget.
+    - remove_component(self, component_id): Remove a component from the widget, its layer and the game.
     - get_cursor_loc(self): Get the cursor location relative to the widget.
     - move_component(self, component_id, new_widget_id): Move a component to another widget.
     - return_ids(self): Restore component IDs and references.
@@ -439,6 +500,8 @@ class DisplacementEffects():
     - shake(self, cnt): Apply a shaking effect based on the counter value.
     - hover(self, cnt): Apply a hovering effect based on the counter value.
     """
+    __slots__ = ('effects', 'effect_count', 'speed', 'magnitude', 'direction', 'actor',
+                 'shake_dir', 'hover_dir')
     def __init__(self, effect_types, speed, magnitude, direction = None):
         if isinstance(effect_types, str):
             effect_types = [effect_types]
@@ -446,6 +509,9 @@ class DisplacementEffects():
         self.effect_count = [0 for x in self.effects]
         self.speed = speed
         self.magnitude = magnitude
+        self.actor = None
+        self.shake_dir = 1
+        self.hover_dir = 1
         if direction == None:
             self.direction = np.array([1, 0])
         else:
@@ -459,8 +525,6 @@ class DisplacementEffects():
         self.actor.blit_offset += offsets
         
     def shake(self, cnt):
-        if not hasattr(self, 'shake_dir'):
-            self.shake_dir = 1
         displace_mag = self.speed * cnt
         if abs(displace_mag) >= self.magnitude:
             displace_mag = self.magnitude * self.shake_dir
@@ -471,8 +535,6 @@ class DisplacementEffects():
         return out * displace_mag, cnt
     
     def hover(self, cnt):
-        if not hasattr(self, 'hover_dir'):
-            self.hover_dir = 1
         displace_mag = self.speed * cnt/10
         if abs(displace_mag) >= self.magnitude*0.1:
             displace_mag = self.magnitude*0.1 * self.hover_dir
@@ -43,7 +43,9 @@ features to add:
     4. add subwidgets?
     5. improve alpha layer handling throughout (especiallly in graphics)
     6. create multiprocess blitting (make blitting tree data structure)
-    7. blit only on changes? (may not be possible and maintain speed)
+    7. blit only on changes? (may not be possible and maintain speed) EDIT: widgets and 
+        layers keep their composited surfaces and only recomposite the regions components
+        changed
     8. add percentile scalling for all objects (
         i.e. actor.size = [0-1, 0-1] where elements of the size are 
         proportions of widget/layer/screen
@@ -55,17 +57,28 @@ features to add:
 
 
 from PyGame_ClassExt_smongan1.utilities import is_same_vec, timer, center_rects, make_subset_surf
+from PyGame_ClassExt_smongan1.utilities import FramePacer, merge_rects, copy_area
 from PyGame_ClassExt_smongan1.utilities import make_fancy_rect_border, deep_finder
 from PyGame_ClassExt_smongan1.utilities import convert_surfs_to_str, convert_str_to_surfs
 from PyGame_ClassExt_smongan1.utilities import convert_fonts_to_str, convert_str_to_fonts
-from PyGame_ClassExt_smongan1.utilities import load_image, point_in_obj, run_updates
+from PyGame_ClassExt_smongan1.utilities import load_image, point_in_obj, run_updates, Updatable
+from PyGame_ClassExt_smongan1.utilities import weak_parent, vec_key
 from PyGame_ClassExt_smongan1.utilities import make_shadow, split_text_into_lines
+from PyGame_ClassExt_smongan1.Profiling import FrameProfiler, FrameStatistics
+from PyGame_ClassExt_smongan1.InputClasses import InputState
+from PyGame_ClassExt_smongan1.Registry import ComponentRegistry
+from PyGame_ClassExt_smongan1.Events import EventBus
+from PyGame_ClassExt_smongan1.Scheduling import Scheduler, Sleepable
+from PyGame_ClassExt_smongan1.TextCache import render_text
 import numpy as np
 import pygame as pg
 from copy import copy
 import joblib
 from collections import OrderedDict
 import os
+import random
+import queue
+import threading
     
 class GameHandler():
     """
@@ -77,6 +90,17 @@ class GameHandler():
     - scale (float or tuple, optional): Scaling factor for the game window. Default is None.
     - resolution (tuple, optional): Desired resolution for the game window. Default is None.
     - path (str, optional): The path to the game's resources. Default is None.
+    - vsync (bool, optional): Synchronise presentation to the display refresh. Default is False.
+    - fixed_timestep (bool, optional): Step the simulation in fixed increments of 1/framerate, catching up after slow frames. Default is False.
+    - max_updates_per_frame (int, optional): Most catch-up updates run in one frame before excess time is dropped. Default is 5.
+    - dirty_rect_updates (bool, optional): Present only the screen regions components report as changed. Default is False.
+    - full_update_ratio (float, optional): Fraction of the screen above which changed regions are presented with a full flip. Default is 0.5.
+    - headless (bool, optional): Run on the SDL dummy video driver without presenting frames. Default is False.
+    - profile (bool, optional): Enable the per-phase frame profiler. Default is False.
+    - stats_capacity (int, optional): Number of recent frames kept by the rolling frame statistics. Default is 3600.
+    - stats_path (str, optional): JSONL file the frame statistics summary is appended to. Default is None.
+    - stats_interval (int, optional): Number of frames between frame statistics dumps to stats_path. Default is 600.
+    - threaded_present (bool, optional): Scale and present the finished frame on a worker thread while the next frame updates, drawing into two alternating back buffers. Some platforms (e.g. macOS) only allow display calls from the main thread. Default is False.
 
     Attributes:
     - path (str): The path to the game's resources.
@@ -84,75 +108,389 @@ class GameHandler():
     - sleep (function): A reference to the sleep function.
     - game (object): The instance of the game class being managed.
     - screen (pygame.Surface): The drawing surface for the game.
-    - times (list): A list to store frame time measurements.
+    - times (numpy.ndarray): The frame times held in the rolling frame statistics window.
+    - stats (FrameStatistics): Rolling frame, update and draw time statistics.
+    - update_time (float): Time spent updating the game in the last frame.
+    - draw_time (float): Time spent drawing the game in the last frame.
+    - threaded_present (bool): Flag indicating whether frames are presented on a worker thread.
+    - back_buffer (pygame.Surface or None): The buffer not currently being drawn into when presenting on a worker thread.
+    - present_queue (queue.Queue or None): Hands finished frames to the present thread, holding at most one.
+    - present_thread (threading.Thread or None): The worker thread presenting frames while the game runs.
     - cursor_loc (numpy.ndarray or None): The current cursor location on the screen.
     - screen_display (pygame.Surface): The display surface for rendering the game.
     - framerate (int): The target frames per second for the game loop.
+    - vsync (bool): Flag indicating whether the display was opened with vsync.
+    - pacer (FramePacer): The pacing engine holding the loop to the framerate.
+    - scaled_screen (pygame.Surface or None): Preallocated destination for the scaled screen.
+    - integer_scale (bool): Flag indicating whether the output scale is a whole number.
+    - dirty_rects (list or None): Screen regions changed since the last presentation, None means the whole screen.
+    - dirty_rect_updates (bool): Flag indicating whether changed regions are presented with pg.display.update.
+    - full_update_ratio (float): Changed screen fraction above which a full flip is used.
     - needs_draw (bool): Flag indicating whether a redraw is required.
+    - fixed_timestep (bool): Flag indicating whether the simulation uses a fixed update step.
+    - max_updates_per_frame (int): Spiral-of-death guard for catch-up updates.
+    - accumulator (float): Simulation time owed to the fixed update step.
+    - dropped_time (float): Simulation time discarded by the spiral-of-death guard.
+    - headless (bool): Flag indicating whether the handler runs without a real display.
+    - started (bool): Flag indicating whether the game has been set up.
+    - profiler (FrameProfiler): Per-phase frame profiler, records nothing unless enabled.
     - to_update_attrs (dict): A dictionary of attributes to be updated.
 
     Methods:
+    - start(): Initialises pygame and sets up the game, once.
     - run(): Main game loop that handles event processing, updates, and rendering.
-    - chkFrameTime(): Ensures a consistent frame rate by adjusting frame timing.
+    - run_frames(n_frames, dt=None, seed=None, force_draw=False): Runs exactly n_frames with a fixed dt, unpaced, and returns a timing and state summary, redrawing every component each frame when force_draw is set.
+    - get_state_summary(): Get a summary of the game's current layer and component counts.
+    - update_game(): Runs the game updates for one frame and returns the interpolation alpha.
+    - mark_dirty(rect): Records a changed region of the game screen for the next presentation.
+    - mark_all_dirty(): Makes the next presentation cover the whole screen.
+    - get_present_rects(): Merges the changed regions, returning None when a full flip is cheaper.
+    - present(): Scales the drawn frame onto the display and presents it, or hands it to the present thread.
+    - present_frame(screen, rects=None): Scales the given frame onto the display and presents it.
+    - swap_buffers(): Swaps the game screen with the back buffer.
+    - start_present_thread(): Starts the worker thread presenting frames.
+    - present_worker(): Presents the frames handed over by present until stopped.
+    - wait_present(): Blocks until the present thread has finished the frame it was handed.
+    - stop_present_thread(): Stops the worker thread presenting frames.
+    - setup_scaler(): Allocates the surfaces used to scale the game screen onto the display.
+    - scale_screen(rects=None, screen=None): Scales the game screen, or only the given regions of it, onto the display.
+    - scale_rect(rect): Converts a game screen rectangle to the matching scaled rectangle.
+    - chkFrameTime(): Ensures a consistent frame rate by adjusting frame timing and records the frame statistics.
     - Resize(scale_width, height=None): Resizes the game window based on the scaling factor.
     - setup_screen(resolution, scale): Configures the game window's initial settings.
+    - set_display_mode(): Opens the display window, with vsync when requested.
     """
     
     def __init__(self, MyGame, framerate = 60, scale = None, 
-                 resolution = None, path = None):
-        from time import sleep, time
+                 resolution = None, path = None, vsync = False,
+                 fixed_timestep = False, max_updates_per_frame = 5,
+                 dirty_rect_updates = False, full_update_ratio = 0.5,
+                 headless = False, profile = False, stats_capacity = 3600,
+                 stats_path = None, stats_interval = 600, 
+                 threaded_present = False):
+        from time import sleep, perf_counter
         MyGame.handler = self
+        self.headless = headless
+        if headless:
+            os.environ['SDL_VIDEODRIVER'] = 'dummy'
+            if pg.display.get_init() and pg.display.get_driver() != 'dummy':
+                pg.display.quit()
+            pg.display.init()
         if path is None:
             path = os.getcwd()
         self.path = path
-        self.time = time
+        self.time = perf_counter
         self.sleep = sleep
         self.game = MyGame
         self.screen = pg.Surface([MyGame.width, MyGame.height])
-        self.times = []
         self.setup_screen(resolution, scale)
         self.cursor_loc = None
-        self.screen_display = pg.display.set_mode(self.screen_size)
+        self.vsync = vsync
+        self.screen_display = self.set_display_mode()
+        self.dirty_rects = None
+        self.dirty_rect_updates = dirty_rect_updates
+        self.full_update_ratio = full_update_ratio
+        self.setup_scaler()
         self.game.framerate = framerate
-        self.framerate = framerate + 10
+        self.framerate = framerate
+        self.pacer = FramePacer(framerate, vsync = self.vsync)
+        self.stats = FrameStatistics(stats_capacity, budget = 1/framerate, 
+                                     dump_path = stats_path, dump_interval = stats_interval)
+        self.update_time = 0
+        self.draw_time = 0
+        self.threaded_present = threaded_present
+        self.back_buffer = None
+        self.present_queue = None
+        self.present_thread = None
+        if threaded_present:
+            self.back_buffer = pg.Surface(self.screen.get_size(), 0, self.screen)
+            self.present_queue = queue.Queue(maxsize = 1)
         self.needs_draw = True
         self.game.dt = 1/framerate
+        self.fixed_timestep = fixed_timestep
+        self.max_updates_per_frame = max_updates_per_frame
+        self.accumulator = 0
+        self.dropped_time = 0
+        self.started = False
+        self.profiler = FrameProfiler(enabled = profile)
         self.to_update_attrs = dict()
         
-    def run(self):
+    def start(self):
+        if self.started:
+            return None
         pg.init()
-        self.timer = timer()
         self.game.setup()
-        pg.display.flip()
+        if not self.headless:
+            pg.display.flip()
+        self.started = True
+        
+    def run(self):
+        self.start()
+        if self.threaded_present:
+            self.start_present_thread()
+        self.pacer.restart()
         self.lastFrameTime = self.time()
+        self.accumulator = self.game.dt
+        profiler = self.profiler
         running = True
         while running:
-            self.timer.restart()
+            profiler.begin_frame()
             # Did the user click the window close button?
-            for event in pg.event.get():
-                if event.type == pg.QUIT or not self.game.is_running:
-                    running = False
+            with profiler.section('events'):
+                for event in pg.event.get():
+                    if event.type == pg.QUIT or not self.game.is_running:
+                        running = False
+                    self.game.input.process_event(event)
             self.cursor_loc = np.array(pg.mouse.get_pos())
             if self.needs_draw:
-                trans_size = self.scale * self.game.size
-                if self.scale != 1:
-                    self.screen_display.blit(pg.transform.smoothscale(self.screen, 
-                                                            trans_size), 
-                                                             self.padding)
-                else:
-                    self.screen_display.blit(self.screen, [0,0])
-                pg.display.flip()
+                self.present()
                 self.needs_draw = False
-            self.game.update()
+            update_start = self.time()
+            alpha = self.update_game()
+            update_end = self.time()
+            if self.fixed_timestep and alpha != self.game.alpha:
+                # frames running no update still have to draw the moving actors at the new alpha
+                if self.game.mark_interpolating_dirty():
+                    self.needs_draw = True
             if self.needs_draw:
-                self.game.draw()
+                with profiler.section('Game.draw'):
+                    self.game.draw(alpha)
+            self.update_time = update_end - update_start
+            self.draw_time = self.time() - update_end
+            profiler.end_frame()
             self.chkFrameTime()
+        self.stop_present_thread()
+        self.game.teardown()
+    
+    def run_frames(self, n_frames, dt = None, seed = None, force_draw = False):
+        if not seed is None:
+            random.seed(seed)
+            np.random.seed(seed)
+        self.start()
+        if not dt is None:
+            self.game.dt = dt
+        update_times = np.zeros(n_frames)
+        draw_times = np.zeros(n_frames)
+        profiler = self.profiler
+        start_time = self.time()
+        frames = 0
+        draws = 0
+        for frame in range(n_frames):
+            if not self.game.is_running:
+                break
+            profiler.begin_frame()
+            with profiler.section('events'):
+                for event in pg.event.get():
+                    if event.type == pg.QUIT:
+                        self.game.is_running = False
+                    self.game.input.process_event(event)
+            self.cursor_loc = np.array(pg.mouse.get_pos())
+            frame_start = self.time()
+            self.game.update()
+            update_end = self.time()
+            if force_draw:
+                # every widget recomposes all of its components, so draw timings cover them
+                layer = self.game.layers[self.game.current_layer]
+                layer.mark_dirty()
+                for widget in layer.widgets.values():
+                    widget.mark_dirty()
+                self.needs_draw = True
+            if self.needs_draw:
+                with profiler.section('Game.draw'):
+                    self.game.draw()
+                if not self.headless:
+                    self.present()
+                self.needs_draw = False
+                draws += 1
+            update_times[frame] = update_end - frame_start
+            draw_times[frame] = self.time() - update_end
+            self.stats.add(self.time() - frame_start, update_times[frame], draw_times[frame])
+            profiler.end_frame()
+            frames += 1
+        wall_time = self.time() - start_time
+        update_times = update_times[:frames]
+        draw_times = draw_times[:frames]
+        summary = {'frames' : frames,
+                   'draws' : draws,
+                   'dt' : self.game.dt,
+                   'simulated_time' : frames * self.game.dt,
+                   'wall_time' : wall_time,
+                   'fps' : frames/wall_time if wall_time > 0 else 0}
+        for name, times in [['update', update_times], ['draw', draw_times]]:
+            summary[name] = {'total' : float(times.sum()),
+                             'mean' : float(times.mean()) if frames else 0,
+                             'max' : float(times.max()) if frames else 0}
+        summary['state'] = self.get_state_summary()
+        return summary
+    
+    def get_state_summary(self):
+        return {'current_layer' : getattr(self.game, 'current_layer', None),
+                'is_running' : self.game.is_running,
+                'components' : {comp_type : len(comps) for comp_type, comps in 
+                                self.game.get_component_dict().items()}}
+    
+    def update_game(self):
+        if not self.fixed_timestep:
+            self.game.update()
+            return 1
+        dt = self.game.dt
+        self.accumulator += self.pacer.last_frame_time
+        updates = 0
+        while self.accumulator >= dt and updates < self.max_updates_per_frame:
+            self.game.update()
+            self.accumulator -= dt
+            updates += 1
+        if self.accumulator >= dt:
+            # spiral-of-death guard, slow the simulation rather than fall further behind
+            self.dropped_time += self.accumulator - self.accumulator % dt
+            self.accumulator = self.accumulator % dt
+        return self.accumulator/dt
+    
+    def present(self):
+        rects = self.get_present_rects()
+        if self.dirty_rect_updates: self.dirty_rects = []
+        else: self.dirty_rects = None
+        if self.present_thread is None:
+            self.present_frame(self.screen, rects)
+            return None
+        # only one frame is ever in flight, so the buffer drawn into next is never
+        # the one the present thread is reading
+        self.wait_present()
+        self.present_queue.put((self.screen, rects))
+        self.swap_buffers()
+    
+    def present_frame(self, screen, rects = None):
+        with self.profiler.section('scale'):
+            display_rects = self.scale_screen(rects, screen)
+        with self.profiler.section('present'):
+            if rects is None:
+                pg.display.flip()
+            else:
+                pg.display.update(display_rects)
+    
+    def swap_buffers(self):
+        self.screen, self.back_buffer = self.back_buffer, self.screen
+        self.game.screen = self.screen
+    
+    def start_present_thread(self):
+        if not self.present_thread is None:
+            return None
+        self.present_thread = threading.Thread(target = self.present_worker, daemon = True)
+        self.present_thread.start()
+    
+    def present_worker(self):
+        while True:
+            frame = self.present_queue.get()
+            try:
+                if frame is None:
+                    return None
+                self.present_frame(*frame)
+            finally:
+                self.present_queue.task_done()
+    
+    def wait_present(self):
+        if not self.present_thread is None:
+            self.present_queue.join()
+    
+    def stop_present_thread(self):
+        if self.present_thread is None:
+            return None
+        self.wait_present()
+        self.present_queue.put(None)
+        self.present_thread.join()
+        self.present_thread = None
+    
+    def mark_dirty(self, rect):
+        if self.dirty_rects is not None:
+            self.dirty_rects.append(pg.Rect(rect))
+            
+    def mark_all_dirty(self):
+        self.dirty_rects = None
+    
+    def get_present_rects(self):
+        if self.dirty_rects is None:
+            return None
+        screen_rect = self.screen.get_rect()
+        rects = merge_rects([rect.clip(screen_rect) for rect in self.dirty_rects])
+        area = sum(rect.width * rect.height for rect in rects)
+        if area > self.full_update_ratio * screen_rect.width * screen_rect.height:
+            return None
+        return rects
+    
+    def setup_scaler(self):
+        self.scale_xy = np.ones(2) * self.scale
+        self.padding_xy = [int(x) for x in self.padding]
+        self.scaled_size = [int(round(x)) for x in self.scale_xy * self.game.size]
+        self.integer_scale = all(float(x).is_integer() for x in self.scale_xy)
+        self.scaled_screen = None
+        self.scales_in_place = False
+        if all(x == 1 for x in self.scale_xy):
+            return None
+        target = pg.Rect(self.padding_xy, self.scaled_size)
+        display = self.screen_display
+        if (display.get_bitsize() == self.screen.get_bitsize() and
+            display.get_masks() == self.screen.get_masks() and
+            display.get_rect().contains(target)):
+            # scale straight into the window, skipping an extra full size blit
+            self.scaled_screen = display.subsurface(target)
+            self.scales_in_place = True
+        else:
+            self.scaled_screen = pg.Surface(self.scaled_size, 0, self.screen)
+            
+    def scale_screen(self, rects = None, screen = None):
+        if screen is None:
+            screen = self.screen
+        if self.scaled_screen is None:
+            if rects is None:
+                self.screen_display.blit(screen, self.padding_xy)
+                return [pg.Rect(self.padding_xy, screen.get_size())]
+            for rect in rects:
+                self.screen_display.blit(screen, rect.move(self.padding_xy), rect)
+            return [rect.move(self.padding_xy) for rect in rects]
+        if not self.integer_scale:
+            # smoothscale of a sub region does not line up with smoothscale of the
+            # whole screen, so fractional scales always rescale the full frame
+            pg.transform.smoothscale(screen, self.scaled_size, self.scaled_screen)
+            if rects is None:
+                scaled_rects = [self.scaled_screen.get_rect()]
+            else:
+                # filtering bleeds changes into the neighbouring output pixels
+                scaled_rects = [self.scale_rect(rect.inflate(2, 2)) for rect in rects]
+        elif rects is None:
+            # nearest neighbour is exact for whole number scales and far cheaper
+            pg.transform.scale(screen, self.scaled_size, self.scaled_screen)
+            scaled_rects = [self.scaled_screen.get_rect()]
+        else:
+            screen_rect = screen.get_rect()
+            scaled_rects = []
+            for rect in rects:
+                rect = rect.clip(screen_rect)
+                if rect.width == 0 or rect.height == 0: continue
+                scaled_rect = self.scale_rect(rect)
+                pg.transform.scale(screen.subsurface(rect), scaled_rect.size,
+                                   self.scaled_screen.subsurface(scaled_rect))
+                scaled_rects.append(scaled_rect)
+        display_rects = [rect.move(self.padding_xy) for rect in scaled_rects]
+        if not self.scales_in_place:
+            for rect, display_rect in zip(scaled_rects, display_rects):
+                self.screen_display.blit(self.scaled_screen, display_rect, rect)
+        return display_rects
+    
+    def scale_rect(self, rect):
+        left = int(rect.left * self.scale_xy[0])
+        top = int(rect.top * self.scale_xy[1])
+        scaled_rect = pg.Rect(left, top,
+                              int(np.ceil(rect.right * self.scale_xy[0])) - left,
+                              int(np.ceil(rect.bottom * self.scale_xy[1])) - top)
+        return scaled_rect.clip(self.scaled_screen.get_rect())
             
     def chkFrameTime(self):
-        while self.timer.getTime() < 1/self.framerate:
-            self.sleep(0.000001)
-        self.times.append(self.timer.getTime())
+        self.stats.add(self.pacer.wait(), self.update_time, self.draw_time)
         self.lastFrameTime = self.time()
+    
+    @property
+    def times(self):
+        return self.stats.get_values('frame')
         
     def Resize(self, scale_width, height = None):
         if height == None:
@@ -160,7 +498,20 @@ class GameHandler():
             self.scale *= scale
             #self.screen_size = [round(scale*x)//1 for x in self.screen_size]
             self.screen_size = scale*self.screen_size//1
-        pg.display.set_mode(self.screen_size)
+        self.wait_present()
+        self.screen_display = self.set_display_mode()
+        self.pacer.vsync = self.vsync
+        self.setup_scaler()
+        self.mark_all_dirty()
+    
+    def set_display_mode(self):
+        if self.vsync and not self.headless:
+            # pygame only honours vsync for SCALED or OPENGL displays
+            try:
+                return pg.display.set_mode(self.screen_size, pg.SCALED, vsync = 1)
+            except pg.error:
+                self.vsync = False
+        return pg.display.set_mode(self.screen_size)
     
     def setup_screen(self, resolution, scale):
         h = self.game.height
@@ -172,6 +523,7 @@ class GameHandler():
             else:
                 self.screen_size = np.array([w*scale[0], h*scale[1]])
                 self.scale = scale
+            self.padding = np.zeros(2)
         else:
             
             self.screen_size = np.array(resolution)
@@ -179,10 +531,13 @@ class GameHandler():
             self.padding = np.array([x//2 for x in [resolution[0] - self.scale*w, 
                             resolution[1] - self.scale*h]])
             
-class Game():
+class Game(Updatable):
     """
     Main application class for managing the game's state, logic, and components.
 
+    Every store below is created per instance, so several games can run side by side
+    in one process without sharing layers, components or ids.
+
     Attributes:
     - actors (dict): Dictionary to store actor objects.
     - textboxs (dict): Dictionary to store textbox objects.
@@ -190,13 +545,16 @@ class Game():
     - layers (dict): Dictionary to store layer objects.
     - widgets (dict): Dictionary to store widget objects.
     - graphics (dict): Dictionary to store graphic objects.
-    - actors_index (int): Index counter for actors.
-    - buttons_index (int): Index counter for buttons.
-    - textboxs_index (int): Index counter for textboxes.
-    - graphics_index (int): Index counter for graphics.
+    - registry (ComponentRegistry): Registry of every layer, widget and component, keeping the id dicts above in step.
+    - events (EventBus): Publish/subscribe event bus, queued events are delivered at the end of each update.
+    - scheduler (Scheduler): Game clock and timed wakes of the sleeping widgets and components.
     - is_running (bool): Flag indicating whether the game is running.
     - cursor_loc (list): List to store the current cursor location.
-    - mouse_pressed (bool): Flag indicating whether the mouse button is pressed.
+    - mouse_pressed (tuple): Held state of the left, middle and right mouse buttons.
+    - input (InputState): Event driven keyboard and mouse state, edges are cleared after each update.
+    - pressed_status (InputState): The input state, indexable by key constant like pg.key.get_pressed().
+    - held_index (set): Keys currently held down.
+    - prev_held (set): Keys that were held down at the previous update.
     - disable_PC_movement (bool): Flag to disable player character movement.
     - autosavename (str): Default name for autosave files.
     - autosaveindex (int): Index counter for autosave files.
@@ -204,18 +562,28 @@ class Game():
     - load_name (str): Name for the load file.
     - to_save (bool): Flag indicating whether a save operation is requested.
     - to_load (bool): Flag indicating whether a load operation is requested.
+    - alpha (float): Interpolation factor between the previous and current update used while drawing.
+    - deferring (bool): Flag indicating whether structural changes are queued, True while the game updates.
+    - deferred_ops (list): Queued (function, args) structural changes, applied in order at the end of the update.
 
     Methods:
     - __init__(self, width, height, save_layers, layer_funcs, always_draw, background_color,
              units_per_pixel, save_folder, enable_shadows, assets_folder): Initialize the Game instance.
     - setup(self): Setup the game's initial configuration and layers.
     - update(self): Update game state, input, and physics.
-    - draw(self): Draw the current game frame.
+    - draw(self, alpha): Draw the current game frame, interpolated alpha of the way between the last two updates.
+    - teardown(self): Release the process-wide caches filled by the game, once its loop has ended.
+    - mark_interpolating_dirty(self): Mark the current layer's awake actors drawn between two positions dirty, returning whether there were any.
     - update_PC(self): Update player character movement based on the current layer.
     - change_layer(self, layer_id): Change the current active layer.
     - add_layer(self, widget_dicts, **kwargs): Add a new layer with widgets to the game.
     - load_layer(self, layer, name): Load a layer into the game.
-    - get_component(self, component_id): Get a component by its ID.
+    - get_component(self, component_id): Get a component by its ID or registry handle.
+    - query(self, comp_type=None, cls=None, tags=None, prefix=None, **attrs): Get the game's components matching every criterion, using the registry indexes.
+    - remove_component(self, component_id): Remove a layer, widget or component, and anything it holds, from the game.
+    - detach_component(self, component): Unregister a component and anything it holds, right away.
+    - defer(self, func, *args): Run a structural change now, or queue it until the end of the update.
+    - flush_deferred(self): Apply the queued structural changes in order.
     - get_all_components(self): Get a list of all components in the game.
     - get_component_dict(self): Get a dictionary of all components categorized by type.
     - get_all_ids(self): Get a list of all component IDs in the game.
@@ -228,18 +596,7 @@ class Game():
     - physics_check(self): Placeholder method for physics checks.
     """
     
-    actors = dict()
-    textboxs = dict()
-    buttons = dict()
-    layers = dict()
-    widgets = dict()
-    graphics = dict()
-    actors_index = 0
-    buttons_index = 0
-    textboxs_index = 0
-    graphics_index = 0
     is_running = True
-    cursor_loc = []
     mouse_pressed = False
     
     disable_PC_movement = False
@@ -249,6 +606,8 @@ class Game():
     load_name = None
     to_save = False
     to_load = False
+    alpha = 1
+    deferring = False
     
     def __init__(self, 
                  width, 
@@ -261,6 +620,16 @@ class Game():
                  save_folder = 'Saves',
                  enable_shadows = True,
                  assets_folder = 'Assets'):
+        self.actors = dict()
+        self.textboxs = dict()
+        self.buttons = dict()
+        self.layers = dict()
+        self.widgets = dict()
+        self.graphics = dict()
+        self.registry = ComponentRegistry()
+        self.events = EventBus()
+        self.scheduler = Scheduler()
+        self.deferred_ops = []
         self.layer_funcs = layer_funcs
         self.width = width
         self.height = height
@@ -281,7 +650,10 @@ class Game():
         self.to_update_attrs = dict()
         self.enable_shadows = enable_shadows
         self.assets_folder = assets_folder
-        self.pressed_status = pg.key.get_pressed()
+        self.input = InputState()
+        self.pressed_status = self.input
+        self.held_index = self.input.held_keys
+        self.prev_held = set()
         self.ind_to_letter = { getattr(pg,'K_' + x) : x for x in 'abcdefghijklmnopqrstuvwxyz'}
         self.letter_to_ind =  { x : getattr(pg,'K_' + x) for x in 'abcdefghijklmnopqrstuvwxyz'}
         
@@ -294,25 +666,48 @@ class Game():
         self.current_layer = "Main_menu"
     
     def update(self):
-        self.mouse_pressed = pg.mouse.get_pressed()
-        self.cursor_loc = ((self.handler.cursor_loc - self.handler.padding) / 
-                           self.handler.scale)
-        self.prev_held = copy(self.held_index)
-        self.pressed_status = pg.key.get_pressed()
-        self.held_index = {tf for i, tf, in self.letter_to_ind.items() if self.pressed_status[tf]}
-        if self.to_save: self.save()
-        if self.to_load: self.load()
-        self.layers[self.current_layer].update()
-        run_updates(self)
-        self.physics_check()
+        profiler = self.handler.profiler
+        with profiler.section('Game.update'):
+            # timed wakes are applied before the active sets are iterated
+            self.scheduler.advance(self.dt)
+            # adds and removals made while iterating the stores are applied in one batch
+            self.deferring = True
+            self.mouse_pressed = self.input.get_mouse_pressed()
+            self.cursor_loc = ((self.handler.cursor_loc - self.handler.padding) / 
+                               self.handler.scale)
+            self.prev_held = self.input.get_prev_held()
+            if self.to_save: self.save()
+            if self.to_load: self.load()
+            self.layers[self.current_layer].update()
+            run_updates(self, profiler)
+            self.physics_check()
+            with profiler.section('Game.events'):
+                self.events.dispatch()
+            self.input.clear_edges()
+            self.deferring = False
+            self.flush_deferred()
     
-    def draw(self):
-        #Ideally this would return a blit_tree kind of class (run in parallel)
-        #The blit_tree would then be called by blit_tree.blit_onto(self.screen)
-        
-        self.screen.fill(self.background_color)
+    def draw(self, alpha = 1):
+        # the layer fills and redraws the screen only when one of its widgets changed
+        self.alpha = alpha
         self.layers[self.current_layer].draw()
     
+    def teardown(self):
+        # AnimationClasses imports this module, so it is only imported once the game has run
+        from PyGame_ClassExt_smongan1.AnimationClasses import Animation
+        Animation.clear_frame_cache()
+    
+    def mark_interpolating_dirty(self):
+        interpolating = False
+        for actor in self.layers[self.current_layer].actors.values():
+            prev_position = getattr(actor, 'prev_position', None)
+            if (prev_position is None or getattr(actor, 'sleeping', False) or
+                not np.any(prev_position != actor.position)):
+                continue
+            actor.mark_dirty()
+            interpolating = True
+        return interpolating
+    
     def update_PC(self):
         if self.current_layer in self.PC:
             self.PC[self.current_layer].movement()
@@ -323,6 +718,10 @@ class Game():
         self.screen.fill(self.background_color)
         self.prev_layer_id = self.current_layer
         self.current_layer = layer_id
+        self.layers[layer_id].mark_dirty()
+        self.handler.mark_all_dirty()
+        # the new layer may be entirely asleep, so nothing else would ask for a draw
+        self.handler.needs_draw = True
         
 
     def add_layer(self, widget_dicts, **kwargs):
@@ -331,14 +730,14 @@ class Game():
         layer.always_draw = self.always_draw
         for widget_dict in widget_dicts:
             layer.add_widget(widget_dict)
-        self.layers[layer.id] = layer
+        self.registry.add(layer, 'layers', [self])
         
     def load_layer(self, layer, name):
         with open('error_log.log', 'a') as f:
             f.write('\n')
             f.write(str(layer) + '\n')
         #pg.quit()
-        del self.layers[name]
+        self.remove_component(name)
         for widge in layer:
             for key in widge:
                 if '__iter__' in dir(widge[key]):
@@ -348,14 +747,38 @@ class Game():
         self.add_layer(layer, name)
     
     def get_component(self, component_id):
-        components =  [self.layers, self.widgets, 
-                       self.buttons, self.actors, 
-                       self.textboxs, self.graphics]
-        for component_type in components:
-            if component_id in component_type:
-                return component_type[component_id]
-            
-        return None
+        return self.registry.get(component_id, self)
+    
+    def query(self, comp_type = None, cls = None, tags = None, prefix = None, **attrs):
+        return self.registry.query(comp_type, cls, tags, prefix, self, **attrs)
+    
+    def remove_component(self, component_id):
+        component = self.get_component(component_id)
+        if component is None:
+            return None
+        self.defer(self.detach_component, component)
+        return component
+    
+    def detach_component(self, component):
+        if hasattr(component, 'get_all_components'):
+            for child in component.get_all_components():
+                self.events.unsubscribe_owner(child)
+                self.registry.remove(child)
+        self.events.unsubscribe_owner(component)
+        return self.registry.remove(component)
+    
+    def defer(self, func, *args):
+        if self.deferring:
+            self.deferred_ops.append((func, args))
+            return None
+        return func(*args)
+    
+    def flush_deferred(self):
+        while self.deferred_ops:
+            ops = self.deferred_ops
+            self.deferred_ops = []
+            for func, args in ops:
+                func(*args)
     
     def get_all_components(self):
         components =  [self.layers, self.widgets, 
@@ -424,6 +847,8 @@ class Game():
             convert_fonts_to_str(x)
             if hasattr(x, 'animations'):
                 x.animations = None
+            if hasattr(x, 'clear_draw_state'):
+                x.clear_draw_state()
                 
     def logic(self):
         None
@@ -431,7 +856,7 @@ class Game():
     def physics_check(self):
         None
         
-class Layer():
+class Layer(Updatable):
     """
     A class representing a layer in the game, which contains various widgets.
 
@@ -440,7 +865,7 @@ class Layer():
     - name (str, optional): Name of the layer.
 
     Attributes:
-    - game (object): Reference to the main game object.
+    - game (object): Weak reference to the main game object, read as the game or None.
     - always_draw (bool): Flag indicating whether the layer should always be drawn.
     - id (str): Unique identifier for the layer.
     - initialized (bool): Flag indicating whether the layer has been initialized.
@@ -449,24 +874,35 @@ class Layer():
     - widgets (dict): Dictionary to store widget objects.
     - textboxs (dict): Dictionary to store textbox objects.
     - graphics (dict): Dictionary to store graphic objects.
-    - widget_id_index (int): Index counter for widget IDs.
     - prev_screen (pygame.Surface): Previous screen content for restoring the layer's state.
     - uses_prev_screen (bool): Flag indicating whether the layer uses the previous screen content.
-    - to_update_attrs (dict): Dictionary to store attributes to be updated.
+    - to_update_attrs (UpdateAttrs): Extra method names run with the compiled update_* methods.
+    - active_widgets (dict): Awake widgets of the layer, keyed by widget, the only ones updated.
+    - asleep (dict): Sleeping widgets of the layer, keyed by widget.
+    - composed (bool): Flag indicating whether the last draw holds the layer's current widgets.
+    - composed_screens (list): Screen buffers holding the last draw, the handler alternates between two when presenting on a thread.
 
     Methods:
     - initial(self): Perform initial setup for the layer and its widgets.
-    - update(self): Update the layer's logic and widgets.
-    - draw(self): Draw the layer's widgets.
+    - update(self): Update the layer's logic and awake widgets.
+    - draw(self): Fill the screen and draw the layer's widgets, if any of them changed since the last draw.
+    - mark_dirty(self): Force the layer to redraw every widget on the next draw.
     - add_widget(self, widget_dict): Add a widget to the layer.
-    - add_widget_id(self): Generate and return a unique widget ID.
-    - get_component(self, component_id): Get a component by its ID.
+    - add_widget_id(self): Generate and return a widget ID unique within the game.
+    - get_component(self, component_id): Get a component in the layer by its ID or registry handle.
+    - query(self, comp_type=None, cls=None, tags=None, prefix=None, **attrs): Get the layer's components matching every criterion, using the registry indexes.
+    - remove_component(self, component_id): Remove a widget or component, and anything it holds, from the game.
     - get_all_components(self): Get a list of all components in the layer.
     - get_component_dict(self): Get a dictionary of all components categorized by type.
     - get_all_ids(self): Get a list of all component IDs in the layer.
+    - set_active(self, widget, active): Move a widget into the active or sleeping set.
+    - on_register(self, obj, comp_type): Add a widget registered in the layer to the active or sleeping set.
+    - on_unregister(self, obj, comp_type): Drop a widget removed from the layer from the active sets.
+    - wake_hovered(self): Wake the sleeping widgets under the cursor.
     - to_dict(self): Convert the layer and its widgets to a dictionary.
     - logic(self): Placeholder method for layer-specific logic updates.
     """
+    game = weak_parent('game')
     
     def __init__(self, uses_prev_screen = False, name = None):
         self.game = None
@@ -478,10 +914,13 @@ class Layer():
         self.widgets = dict()
         self.textboxs = dict()
         self.graphics = dict()
-        self.widget_id_index = 0
         self.prev_screen = None
         self.uses_prev_screen = uses_prev_screen
         self.to_update_attrs = dict()
+        self.active_widgets = dict()
+        self.asleep = dict()
+        self.composed = False
+        self.composed_screens = []
         
     def initial(self):
         for widget in self.widgets:
@@ -489,17 +928,52 @@ class Layer():
         self.initialized = True
         
     def update(self):
-        
-        self.logic()
-        if self.uses_prev_screen and not self.prev_screen is None:
-            self.game.screen.blit(self.prev_screen, [0,0])
-        run_updates(self)
-        for widget in self.widgets.values():
-            widget.update()
+        profiler = self.game.handler.profiler
+        with profiler.section(self.id, 'layer.update'):
+            self.logic()
+            if self.uses_prev_screen and not self.prev_screen is None:
+                self.game.screen.blit(self.prev_screen, [0,0])
+            run_updates(self, profiler)
+            if self.asleep and self.game.input.mouse_active():
+                self.wake_hovered()
+            for widget in self.active_widgets:
+                widget.update()
             
     def draw(self):
-        for widget in self.widgets.values():
-            widget.draw()
+        with self.game.handler.profiler.section(self.id, 'layer.draw'):
+            # the screen still holds the last draw, prev_screen layers blit onto it each update
+            screen = self.game.screen
+            changed = (not self.composed or self.uses_prev_screen or 
+                       any(widget.is_dirty() for widget in self.widgets.values()))
+            # a swapped in back buffer may hold an older draw, so it is redrawn once
+            if not changed and any(x is screen for x in self.composed_screens):
+                return None
+            screen.fill(self.game.background_color)
+            profiler = self.game.handler.profiler
+            # consecutive widget blits go to the screen in one Surface.blits call
+            blits = []
+            for widget in self.widgets.values():
+                widget_blits = None
+                if widget.batched:
+                    with profiler.section(widget.id, 'widget.draw'):
+                        widget_blits = widget.get_blits()
+                if widget_blits is None:
+                    if blits:
+                        screen.blits(blits, doreturn = False)
+                        blits = []
+                    widget.draw()
+                else:
+                    blits.extend(widget_blits)
+            if blits:
+                screen.blits(blits, doreturn = False)
+            if changed:
+                self.composed_screens = [screen]
+            else:
+                self.composed_screens.append(screen)
+            self.composed = True
+    
+    def mark_dirty(self):
+        self.composed = False
             
     def add_widget(self, widget_dict):
         alpha = 255
@@ -525,30 +999,29 @@ class Layer():
                     widget.__getattribute__('add_' + o_type_fun)(obj)
                     
         if 'id' in widget_dict:
-            if not  widget_dict['id'].startswith("widget_"):
-                 widget_dict['id'] = 'widget_' +  widget_dict['id']
             widget.id = widget_dict['id']
-        else: widget.id = self.add_widget_id()
+        self.game.registry.make_id(widget, 'widgets')
         if 'other' in widget_dict:
             for key in widget_dict['other']:
                 widget.__setattr__(key, widget_dict['other'][key])
-        self.widgets[widget.id] = widget
-        self.game.widgets[widget.id] = widget
+        self.game.events.subscribe_handlers(widget)
+        self.game.defer(self.game.registry.add, widget, 'widgets', [self, self.game])
         
     def add_widget_id(self):
-        id_num = str(self.widget_id_index)
-        self.widget_id_index += 1
-        return "widget_" + id_num
+        return self.game.registry.new_id('widgets')
     
     def get_component(self, component_id):
-        components =  [self.widgets, self.buttons,
-                       self.actors, self.textboxs, 
-                       self.graphics]
-        for component_type in components:
-            if component_id in component_type:
-                return component_type[component_id]
-            
-        return None
+        return self.game.registry.get(component_id, self)
+    
+    def query(self, comp_type = None, cls = None, tags = None, prefix = None, **attrs):
+        return self.game.registry.query(comp_type, cls, tags, prefix, self, **attrs)
+    
+    def remove_component(self, component_id):
+        component = self.get_component(component_id)
+        if component is None:
+            return None
+        self.game.defer(self.game.detach_component, component)
+        return component
     
     def get_all_components(self):
         components =  [self.widgets, self.buttons,
@@ -566,6 +1039,34 @@ class Layer():
     
     def get_all_ids(self):
         return [x.id for x in self.get_all_components()]
+    
+    def set_active(self, widget, active):
+        if not self.widgets.get(widget.id) is widget:
+            return None
+        if active:
+            self.asleep.pop(widget, None)
+            self.active_widgets[widget] = None
+        else:
+            self.active_widgets.pop(widget, None)
+            self.asleep[widget] = None
+    
+    def on_register(self, obj, comp_type):
+        if comp_type == 'widgets':
+            self.set_active(obj, not obj.sleeping)
+            self.composed = False
+    
+    def on_unregister(self, obj, comp_type):
+        if comp_type == 'widgets':
+            self.active_widgets.pop(obj, None)
+            self.asleep.pop(obj, None)
+            self.composed = False
+    
+    def wake_hovered(self):
+        cursor_loc = self.game.cursor_loc
+        scheduler = self.game.scheduler
+        for widget in [widget for widget in self.asleep 
+                       if widget.wake_on_hover and point_in_obj(cursor_loc, widget)]:
+            scheduler.wake(widget, immediate = True)
 
     def to_dict(self):
         return [w.to_dict() for w in self.widgets.values()]
@@ -573,7 +1074,7 @@ class Layer():
     def logic(self):
         None
         
-class Widget():
+class Widget(Sleepable, Updatable):
     
     """
     A class representing a graphical widget within a layer.
@@ -588,7 +1089,8 @@ class Widget():
     - shadow_stretch (numpy.array, optional): Stretch factor for shadows.
 
     Attributes:
-    - game (object): Reference to the main game object.
+    - game (object): Weak reference to the main game object, read as the game or None.
+    - layer (Layer): Weak reference to the layer holding the widget, read as the layer or None.
     - always_draw (bool): Flag indicating whether the widget should always be drawn.
     - id (str): Unique identifier for the widget.
     - initialized (bool): Flag indicating whether the widget has been initialized.
@@ -611,6 +1113,22 @@ class Widget():
     - blit_offset (numpy.array): Offset for blitting the widget.
     - draw_shadows (bool): Flag indicating whether to draw shadows.
     - shadow_stretch (numpy.array): Stretch factor for shadows.
+    - dirty_rects (list): Regions of the widget surface its components changed this frame.
+    - drawn_rect (pygame.Rect or None): Screen rectangle the widget covered when last drawn.
+    - drawn_key (tuple or None): Appearance of the widget surface when last drawn.
+    - event_handlers (dict or None): Method names (or (name, priority) pairs) per event type, subscribed when the widget is added to a layer.
+    - active (dict): Awake components keyed by component, per component type, the only ones updated.
+    - asleep (dict): Sleeping components of the widget, keyed by component.
+    - sleeping (bool): Flag indicating whether the widget is asleep, skipping its updates and component draws.
+    - composed (bool): Flag indicating whether surf holds the current drawing of the components.
+    - composed_key (tuple or None): Appearance of surf_orig when the components were last drawn onto surf.
+    - erase_rects (list): Regions of surf covered by components removed since the last compose.
+    - components_dirty (bool): Flag indicating whether a component was marked dirty since the last compose.
+    - draw_order (tuple): Component types in the order they are drawn.
+    - batched (bool): Flag indicating whether get_blits describes everything draw does, False for classes overriding draw only.
+    - max_changed_rects (int): Number of changed rectangles above which the whole surface is restored, merging them costing more.
+    - auto_sleep (bool): Flag indicating whether the widget sleeps once all its components are asleep. Default is False.
+    - saved_pools (dict): Pools of the pooled components while they are saved, keyed by component id.
 
     Methods:
     - initial(self): Perform initial setup for the widget and its components.
@@ -620,22 +1138,50 @@ class Widget():
     - add_graphic(self, graphic): Add a graphic object to the widget.
     - add_obj(self, obj, obj_type): Add a component object to the widget.
     - update(self): Update the widget's logic and components.
-    - draw(self): Draw the widget and its components.
-    - update_actors(self): Update actor components within the widget.
-    - update_buttons(self): Update button components within the widget.
-    - update_textboxs(self): Update textbox components within the widget.
-    - update_graphics(self): Update graphic components within the widget.
-    - get_component(self, component_id): Get a component by its ID.
+    - draw(self): Draw the widget, redrawing its components first if any of them changed.
+    - get_blits(self): Redraw the components if any of them changed and get the blits drawing the widget onto the screen.
+    - needs_compose(self): Check if the components have to be redrawn onto the widget surface.
+    - compose(self): Restore the changed regions of surf from surf_orig and redraw the components over them.
+    - get_changed_regions(self): Get the regions of surf to restore and the components to draw, None if unknown.
+    - draw_components(self, objs): Draw components onto surf in order, submitting their blits together.
+    - is_dirty(self): Check if the widget looks different on screen than at the last draw.
+    - mark_dirty(self): Force the widget to redraw its components on the next draw.
+    - clear_draw_state(self): Forget the last draw and composition, so no surfaces are held in the draw keys when saving.
+    - add_dirty_rect(self, rect): Record a region of the widget surface changed by a component.
+    - report_rects(self, rect): Report the screen regions the widget changed to the game handler.
+    - update_actors(self): Update the awake actor components within the widget.
+    - update_buttons(self): Update the awake button components within the widget.
+    - update_textboxs(self): Update the awake textbox components within the widget.
+    - update_graphics(self): Update the awake graphic components within the widget.
+    - set_active(self, obj, active): Move a component into the active or sleeping set.
+    - on_register(self, obj, comp_type): Add a component registered in the widget to the active or sleeping set.
+    - on_unregister(self, obj, comp_type): Drop a component removed from the widget from the active sets.
+    - wake_hovered(self): Wake the sleeping components under the cursor.
+    - is_idle(self): Check if every component of the widget is asleep.
+    - get_component(self, component_id): Get a component in the widget by its ID or registry handle.
+    - query(self, comp_type=None, cls=None, tags=None, prefix=None, **attrs): Get the widget's components matching every criterion, using the registry indexes.
     - get_all_components(self): Get a list of all components in the widget.
     - get_component_dict(self): Get a dictionary of components categorized by type.
     - get_all_ids(self): Get a list of all component IDs in the widget.
-    - remove_component(self, component_id): Remove a component from the widget.
+    - remove_component(self, component_id): Remove a component from the widget, its layer and the game.
     - get_cursor_loc(self): Get the cursor location relative to the widget.
     - move_component(self, component_id, new_widget_id): Move a component to another widget.
     - return_ids(self): Restore component IDs and references.
     - to_dict(self): Convert the widget and its components to a dictionary.
     - logic(self): Placeholder method for widget-specific logic updates.
     """
+    game = weak_parent('game')
+    layer = weak_parent('layer')
+    event_handlers = None
+    sleep_scope = 'layer'
+    draw_order = ('actors', 'graphics', 'buttons', 'textboxs')
+    max_changed_rects = 64
+    batched = True
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if 'draw' in cls.__dict__ and not 'get_blits' in cls.__dict__:
+            cls.batched = False
     
     def __init__(self, size, position, bkg_color, 
                  colorkey = None, alpha = 255,
@@ -670,6 +1216,18 @@ class Widget():
         self.blit_offset = np.zeros(2)
         self.draw_shadows = draw_shadows
         self.shadow_stretch = shadow_stretch
+        self.dirty_rects = []
+        self.drawn_rect = None
+        self.drawn_key = None
+        self.active = {comp_type : dict() for comp_type in 
+                       ['actors', 'buttons', 'textboxs', 'graphics']}
+        self.asleep = dict()
+        self.sleeping = False
+        self.composed = False
+        self.composed_key = None
+        self.erase_rects = []
+        self.components_dirty = False
+        self.saved_pools = dict()
         
     def initial(self):
         self.surf = self.surf_orig.copy()
@@ -695,20 +1253,10 @@ class Widget():
         obj.__setattr__('widget', self)
         obj.__setattr__('layer', self.layer)
         obj.__setattr__('game', self.game)
-        if obj_type.endswith('xes'):
-            obj_prefix = obj_type[:-2] + '_'
-        else:
-            obj_prefix = obj_type[:-1] + '_'
-        if obj.id is None:
-            current_obj_index = self.game.__getattribute__(obj_type + '_index')
-            obj.__setattr__('id', obj_prefix + str(current_obj_index))
-            self.game.__setattr__(obj_type + '_index', current_obj_index + 1)
-        else:
-            if not obj.id.startswith(obj_prefix):
-                obj.__setattr__('id', obj_prefix + obj.id)
-        self.__getattribute__(obj_type)[obj.id] = obj
-        self.layer.__getattribute__(obj_type)[obj.id] = obj
-        self.game.__getattribute__(obj_type)[obj.id] = obj
+        obj.destroyed = False
+        self.game.events.subscribe_handlers(obj)
+        self.game.registry.make_id(obj, obj_type)
+        self.game.defer(self.game.registry.add, obj, obj_type, [self, self.layer, self.game])
         
     def update(self):
         if not self.initialized:
@@ -716,63 +1264,215 @@ class Widget():
         """ Render the screen. """
         #self.screen.fill((255, 255, 255))
         if self.to_update:
-            self.blit_offset = np.zeros(2)
-            self.get_cursor_loc()
-            self.hover_over = all(x > 0 and x < self.size[i] for i, x 
-                   in enumerate(self.cursor_loc))
-            self.logic()
-            self.surf = self.surf_orig.copy()
-            run_updates(self)
+            profiler = self.game.handler.profiler
+            with profiler.section(self.id, 'widget.update'):
+                self.blit_offset = np.zeros(2)
+                self.get_cursor_loc()
+                self.hover_over = all(x > 0 and x < self.size[i] for i, x 
+                       in enumerate(self.cursor_loc))
+                self.logic()
+                if self.asleep and self.hover_over and self.game.input.mouse_active():
+                    self.wake_hovered()
+                run_updates(self, profiler)
+                if self.auto_sleep and self.is_idle():
+                    self.sleep()
         # pg.display.flip()
         # Your drawing code goes here
         
     def draw(self):
+        with self.game.handler.profiler.section(self.id, 'widget.draw'):
+            blits = self.get_blits()
+            if blits:
+                self.game.screen.blits(blits, doreturn = False)
+    
+    def get_blits(self):
         if not self.initialized:
             self.initial()
-        for obj_type in ['actors', 'graphics', 'buttons', 'textboxs']:
-            for obj in self.__getattribute__(obj_type).values():
-                obj.draw()
-            
+        blits = ()
         if self.to_draw:
-            self.game.screen.blit(self.surf, self.position + self.blit_offset)
+            if self.needs_compose():
+                self.compose()
+            rect = pg.Rect(self.position + self.blit_offset, self.surf.get_size())
+            self.report_rects(rect)
+            blits = ((self.surf, rect),)
+        elif not self.drawn_rect is None:
+            self.game.handler.mark_dirty(self.drawn_rect)
+            self.drawn_rect = None
+        self.dirty_rects = []
+        return blits
+    
+    def needs_compose(self):
+        if (self.erase_rects or not self.composed or 
+            self.composed_key != (self.surf_orig, self.surf_orig.get_alpha())):
+            return True
+        # a sleeping widget keeps the surface its components were last drawn onto
+        if self.sleeping and not self.components_dirty:
+            return False
+        for obj_type in self.draw_order:
+            for obj in self.__getattribute__(obj_type).values():
+                if obj.needs_redraw():
+                    return True
+        return False
+    
+    def compose(self):
+        key = (self.surf_orig, self.surf_orig.get_alpha())
+        changes = None
+        if self.composed and self.composed_key == key:
+            changes = self.get_changed_regions()
+        if changes is None:
+            if self.composed_key == key and self.surf.get_size() == self.surf_orig.get_size():
+                copy_area(self.surf, self.surf_orig, self.surf.get_rect())
+            else:
+                # the background itself changed
+                self.surf = self.surf_orig.copy()
+            self.draw_components([obj for obj_type in self.draw_order 
+                                  for obj in self.__getattribute__(obj_type).values()])
+            self.add_dirty_rect(self.surf.get_rect())
+        else:
+            regions, components, rects = changes
+            surf = self.surf
+            for region in regions:
+                # components outside the region are left as they are on surf
+                surf.set_clip(region)
+                copy_area(surf, self.surf_orig, region)
+                self.draw_components([components[ind] for ind in region.collidelistall(rects)])
+                self.add_dirty_rect(region)
+            surf.set_clip(None)
+            # changed components drawing nothing on the surface still record it
+            self.draw_components([components[ind] for ind, rect in enumerate(rects) if not rect])
+        self.erase_rects = []
+        self.components_dirty = False
+        self.composed = True
+        self.composed_key = key
+    
+    def get_changed_regions(self):
+        surf_rect = self.surf.get_rect()
+        changed_rects = list(self.erase_rects)
+        components = []
+        rects = []
+        for obj_type in self.draw_order:
+            for obj in self.__getattribute__(obj_type).values():
+                if obj.needs_redraw():
+                    rect = obj.get_draw_rect()
+                    if rect is None:
+                        return None
+                    rect = rect.clip(surf_rect)
+                    if not obj.drawn_rect is None:
+                        changed_rects.append(obj.drawn_rect)
+                    changed_rects.append(rect)
+                    if len(changed_rects) > self.max_changed_rects:
+                        return None
+                elif obj.drawn_rect is None:
+                    continue
+                else:
+                    rect = obj.drawn_rect
+                components.append(obj)
+                rects.append(rect)
+        # a changed component's new rectangle lies inside exactly one region, so it is drawn once,
+        # while unchanged components are redrawn in every region they overlap
+        regions = merge_rects([rect.clip(surf_rect) for rect in changed_rects])
+        if sum(region.w * region.h for region in regions) * 2 > surf_rect.w * surf_rect.h:
+            return None
+        return regions, components, rects
+    
+    def draw_components(self, objs):
+        profiler = self.game.handler.profiler
+        surf = self.surf
+        # consecutive blits are submitted in one Surface.blits call, components drawing
+        # themselves flush the blits before them to keep the draw order
+        blits = []
+        for obj in objs:
+            with profiler.section(type(obj).__name__, 'component.draw'):
+                obj_blits = obj.get_blits() if obj.batched else None
+                if obj_blits is None:
+                    if blits:
+                        surf.blits(blits, doreturn = False)
+                        blits = []
+                    obj.draw()
+                else:
+                    blits.extend(obj_blits)
+        if blits:
+            surf.blits(blits, doreturn = False)
+    
+    def is_dirty(self):
+        if not self.to_draw:
+            return not self.drawn_rect is None
+        if not self.initialized or self.needs_compose():
+            return True
+        return (self.drawn_rect != pg.Rect(self.position + self.blit_offset, self.surf.get_size()) or
+                self.drawn_key != (self.surf_orig, self.surf_orig.get_alpha()))
+    
+    def mark_dirty(self):
+        self.composed = False
+    
+    def clear_draw_state(self):
+        self.drawn_rect = None
+        self.drawn_key = None
+        self.composed = False
+        self.composed_key = None
+        
+    def add_dirty_rect(self, rect):
+        self.dirty_rects.append(rect)
+    
+    def report_rects(self, rect):
+        handler = self.game.handler
+        key = (self.surf_orig, self.surf_orig.get_alpha())
+        if self.drawn_rect != rect or self.drawn_key != key:
+            # moved, resized or restyled, so everything under the widget changed
+            if not self.drawn_rect is None:
+                handler.mark_dirty(self.drawn_rect)
+            handler.mark_dirty(rect)
+            self.drawn_rect = rect
+            self.drawn_key = key
+            return None
+        for dirty_rect in self.dirty_rects:
+            handler.mark_dirty(dirty_rect.move(rect.topleft).clip(rect))
         
     def update_actors(self):
-        acts =  [x for x in self.actors.values()]
-        for act in acts:
+        profiler = self.game.handler.profiler
+        for act in self.active['actors']:
             act.hover_over = (self.hover_over 
                               and point_in_obj(self.cursor_loc, act))
             try:
-                self.game.handler.needs_draw += act.update()
+                with profiler.section(type(act).__name__, 'component.update'):
+                    self.game.handler.needs_draw += act.update()
+                if act.auto_sleep and act.is_idle():
+                    act.sleep()
             except Exception as err:
                 print(act.id)
                 print(act.surf)
                 print(err)
                 
     def update_buttons(self):
-        buttons = [x for x in self.buttons.values()]
-        for button in buttons:
+        profiler = self.game.handler.profiler
+        for button in self.active['buttons']:
             try:
                 if (self.hover_over and
                     point_in_obj(self.cursor_loc, button)):
-                    if self.game.mouse_pressed[0]:
+                    game_input = self.game.input
+                    if game_input.mouse_clicked(1):
                         button.is_pressed = True
-                    else:
-                        if button.is_pressed:
-                            button.run_pressed()
+                    # a click can go down and up within a single update
+                    if button.is_pressed and game_input.mouse_released(1):
+                        button.run_pressed()
+                    if not game_input.mouse_held(1):
                         button.is_pressed = False
                     button.hover_over = True
                 else: 
                     button.hover_over = False
                     button.is_pressed = False
-                self.game.handler.needs_draw += button.update()
+                with profiler.section(type(button).__name__, 'component.update'):
+                    self.game.handler.needs_draw += button.update()
+                if button.auto_sleep and button.is_idle():
+                    button.sleep()
                 
             except Exception as err:
                 print(button.id)
                 print(err)
             
     def update_textboxs(self):
-        textboxs = [x for x in self.textboxs.values()]
-        for text_box in textboxs:
+        profiler = self.game.handler.profiler
+        for text_box in self.active['textboxs']:
             try:
                 if (self.game.mouse_pressed[0] and 
                     self.hover_over and
@@ -780,27 +1480,31 @@ class Widget():
                         text_box.is_selected = True
                 elif self.game.mouse_pressed[0]:
                     text_box.is_selected = False
-                self.game.handler.needs_draw += text_box.update()
+                with profiler.section(type(text_box).__name__, 'component.update'):
+                    self.game.handler.needs_draw += text_box.update()
+                if text_box.auto_sleep and text_box.is_idle():
+                    text_box.sleep()
             except Exception as err:
                 print(text_box.id)
                 print(err)
                 
     def update_graphics(self):
-        for graphic in self.graphics.values():
+        profiler = self.game.handler.profiler
+        for graphic in self.active['graphics']:
             try:
-                graphic.update()
+                with profiler.section(type(graphic).__name__, 'component.update'):
+                    graphic.update()
+                if graphic.auto_sleep and graphic.is_idle():
+                    graphic.sleep()
             except Exception as err:
                 print(graphic.id)
                 print(err)
                 
     def get_component(self, component_id):
-        components =  [self.buttons, self.actors,
-                       self.textboxs, self.graphics]
-        for component_type in components:
-            if component_id in component_type:
-                return component_type[component_id]
-            
-        return None
+        return self.game.registry.get(component_id, self)
+    
+    def query(self, comp_type = None, cls = None, tags = None, prefix = None, **attrs):
+        return self.game.registry.query(comp_type, cls, tags, prefix, self, **attrs)
     
     def get_all_components(self):
         components =  [self.buttons, self.actors,
@@ -818,20 +1522,60 @@ class Widget():
         return [x.id for x in self.get_all_components()]
     
     def remove_component(self, component_id):
-        components =  [self.buttons, self.actors,
-                       self.textboxs, self.graphics]
-        for component_type in components:
-            if component_id in component_type:
-                del component_type[component_id]
-                break
-        self.layer.remove_component(component_id)
+        component = self.get_component(component_id)
+        if component is None:
+            return None
+        self.game.defer(self.game.detach_component, component)
+        return component
     
     def get_cursor_loc(self):
         self.cursor_loc = self.game.cursor_loc - self.position
     
+    def set_active(self, obj, active):
+        record = self.game.registry.get_record(obj)
+        if record is None or not any(scope is self for scope in record[2]):
+            return None
+        if active:
+            self.asleep.pop(obj, None)
+            self.active.setdefault(record[1], dict())[obj] = None
+        else:
+            self.active.setdefault(record[1], dict()).pop(obj, None)
+            self.asleep[obj] = None
+    
+    def on_register(self, obj, comp_type):
+        if getattr(obj, 'sleeping', False):
+            self.asleep[obj] = None
+        else:
+            self.active.setdefault(comp_type, dict())[obj] = None
+        obj.draw_is_dirty = True
+        self.components_dirty = True
+    
+    def on_unregister(self, obj, comp_type):
+        self.active.setdefault(comp_type, dict()).pop(obj, None)
+        self.asleep.pop(obj, None)
+        if not obj.drawn_rect is None:
+            self.erase_rects.append(obj.drawn_rect)
+        obj.drawn_rect = None
+        obj.drawn_key = None
+    
+    def wake_hovered(self):
+        scheduler = self.game.scheduler
+        for obj in [obj for obj in self.asleep 
+                    if obj.wake_on_hover and point_in_obj(self.cursor_loc, obj)]:
+            scheduler.wake(obj, immediate = True)
+    
+    def is_idle(self):
+        return not any(self.active.values())
+    
     def move_component(self, component_id, new_widget_id):
         component = self.get_component(component_id)
+        new_widget = self.game.get_component(new_widget_id)
+        if component is None or new_widget is None:
+            return None
+        comp_type = self.game.registry.get_record(component)[1]
         self.remove_component(component_id)
+        new_widget.add_obj(component, comp_type)
+        return component
         
     def return_ids(self):
         comp_dict = self.get_component_dict()
@@ -842,6 +1586,7 @@ class Widget():
                 x.game = self.game
                 x.layer = self.layer
                 x.widget = self
+                x.pool = self.saved_pools.pop(id(x), None)
         #pg.quit()
         
     def to_dict(self):
@@ -854,10 +1599,14 @@ class Widget():
         comps = self.get_component_dict()
         
         for x in deep_finder(comps):
+            x.clear_draw_state()
             convert_surfs_to_str(x)
             x.game = None
             x.layer = None
             x.widget = None
+            if not x.pool is None:
+                self.saved_pools[id(x)] = x.pool
+                x.pool = None
             
         for key in comps.keys():
             out_dict[key] = [x for x in comps[key].values()]
@@ -869,23 +1618,46 @@ class Widget():
     
 class Deleteable():
     """
-    A mixin class providing automatic deletion of object references.
+    A mixin class giving components an explicit, deferred destruction.
+
+    The game, layer and widget back-references are held as weak references, so they read
+    None once the component is detached or its parents are gone.
+
+    Attributes:
+    - slot_names (tuple): Names of the per-object attributes kept by the mixin, for classes using __slots__.
+    - game (Game): Weak reference to the game, read as the game or None.
+    - layer (Layer): Weak reference to the layer, read as the layer or None.
+    - widget (Widget): Weak reference to the widget, read as the widget or None.
+    - destroyed (bool): Flag indicating whether destroy has been called.
+    - pool (ActorPool or None): The pool the component returns to once it has been removed.
+    - handle (int): The registry handle, set when the component is registered.
+    - tags (set): Tags indexed by the registry, set by ComponentRegistry.add_tag.
+    - event_handlers (dict or None): Method names (or (name, priority) pairs) per event type, subscribed when the component is added to a widget.
 
     Methods:
-    - __del__(self): Automatically delete object references from parent objects.
+    - destroy(self): Remove the component from its widget, layer and game at the end of the update.
     - show_data(self): Display object attributes and their IDs.
     """
-    def __del__(self):
-        for parent_id in ['game', 'layer', 'widget']:
-            if not hasattr(self, parent_id): continue
-            parent = self.__getattribute__(parent_id)
-            if not parent: continue
-            for id_type in ['actors', 'buttons', 'textboxs', 'graphics']:
-                store = parent.__getattribute__(id_type)
-                if not store: continue
-                if self.id in store: 
-                    del store[self.id]
-                    break
+    __slots__ = ()
+    slot_names = ('game_ref', 'layer_ref', 'widget_ref', 'destroyed', 'pool', 'handle', 'tags')
+    game = weak_parent('game')
+    layer = weak_parent('layer')
+    widget = weak_parent('widget')
+    destroyed = False
+    pool = None
+    event_handlers = None
+    
+    def destroy(self):
+        game = self.game
+        if game is None or self.destroyed:
+            return None
+        self.destroyed = True
+        if getattr(self, 'drawn_rect', None) and self.widget:
+            self.widget.add_dirty_rect(self.drawn_rect)
+        game.defer(game.detach_component, self)
+        if not self.pool is None:
+            game.defer(self.pool.release, self)
+        
     def show_data(self):
         for x in dir(self):
             if not x.startswith('__'):
@@ -893,7 +1665,137 @@ class Deleteable():
                 print(x,data)
                 if hasattr(data, 'id'):
                     print(x+'_id', data.id)
-class Actor(Deleteable):
+
+class Drawable():
+    """
+    A mixin class tracking what a component last drew so changed regions can be reported.
+
+    Components call report_draw with the rectangle they blitted onto their widget and the
+    key returned by get_draw_key, describing what they drew and where. The widget is told
+    about the old and new rectangles only when either of them differs from the last frame,
+    and only redraws its components when one of their keys changed.
+
+    Components also return the rectangle the next draw covers from get_draw_rect, so the widget
+    can restore and redraw just the regions that changed. Components returning None (or
+    overriding draw without get_draw_key or needs_redraw) make their widget recompose fully.
+    Classes overriding draw without get_draw_key (or needs_redraw) are redrawn every frame.
+    Code changing a component's surface in place should call mark_dirty.
+
+    Widgets draw their components through get_blits, which reports the draw and returns the
+    (surface, dest) or (surface, dest, area) tuples to blit, so the widget can submit the blits
+    of consecutive components in one Surface.blits call. Classes overriding draw without
+    get_blits are drawn with their draw method.
+
+    Attributes:
+    - slot_names (tuple): Names of the per-object attributes kept by the mixin, for classes using __slots__.
+    - retained (bool): Flag indicating whether get_draw_key describes everything draw does.
+    - batched (bool): Flag indicating whether get_blits describes everything draw does.
+
+    Methods:
+    - draw(self): Blit the component onto its widget's surface.
+    - get_blits(self): Report the next draw and get its blits, None to be drawn with draw.
+    - get_draw_key(self): Get what the next draw would draw and where, None when hidden.
+    - needs_redraw(self): Check if the next draw would differ from the last one.
+    - get_draw_rect(self): Get the widget rectangle the next draw covers, None when unknown.
+    - report_draw(self, rect, key): Report the drawn rectangle to the widget if it changed.
+    - report_blit(self, key, size, position=None): Report a blit before it is submitted and get its integer destination rectangle.
+    - report_hidden(self): Report the last drawn rectangle when the component stops drawing.
+    - mark_dirty(self): Force the component to be redrawn and report its rectangle on the next draw, waking it if it sleeps.
+    - clear_draw_state(self): Forget the last draw, so no surfaces are held in the draw keys when saving.
+    """
+    __slots__ = ()
+    slot_names = ('drawn_rect', 'drawn_key', 'draw_is_dirty', 'drawn_dest')
+    retained = True
+    batched = True
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if ('draw' in cls.__dict__ and not 'get_draw_key' in cls.__dict__ and 
+            not 'needs_redraw' in cls.__dict__):
+            cls.retained = False
+        if 'draw' in cls.__dict__ and not 'get_blits' in cls.__dict__:
+            cls.batched = False
+    
+    def draw(self):
+        widget = self.widget
+        if widget is None:
+            return None
+        blits = self.get_blits()
+        if blits:
+            widget.surf.blits(blits, doreturn = False)
+    
+    def get_blits(self):
+        return None
+    
+    def get_draw_key(self):
+        return None
+    
+    def needs_redraw(self):
+        if self.draw_is_dirty or not self.retained:
+            return True
+        key = self.get_draw_key()
+        return not key is self.drawn_key and key != self.drawn_key
+    
+    def get_draw_rect(self):
+        return None
+    
+    def report_blit(self, key, size, position = None):
+        # the destination only changes with the key, so it is built once per change
+        dest = self.drawn_dest
+        if (dest is None or self.draw_is_dirty or 
+            not key is self.drawn_key and key != self.drawn_key):
+            if position is None:
+                position = self.position + self.blit_offset
+            dest = pg.Rect(position, size)
+            # the same rectangle blit returns, clipped to the widget surface's clip area
+            self.report_draw(dest.clip(self.widget.surf.get_clip()), key)
+            self.drawn_dest = dest
+        return dest
+    
+    def report_draw(self, rect, key):
+        # the key holds the position, and a redraw clipped to a changed region of the widget
+        # blits a clipped rectangle, so only a changed key updates the drawn rectangle
+        if (self.draw_is_dirty or self.drawn_rect is None or
+            not self.drawn_key is key and self.drawn_key != key or
+            not self.retained and self.drawn_rect != rect):
+            if not self.drawn_rect is None:
+                self.widget.add_dirty_rect(self.drawn_rect)
+            self.widget.add_dirty_rect(rect)
+            self.drawn_rect = rect
+            self.drawn_key = key
+            self.drawn_dest = None
+            self.draw_is_dirty = False
+            
+    def report_hidden(self):
+        self.drawn_key = None
+        self.drawn_dest = None
+        if not self.drawn_rect is None and self.widget:
+            self.widget.add_dirty_rect(self.drawn_rect)
+            self.drawn_rect = None
+    
+    def mark_dirty(self):
+        self.draw_is_dirty = True
+        widget = self.widget
+        if not widget is None:
+            widget.components_dirty = True
+        if getattr(self, 'sleeping', False):
+            self.wake()
+    
+    def clear_draw_state(self):
+        # the keys hold the drawn surfaces inside tuples, which saving does not convert
+        self.drawn_rect = None
+        self.drawn_key = None
+        self.drawn_dest = None
+        self.draw_is_dirty = True
+
+# instance layout shared by the slotted components, the declared attributes live in slots
+# and the __dict__ is only allocated once an undeclared attribute is set on the object
+COMPONENT_SLOTS = (Deleteable.slot_names + Drawable.slot_names + Sleepable.slot_names + 
+                   Updatable.slot_names + 
+                   ('__dict__', '__weakref__', 'id', 'position', 'size', 'surf', 'blit_offset',
+                    'to_draw', 'to_update', 'hover_over', 'is_selected'))
+        
+class Actor(Deleteable, Drawable, Sleepable, Updatable):
     """
     A class representing an actor in the game.
 
@@ -903,7 +1805,11 @@ class Actor(Deleteable):
                has_shadow=False): Initialize the Actor instance.
     - update(self): Update the Actor's position and behavior.
     - draw(self): Draw the Actor on the screen.
+    - get_blits(self): Report the next draw and get its blits, None when a shadow is drawn.
+    - get_draw_key(self, position=None): Get the surface, position and shadow flag the next draw uses, None when hidden.
+    - get_draw_rect(self, position=None): Get the rectangle the next draw covers, None with a shadow.
     - draw_shadow(self): Draw the shadow of the Actor.
+    - draw_position(self): Get the position the Actor is drawn at this frame.
     - move_to(self, dt): Move the Actor towards a target point.
     - move_away(self, dt): Move the Actor away from a target point.
     - center(self): Get the center position of the Actor.
@@ -913,8 +1819,17 @@ class Actor(Deleteable):
     - movement(self): Handle player input-related movements.
     - physics_check(self): Check for physics interactions.
     - kill(self): Destroy the Actor.
+    - reset_state(self): Clear the per-life state so a pooled Actor can be reused.
     - retarget_by_center(self): Adjust the target based on the center of the Actor.
+
+    Actors use __slots__ for the attributes set here, any other attribute is kept in a
+    __dict__ created when it is first set.
     """
+    __slots__ = COMPONENT_SLOTS + ('target', 'speed', 'current_action', 'color', 'always_draw',
+                                   'is_pc', 'is_pressed', 'death_timer', 'death_timer_limit',
+                                   'is_physics_object', 'has_shadow', 'prev_position',
+                                   'shadow', 'shadow_size', 'shadow_offset')
+    
     def __init__(self, position, size = None, speed = 120, 
                  target = np.array([800,800]), color = [0,0,0],
                  always_draw = False, death_timer_limit = None,
@@ -941,12 +1856,24 @@ class Actor(Deleteable):
         self.to_update_attrs = dict()
         self.blit_offset = np.zeros(2)
         self.has_shadow = has_shadow
+        self.prev_position = None
+        self.shadow = None
+        self.shadow_size = None
+        self.shadow_offset = None
+        self.drawn_rect = None
+        self.drawn_key = None
+        self.drawn_dest = None
+        self.draw_is_dirty = True
+        self.destroyed = False
+        self.pool = None
+        self.sleeping = False
+        self.wake_time = None
         
     def update(self):
         if not self.death_timer_limit is None and self.death_timer >= self.death_timer_limit:
             self.kill()
         prev_size = copy(self.size)
-        prev_position = copy(self.position)
+        self.prev_position = copy(self.position)
         if self.is_physics_object:
             self.physics_check()
         if self.to_update:
@@ -959,22 +1886,65 @@ class Actor(Deleteable):
         return 0
     
     def draw(self):
-        if self.to_draw and not self.surf is None:
-            if self.game.enable_shadows and self.widget.draw_shadows and self.has_shadow:
-                self.draw_shadow()
-            self.widget.surf.blit(self.surf, self.position + self.blit_offset)
+        position = self.draw_position()
+        key = self.get_draw_key(position)
+        if not key is None:
+            shadow_rect = None
+            if key[2]:
+                shadow_rect = self.draw_shadow()
+            rect = self.widget.surf.blit(self.surf, position)
+            if shadow_rect:
+                rect = rect.union(shadow_rect)
+            self.report_draw(rect, key)
+        else:
+            self.report_hidden()
+    
+    def get_blits(self):
+        position = self.draw_position()
+        key = self.get_draw_key(position)
+        if key is None:
+            self.report_hidden()
+            return ()
+        if key[2]:
+            # shadows are blitted by draw_shadow
+            return None
+        return ((self.surf, self.report_blit(key, self.surf.get_size(), position)),)
+    
+    def get_draw_key(self, position = None):
+        if not self.to_draw or self.surf is None:
+            return None
+        if position is None:
+            position = self.draw_position()
+        return (self.surf, vec_key(position), 
+                self.has_shadow and self.game.enable_shadows and self.widget.draw_shadows)
+    
+    def get_draw_rect(self, position = None):
+        if not self.to_draw or self.surf is None:
+            return pg.Rect(0, 0, 0, 0)
+        if self.has_shadow and self.game.enable_shadows and self.widget.draw_shadows:
+            return None
+        if position is None:
+            position = self.draw_position()
+        return pg.Rect(position, self.surf.get_size())
             
+    def draw_position(self):
+        position = self.position
+        alpha = self.game.alpha
+        if alpha != 1 and self.prev_position is not None:
+            # fixed timestep rendering lands between the last two updates
+            position = self.prev_position + alpha * (position - self.prev_position)
+        return position + self.blit_offset
+    
     def draw_shadow(self):
-        if not hasattr(self, 'shadow') or self.shadow_size != self.size:
+        if self.shadow is None or self.shadow_size != self.size:
             self.shadow = make_shadow(self.surf, self.widget.sheer_amt)
             self.shadow_size = (np.array(self.shadow.get_size()) * 
                                 self.widget.shadow_stretch)
             self.shadow = pg.transform.smoothscale(self.shadow, 
                                      self.shadow_size)
             self.shadow_offset = self.size - self.shadow_size
-        self.widget.surf.blit(self.shadow, self.position +
-                                           self.blit_offset + 
-                                           self.shadow_offset)
+        return self.widget.surf.blit(self.shadow, self.draw_position() + 
+                                                  self.shadow_offset)
     def move_to(self, dt):
         direction =  self.target - self.center()
         mag = sum(direction**2)**.5
@@ -1021,12 +1991,28 @@ class Actor(Deleteable):
         None
         
     def kill(self):
-        self.__del__()
+        self.destroy()
+    
+    def reset_state(self):
+        self.death_timer = 0
+        self.to_draw = True
+        self.to_update = True
+        self.hover_over = False
+        self.is_selected = False
+        self.is_pressed = False
+        self.blit_offset = np.zeros(2)
+        self.prev_position = None
+        self.drawn_rect = None
+        self.drawn_key = None
+        self.drawn_dest = None
+        self.draw_is_dirty = True
+        self.sleeping = False
+        self.wake_time = None
     
     def retarget_by_center(self):
         self.target = self.target - self.center()/2
     
-class Button(Deleteable):
+class Button(Deleteable, Drawable, Sleepable, Updatable):
     
     """
     A class representing a button in the game.
@@ -1039,10 +2025,31 @@ class Button(Deleteable):
     - init_draw(self): Initialize drawing properties of the Button.
     - update(self): Update the Button's appearance and behavior.
     - render_font(self): Render the font of the Button's text.
-    - draw(self): Draw the Button on the screen.
+    - get_state(self): Get the state the Button is drawn in, 'normal', 'hover' or 'pressed'.
+    - get_state_surf(self): Get the finished surface of the current state, rebuilding the surfaces if they changed.
+    - build_state_surfs(self): Composite the rendered text onto a copy of each state surface.
+    - get_blits(self): Get the blit drawing the Button onto its widget.
+    - get_draw_key(self): Get the surface and position the next draw uses, None when hidden.
+    - get_draw_rect(self): Get the rectangle the next draw covers.
+    - clear_draw_state(self): Forget the last draw and the state surfaces, which are rebuilt on the next draw.
+    - is_idle(self): Check if the Button is neither hovered nor pressed and has no logic or update passes.
     - run_pressed(self): Execute actions when the Button is pressed.
     - logic(self): Handle Button-specific logic.
+
+    The normal, hover and pressed surfaces (surf, hover_over_surf and pressed_surf, built by
+    init_draw) are composited with the text once into state_surfs, which are shared and
+    switched between by reference. They are rebuilt when the text or any of the three
+    surfaces is replaced, so subclasses changing the size or colours rebuild them by
+    calling init_draw. Classes drawing themselves get a copy of the plain state surface in
+    to_draw_surf each update to draw onto.
     """
+    # buttons sleep while the cursor is away from them, their surfaces are prebuilt
+    auto_sleep = True
+    __slots__ = COMPONENT_SLOTS + ('font', 'font_details', 'color', 'hover_over_color',
+                                   'pressed_color', 'alpha', 'text', 'last_text', 'always_draw',
+                                   'is_pressed', 'justification', 'hover_over_surf',
+                                   'pressed_surf', 'to_draw_surf', 'surf_font', 'state_surfs',
+                                   'state_key')
     
     def __init__(self, position, size, color, alpha, text = None, 
                  font = ['Arial', 25, (255, 0, 0)], 
@@ -1069,6 +2076,17 @@ class Button(Deleteable):
         self.to_update_attrs = dict()
         self.blit_offset = np.zeros(2)
         self.justification = justification
+        self.surf_font = None
+        self.state_surfs = None
+        self.state_key = None
+        self.drawn_rect = None
+        self.drawn_key = None
+        self.drawn_dest = None
+        self.draw_is_dirty = True
+        self.destroyed = False
+        self.pool = None
+        self.sleeping = False
+        self.wake_time = None
         self.init_draw()
 
     def init_draw(self):
@@ -1091,17 +2109,50 @@ class Button(Deleteable):
         if self.to_update:
             self.blit_offset = np.zeros(2)
             self.logic()
-            if self.is_pressed: 
-                self.to_draw_surf = self.pressed_surf.copy()
-                self.font.set_bold(True)
-            elif self.hover_over: self.to_draw_surf = self.hover_over_surf.copy()
-            else: self.to_draw_surf = self.surf.copy()
+            if self.batched:
+                self.to_draw_surf = self.get_state_surf()
+            else:
+                state = self.get_state()
+                if state == 'pressed': self.to_draw_surf = self.pressed_surf.copy()
+                elif state == 'hover': self.to_draw_surf = self.hover_over_surf.copy()
+                else: self.to_draw_surf = self.surf.copy()
             run_updates(self)
-        else: surf = self.surf.copy()
-        if self.is_pressed:
-            self.font.set_bold(False)
         return 1
     
+    def is_idle(self):
+        return (not self.hover_over and not self.is_pressed and 
+                type(self).update is Button.update and type(self).logic is Button.logic and
+                not self.get_update_methods()[1])
+    
+    def get_state(self):
+        if self.is_pressed:
+            return 'pressed'
+        if self.hover_over:
+            return 'hover'
+        return 'normal'
+    
+    def get_state_surf(self):
+        surf_font = None
+        if not self.text is None:
+            self.render_font()
+            surf_font = self.surf_font
+        key = (self.surf, self.hover_over_surf, self.pressed_surf, surf_font)
+        state_key = self.state_key
+        if (state_key is None or 
+            not all(new is old for new, old in zip(key, state_key))):
+            self.build_state_surfs()
+            self.state_key = key
+        return self.state_surfs[self.get_state()]
+    
+    def build_state_surfs(self):
+        self.state_surfs = dict()
+        for state, surf in [('normal', self.surf), ('hover', self.hover_over_surf),
+                            ('pressed', self.pressed_surf)]:
+            surf = surf.copy()
+            if not self.text is None:
+                surf.blit(self.surf_font, [0,0])
+            self.state_surfs[state] = surf
+    
     def render_font(self):
         if self.text != self.last_text:
             self.last_text = self.text
@@ -1110,9 +2161,8 @@ class Button(Deleteable):
                                                self.font_details[1])
             locs = [[x[0] + 5, x[1] + 5] for x in locs]
             
-            fonts = [
-                self.font.render(text, True, self.font_details[2], None)
-                for text in split_text]
+            fonts = [render_text(text, self.font_details, font = self.font)
+                     for text in split_text]
             blits_squence = [[fnt, loc] for fnt, loc in zip(fonts,locs)]
             if self.justification == 'Centered':
                 for x in blits_squence:
@@ -1124,13 +2174,29 @@ class Button(Deleteable):
             self.surf_font.set_colorkey((5,7,11))
             self.surf_font.blits(blits_squence)
             
-    def draw(self):
-        if self.to_draw:
-            if not self.text is None:
-                self.render_font()
-                self.to_draw_surf.blit(self.surf_font, [0,0])
-            if self.widget:
-                self.widget.surf.blit(self.to_draw_surf, self.position + self.blit_offset)
+    def get_blits(self):
+        key = self.get_draw_key()
+        if key is None:
+            self.report_hidden()
+            return ()
+        self.to_draw_surf = key[0]
+        return ((key[0], self.report_blit(key, key[0].get_size())),)
+    
+    def get_draw_key(self):
+        if not self.to_draw:
+            return None
+        return (self.get_state_surf(), vec_key(self.position), vec_key(self.blit_offset))
+    
+    def get_draw_rect(self):
+        if not self.to_draw:
+            return pg.Rect(0, 0, 0, 0)
+        return pg.Rect(self.position + self.blit_offset, self.surf.get_size())
+    
+    def clear_draw_state(self):
+        # the state surfaces are held in a dictionary, which saving does not convert
+        super().clear_draw_state()
+        self.state_surfs = None
+        self.state_key = None
             
     def run_pressed(self):
         None
@@ -1158,7 +2224,7 @@ class ChangeLayerButton(Button):
     def run_pressed(self):
         self.game.change_layer(self.layer_id)
 
-class Textbox(Deleteable):
+class Textbox(Deleteable, Drawable, Sleepable, Updatable):
     """
         Initialize the Textbox instance.
 
@@ -1178,6 +2244,11 @@ class Textbox(Deleteable):
     period_ind = pg.K_PERIOD
     ind_to_letter[pg.K_COMMA] = ","
     ind_to_num = { getattr(pg,'K_' + x) : x for x in "1234567890"}
+    # unselected textboxes sleep until a click lands on them
+    auto_sleep = True
+    __slots__ = COMPONENT_SLOTS + ('letter_dict', 'font', 'font_details', 'blink_count',
+                                   'delay_count', 'text', 'default_text', 'max_text_length',
+                                   'backspace_held', 'backspace_cnt')
     def __init__(self, position, length = 100,
                  box_color = (100,100,150),
                  font = ["Arial", 25, (255,0,0)],
@@ -1215,12 +2286,21 @@ class Textbox(Deleteable):
         self.blit_offset = np.zeros(2)
         self.backspace_held = False
         self.backspace_cnt = 0
+        self.drawn_rect = None
+        self.drawn_key = None
+        self.drawn_dest = None
+        self.draw_is_dirty = True
+        self.destroyed = False
+        self.pool = None
+        self.sleeping = False
+        self.wake_time = None
         
     def update(self):
         cnt_threshold = np.floor(5 * self.game.framerate/60)
         if self.is_selected and self.to_update:
+            game_input = self.game.input
             if self.backspace_held:
-                if self.game.pressed_status[pg.K_BACKSPACE]:
+                if game_input.is_held(pg.K_BACKSPACE):
                     self.text = self.text[:-1]
                     run_updates(self)
                     return 1
@@ -1229,41 +2309,62 @@ class Textbox(Deleteable):
                     self.backspace_cnt = 0
             self.blit_offset = np.zeros(2)
             if self.delay_count == 0:
-                if self.game.pressed_status[pg.K_BACKSPACE]:
+                if game_input.is_held(pg.K_BACKSPACE):
                     self.backspace_cnt += 1
                     if self.backspace_cnt >= cnt_threshold: 
                         self.backspace_held = True
-                    if self.game.pressed_status[pg.K_BACKSPACE]:
-                        self.delay_count+=1
-                        self.text = self.text[:-1]
-                if self.max_text_length is None or len(self.text) < self.max_text_length:
-                    self.add_pressed_letters()
-                if self.game.pressed_status[pg.K_RETURN]:
-                    self.on_enter()
+                    self.delay_count+=1
+                    self.text = self.text[:-1]
             else:
                 self.delay_count+=1
                 if self.delay_count >= cnt_threshold:
                     self.delay_count = 0
-            self.blink_count += 1
+            # typed keys are edges seen by a single update, so they are taken
+            # every update and only the backspace repeat is delayed
+            if self.max_text_length is None or len(self.text) < self.max_text_length:
+                self.add_pressed_letters()
+            if game_input.was_pressed(pg.K_RETURN):
+                self.on_enter()
+            self.blink_count = (self.blink_count + 1) % 41
             run_updates(self)
         return 1
     
-    def draw(self):
-        if self.to_draw:
-            output_text = self.default_text
-            if self.text or self.is_selected:
-                output_text = self.text
-                if self.blink_count < 20: output_text += "|"
-                elif self.blink_count >= 40: self.blink_count = -1
-            
-            font_surf = self.font.render(output_text, True, 
-                                     self.font_details[2], None)
-            self.to_draw_surf = self.surf.copy()
-            self.to_draw_surf.blit(font_surf, [6,6])
-            self.widget.surf.blit(self.to_draw_surf, self.position + self.blit_offset)
+    def get_blits(self):
+        key = self.get_draw_key()
+        if key is None:
+            self.report_hidden()
+            return ()
+        font_surf = render_text(key[1], self.font_details, font = self.font)
+        rect = self.report_blit(key, self.surf.get_size())
+        # the text is cut off at the edges of the box, as if blitted onto a copy of it
+        return ((self.surf, rect),
+                (font_surf, rect.move(6, 6), pg.Rect(0, 0, rect.w - 6, rect.h - 6)))
+    
+    def get_output_text(self):
+        if not (self.text or self.is_selected):
+            return self.default_text
+        # the caret shows for the first 20 of every 41 updates while selected
+        if self.blink_count < 20:
+            return self.text + "|"
+        return self.text
+    
+    def get_draw_key(self):
+        if not self.to_draw:
+            return None
+        return (self.surf, self.get_output_text(), vec_key(self.position), 
+                vec_key(self.blit_offset))
+    
+    def get_draw_rect(self):
+        if not self.to_draw:
+            return pg.Rect(0, 0, 0, 0)
+        return pg.Rect(self.position + self.blit_offset, self.surf.get_size())
             
     def init_draw(self):
         self.update()
+    
+    def is_idle(self):
+        return (not self.is_selected and type(self).update is Textbox.update and
+                not self.get_update_methods()[1])
         
     def get_pressed_index_dict(self, exclude_numbers, exclude_letters, exclude_period):
         self.letter_dict = dict()
@@ -1277,32 +2378,38 @@ class Textbox(Deleteable):
             self.letter_dict[self.period_ind] = "."
             
     def add_pressed_letters(self):
-        for ind in self.game.held_index:
-            if not ind in self.letter_dict or ind in self.game.prev_held:
+        game_input = self.game.input
+        for ind in game_input.pressed_keys:
+            if not ind in self.letter_dict:
                 continue
             letter = self.letter_dict[ind]
             if letter != "":
-                if pg.K_LSHIFT in  self.game.held_index or pg.K_RSHIFT in  self.game.held_index:
+                if game_input.is_held(pg.K_LSHIFT) or game_input.is_held(pg.K_RSHIFT):
                     letter = letter.upper()
                 self.text += letter
-                if self.delay_count == 0: self.delay_count+=1
                 
     def on_enter(self):
         None
                 
-class Graphic(Deleteable):
+class Graphic(Deleteable, Drawable, Sleepable, Updatable):
     """
     A class representing a graphical element.
 
     This class allows you to create and manage graphical elements that can be
     added to the game's interface. Graphics can consist of multiple surfaces
-    and are responsible for their own drawing and updating.
+    and are responsible for their own drawing and updating. Text is added with
+    add_text, rendered through the shared text cache.
 
     :param size: The size of the Graphic (width, height).
     :type size: list or tuple
     :param position: The position of the Graphic.
     :type position: numpy.array
     """
+    __slots__ = COMPONENT_SLOTS + ('width', 'height', 'orig_color', 'surf_orig', 'surfs',
+                                   'surf_index')
+    # graphics without update passes sleep after their first update
+    auto_sleep = True
+    wake_on_hover = False
     def __init__(self, size, position):
         [self.width, self.height] = size
         self.position = position
@@ -1319,13 +2426,25 @@ class Graphic(Deleteable):
         self.to_update_attrs = dict()
         self.blit_offset = np.zeros(2)
         self.size = size
+        self.drawn_rect = None
+        self.drawn_key = None
+        self.drawn_dest = None
+        self.draw_is_dirty = True
+        self.destroyed = False
+        self.pool = None
+        self.sleeping = False
+        self.wake_time = None
         
+    def add_text(self, text, position, font = ['Arial', 25, (0,0,0)], antialias = True):
+        self.add_surf(render_text(text, font, antialias), position)
+    
     def add_surf(self, surf, position):
         self.surfs[self.surf_index] = [pg.image.tostring(surf, "RGBA"),
                                        np.array(surf.get_size()),
                                        np.array(position)]
         self.surf_index += 1
         self.surf.blit(surf, position)
+        self.mark_dirty()
     
     def update(self):
         if self.to_update:
@@ -1333,9 +2452,25 @@ class Graphic(Deleteable):
             run_updates(self)
         return 0
     
-    def draw(self):
-        if self.to_draw:
-            self.widget.surf.blit(self.surf, self.position + self.blit_offset)
+    def get_blits(self):
+        key = self.get_draw_key()
+        if key is None:
+            self.report_hidden()
+            return ()
+        return ((self.surf, self.report_blit(key, self.surf.get_size())),)
+    
+    def get_draw_key(self):
+        if not self.to_draw:
+            return None
+        return (self.surf, vec_key(self.position), vec_key(self.blit_offset))
+    
+    def get_draw_rect(self):
+        if not self.to_draw:
+            return pg.Rect(0, 0, 0, 0)
+        return pg.Rect(self.position + self.blit_offset, self.surf.get_size())
+    
+    def is_idle(self):
+        return type(self).update is Graphic.update and not self.get_update_methods()[1]
                 
     def redraw(self):
         self.surf = pg.transform.smoothscale(self.surf_orig.copy(), 
@@ -0,0 +1,370 @@
+# -*- coding: utf-8 -*-
+"""
+PyGame_ClassExt_smongan1 Package Documentation
+
+This module provides struct-of-arrays batching for large numbers of simple actors.
+
+Classes:
+- ActorBatch: An Actor holding many BatchActors whose positions, targets, sizes, speeds, actions
+  and update/draw flags live in contiguous NumPy arrays, so move_to and move_away run for every
+  member in one vectorized step each update.
+- BatchActor: An Actor whose position, target, size, speed, prev_position, current_action,
+  to_update and to_draw read and write its row of the batch arrays while it is in a batch, and
+  behave like ordinary attributes otherwise, so existing logic() overrides keep working.
+
+Functions:
+- `batch_field(name, array_name)`: Get a property reading and writing one row of an ActorBatch array.
+
+Usage Example:
+```python
+class red_square(BatchActor):
+    def logic(self):
+        if self.position[1] <= 1:
+            self.target[1] = self.widget.size[1] + 100
+
+batch = ActorBatch()
+for x in range(500):
+    batch.add(red_square([x, 0], (25, 25)))
+widget.add_actor(batch)
+```
+
+Members are updated by the batch and are not registered in the widget, layer or game
+actor dicts themselves, the batch is.
+"""
+from PyGame_ClassExt_smongan1.BaseClasses import Actor
+from PyGame_ClassExt_smongan1.utilities import run_updates
+import numpy as np
+import pygame as pg
+
+DO_NOTHING = 0
+MOVE_TO = 1
+MOVE_AWAY = 2
+CUSTOM_ACTION = -1
+
+def batch_field(name, array_name):
+    """
+    Get a property reading and writing one row of an ActorBatch array.
+
+    While the actor is not in a batch the value is kept in the actor's __dict__ like an
+    ordinary attribute.
+
+    Args:
+        name (str): Name of the attribute.
+        array_name (str): Name of the ActorBatch array holding the attribute.
+
+    Returns:
+        property: The property to assign to the class attribute name.
+    """
+    def get_field(self):
+        batch = self.__dict__.get('batch')
+        if batch is None:
+            return self.__dict__.get(name)
+        return batch.__dict__[array_name][self.slot]
+    def set_field(self, value):
+        batch = self.__dict__.get('batch')
+        if batch is None:
+            self.__dict__[name] = value
+        else:
+            batch.__dict__[array_name][self.slot] = value
+    return property(get_field, set_field)
+
+class BatchActor(Actor):
+    """
+    An Actor that can be stored in an ActorBatch.
+
+    Attributes:
+    - batch (ActorBatch or None): The batch holding the actor.
+    - slot (int or None): The actor's row in the batch arrays.
+
+    Methods:
+    - prev_position: Position before the last update, set to None to use the current position.
+    - current_action: Action run each update, move_to, move_away and do_nothing are vectorized by the batch.
+    - destroy(self): Remove the actor from its batch at the end of the update.
+    """
+    position = batch_field('position', 'positions')
+    target = batch_field('target', 'targets')
+    size = batch_field('size', 'sizes')
+    speed = batch_field('speed', 'speeds')
+    to_update = batch_field('to_update', 'to_updates')
+    to_draw = batch_field('to_draw', 'to_draws')
+    batch = None
+    slot = None
+
+    @property
+    def prev_position(self):
+        batch = self.__dict__.get('batch')
+        if batch is None:
+            return self.__dict__.get('prev_position')
+        return batch.prev_positions[self.slot]
+
+    @prev_position.setter
+    def prev_position(self, value):
+        batch = self.__dict__.get('batch')
+        if batch is None:
+            self.__dict__['prev_position'] = value
+        elif value is None:
+            batch.prev_positions[self.slot] = batch.positions[self.slot]
+        else:
+            batch.prev_positions[self.slot] = value
+
+    @property
+    def current_action(self):
+        return self.__dict__.get('current_action')
+
+    @current_action.setter
+    def current_action(self, action):
+        self.__dict__['current_action'] = action
+        batch = self.__dict__.get('batch')
+        if not batch is None:
+            batch.modes[self.slot] = batch.get_mode(action)
+
+    def destroy(self):
+        batch = self.__dict__.get('batch')
+        if batch is None:
+            return super().destroy()
+        if self.destroyed:
+            return None
+        self.destroyed = True
+        if getattr(self, 'drawn_rect', None) and self.widget:
+            self.widget.add_dirty_rect(self.drawn_rect)
+        batch.defer(batch.remove, self)
+        if not self.pool is None:
+            batch.defer(self.pool.release, self)
+
+class ActorBatch(Actor):
+    """
+    Struct-of-arrays container updating many BatchActors at once.
+
+    Each update copies every position into prev_positions, runs each member's movement and
+    logic, moves every member whose current_action is move_to or move_away in one vectorized
+    step, calls any other current_action per member and finally runs the members' update
+    passes. Members are drawn one after another with their own Actor.draw.
+
+    Parameters:
+    - capacity (int, optional): Number of rows allocated up front, the arrays double when full. Default is 64.
+
+    Attributes:
+    - members (list): The batched actors, members[i].slot == i.
+    - count (int): Number of members.
+    - positions (numpy.ndarray): Member positions, one row per member.
+    - prev_positions (numpy.ndarray): Member positions before the last update.
+    - targets (numpy.ndarray): Member targets.
+    - sizes (numpy.ndarray): Member sizes.
+    - speeds (numpy.ndarray): Member speeds in pixels per second.
+    - modes (numpy.ndarray): Member actions, DO_NOTHING, MOVE_TO, MOVE_AWAY or CUSTOM_ACTION.
+    - to_updates (numpy.ndarray): Flags indicating whether each member is updated.
+    - to_draws (numpy.ndarray): Flags indicating whether each member is drawn.
+
+    Methods:
+    - add(actor): Add a BatchActor, copying its fields into the arrays.
+    - remove(actor): Remove a member, copying its fields back into the actor.
+    - defer(func, *args): Run a change to the members now, or at the end of the game update.
+    - attach(actor): Give a member the batch's game, layer and widget.
+    - get_mode(action): Get the vectorized mode of an action.
+    - step(dt): Run move_to and move_away for every member at once.
+    - update(): Update every member.
+    - draw(): Draw every member.
+    - get_blits(): Get the blits of every member, None if a member has to be drawn with its draw method.
+    - needs_redraw(): Check if any member would draw differently than last time.
+    - report_members(): Record the rectangle covered by the members' last draws.
+    - get_draw_rect(): Get the rectangle covering every member's next draw, None if a member's is unknown.
+    - init_draw(): Initialize drawing for every member.
+    """
+
+    def __init__(self, capacity = 64):
+        super().__init__(np.zeros(2), size = np.zeros(2))
+        self.members = []
+        self.count = 0
+        self.allocate(max(capacity, 1))
+
+    def __len__(self):
+        return self.count
+
+    def allocate(self, capacity):
+        arrays = {'positions' : np.zeros((capacity, 2)),
+                  'prev_positions' : np.zeros((capacity, 2)),
+                  'targets' : np.zeros((capacity, 2)),
+                  'sizes' : np.zeros((capacity, 2)),
+                  'speeds' : np.zeros(capacity),
+                  'modes' : np.zeros(capacity, dtype = np.int8),
+                  'to_updates' : np.zeros(capacity, dtype = bool),
+                  'to_draws' : np.zeros(capacity, dtype = bool)}
+        for name, array in arrays.items():
+            if hasattr(self, name):
+                array[:self.count] = self.__getattribute__(name)[:self.count]
+            self.__setattr__(name, array)
+        self.capacity = capacity
+
+    def get_mode(self, action):
+        func = getattr(action, '__func__', None)
+        if func is Actor.move_to:
+            return MOVE_TO
+        if func is Actor.move_away:
+            return MOVE_AWAY
+        if func is Actor.do_nothing or action is None:
+            return DO_NOTHING
+        return CUSTOM_ACTION
+
+    def defer(self, func, *args):
+        if self.game is None:
+            return func(*args)
+        return self.game.defer(func, *args)
+
+    def attach(self, actor):
+        actor.game = self.game
+        actor.layer = self.layer
+        actor.widget = self.widget
+
+    def add(self, actor):
+        if not isinstance(actor, BatchActor):
+            raise(Exception("Only BatchActors can be added to an ActorBatch"))
+        if actor.size is None:
+            raise(Exception("BatchActors need a size to be added to an ActorBatch"))
+        if not actor.batch is None:
+            actor.batch.remove(actor)
+        if self.count == self.capacity:
+            self.allocate(2 * self.capacity)
+        fields = {name : actor.__dict__.pop(name, None) for name in
+                  ['position', 'target', 'size', 'speed', 'to_update', 'to_draw',
+                   'prev_position']}
+        slot = self.count
+        self.positions[slot] = fields['position']
+        self.targets[slot] = fields['target']
+        self.sizes[slot] = fields['size']
+        self.speeds[slot] = fields['speed']
+        self.to_updates[slot] = fields['to_update'] is None or fields['to_update']
+        self.to_draws[slot] = fields['to_draw'] is None or fields['to_draw']
+        if fields['prev_position'] is None:
+            self.prev_positions[slot] = self.positions[slot]
+        else:
+            self.prev_positions[slot] = fields['prev_position']
+        self.modes[slot] = self.get_mode(actor.current_action)
+        actor.__dict__['batch'] = self
+        actor.slot = slot
+        self.members.append(actor)
+        self.count += 1
+        actor.destroyed = False
+        self.attach(actor)
+        self.mark_dirty()
+        return actor
+
+    def remove(self, actor):
+        if not actor.batch is self:
+            return None
+        slot = actor.slot
+        fields = {'position' : self.positions[slot].copy(),
+                  'target' : self.targets[slot].copy(),
+                  'size' : self.sizes[slot].copy(),
+                  'speed' : float(self.speeds[slot]),
+                  'to_update' : bool(self.to_updates[slot]),
+                  'to_draw' : bool(self.to_draws[slot]),
+                  'prev_position' : self.prev_positions[slot].copy()}
+        last = self.count - 1
+        if slot != last:
+            # move the last member into the freed row
+            moved = self.members[last]
+            for name in ['positions', 'prev_positions', 'targets', 'sizes',
+                         'speeds', 'modes', 'to_updates', 'to_draws']:
+                array = self.__getattribute__(name)
+                array[slot] = array[last]
+            self.members[slot] = moved
+            moved.slot = slot
+        self.members.pop()
+        self.count -= 1
+        del actor.__dict__['batch']
+        actor.slot = None
+        actor.__dict__.update(fields)
+        self.mark_dirty()
+        return actor
+
+    def step(self, dt):
+        n = self.count
+        modes = self.modes[:n]
+        active = self.to_updates[:n]
+        upp = self.game.units_per_pixel
+        positions = self.positions[:n]
+        move_to = active & (modes == MOVE_TO)
+        if move_to.any():
+            position = positions[move_to]
+            direction = self.targets[:n][move_to] - (position + self.sizes[:n][move_to]//2)
+            mag = np.sqrt((direction**2).sum(1))
+            direction /= np.where(mag > 1, mag, 1)[:, None]
+            speed = np.minimum(dt * self.speeds[:n][move_to] * upp, mag)
+            positions[move_to] = position + speed[:, None] * direction
+        move_away = active & (modes == MOVE_AWAY)
+        if move_away.any():
+            position = positions[move_away]
+            direction = (position + self.sizes[:n][move_away]//2) - self.targets[:n][move_away]
+            speed = dt * self.speeds[:n][move_away] * upp
+            positions[move_away] = position + speed[:, None] * direction
+
+    def update(self):
+        if not self.count:
+            return 1
+        self.prev_positions[:self.count] = self.positions[:self.count]
+        dt = self.game.dt
+        for member in self.members:
+            if (not member.death_timer_limit is None and
+                member.death_timer >= member.death_timer_limit):
+                member.kill()
+            if self.to_updates[member.slot]:
+                member.blit_offset = np.zeros(2)
+                member.movement()
+                member.logic()
+        self.step(dt)
+        for member in self.members:
+            if self.to_updates[member.slot]:
+                if self.modes[member.slot] == CUSTOM_ACTION:
+                    member.current_action(dt)
+                run_updates(member)
+        return 1
+
+    def draw(self):
+        for member in self.members:
+            member.draw()
+        self.report_members()
+
+    def get_blits(self):
+        blits = []
+        for member in self.members:
+            member_blits = member.get_blits() if member.batched else None
+            if member_blits is None:
+                return None
+            blits.extend(member_blits)
+        self.report_members()
+        return blits
+
+    def report_members(self):
+        rects = [member.drawn_rect for member in self.members if member.drawn_rect]
+        self.drawn_rect = rects[0].unionall(rects[1:]) if rects else None
+        self.draw_is_dirty = False
+    
+    def needs_redraw(self):
+        if self.draw_is_dirty:
+            return True
+        for member in self.members:
+            if member.needs_redraw():
+                return True
+        return False
+
+    def get_draw_rect(self):
+        rects = []
+        for member in self.members:
+            rect = member.get_draw_rect()
+            if rect is None:
+                return None
+            if rect:
+                rects.append(rect)
+        if not rects:
+            return pg.Rect(0, 0, 0, 0)
+        return rects[0].unionall(rects[1:])
+
+    def init_draw(self):
+        for member in self.members:
+            self.attach(member)
+            member.init_draw()
+
+    def reset_state(self):
+        super().reset_state()
+        for member in self.members:
+            member.reset_state()
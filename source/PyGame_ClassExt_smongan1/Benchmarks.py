@@ -0,0 +1,289 @@
+# -*- coding: utf-8 -*-
+"""
+PyGame_ClassExt_smongan1 Package Documentation
+
+This module provides a scene-level benchmark suite for the framework. Synthetic layers are built
+through Layer.add_widget with a configurable number of Actors, AnimatedActors, batched Actors,
+Buttons, Textboxes or Graphics, run headless for a fixed number of frames with every component redrawn each
+frame, and the update and draw throughput of each object type is recorded. Results are saved as JSON so runs from different versions can be diffed.
+
+Classes:
+- BenchmarkMover: A red_square-style Actor bouncing between the top and bottom of its widget.
+- BenchmarkAnimatedMover: An AnimatedActor version of BenchmarkMover cycling through generated frames.
+- BenchmarkBatchMover: A BatchActor version of BenchmarkMover, run together in one ActorBatch.
+
+Functions:
+- `make_animation_assets(folder, size=(25, 25), n_frames=4)`: Write a small generated animation strip to disk.
+- `make_scene_func(obj_type, count, widget_size, asset_folder=None)`: Get a layer function filling a widget with count objects.
+- `run_scene(obj_type, count, n_frames=120, size=(800, 800), seed=0, asset_folder=None, save_folder=None)`: Benchmark one scene headless.
+- `run_benchmarks(obj_types=None, counts=None, n_frames=120, seed=0)`: Benchmark every object type at every count.
+- `save_results(results, path)`: Save benchmark results as JSON.
+- `compare_results(old, new)`: Get the ratio of new to old per object timings for matching scenes.
+
+Usage Example:
+```python
+from PyGame_ClassExt_smongan1.Benchmarks import run_benchmarks, save_results
+results = run_benchmarks(['actors', 'buttons'], [10, 100, 1000], n_frames = 60)
+save_results(results, 'bench.json')
+```
+
+or from the command line:
+
+    python -m PyGame_ClassExt_smongan1.Benchmarks --counts 10 100 1000 --out bench.json
+"""
+from PyGame_ClassExt_smongan1.BaseClasses import Game, GameHandler, Actor, Button, Textbox, Graphic
+from PyGame_ClassExt_smongan1.AnimationClasses import AnimatedActor
+from PyGame_ClassExt_smongan1.BatchClasses import ActorBatch, BatchActor
+from PyGame_ClassExt_smongan1.utilities import make_widget_dict
+from tempfile import TemporaryDirectory
+import numpy as np
+import pygame as pg
+import platform
+import argparse
+import json
+import os
+
+OBJ_TYPES = ['actors', 'animated_actors', 'batched_actors', 'buttons', 'textboxs', 'graphics']
+DEFAULT_COUNTS = [10, 100, 1000, 10000]
+
+class BenchmarkMover(Actor):
+
+    def __init__(self, position, size = (25, 25), speed = 120):
+        super().__init__(position, size, speed = speed, color = (255, 0, 0))
+        self.current_action = self.move_to
+        self.target = np.array([position[0] + size[0]/2, np.random.choice([-200, 1000])])
+
+    def logic(self):
+        if self.position[1] <= 1:
+            self.target[1] = self.widget.size[1] + 100
+            self.position[1] = 1
+        elif self.position[1] >= self.widget.size[1]:
+            self.target[1] = 0
+            self.position[1] = self.widget.size[1] - 1
+
+class BenchmarkAnimatedMover(AnimatedActor):
+
+    def __init__(self, position, size = (25, 25), speed = 120):
+        super().__init__(position, size, speed = speed, color = (0, 0, 255))
+        self.current_action = self.move_to
+        self.target = np.array([position[0] + size[0]/2, np.random.choice([-200, 1000])])
+
+    def logic(self):
+        BenchmarkMover.logic(self)
+        self.animation = 'walking'
+        self.choose_animation()
+
+class BenchmarkBatchMover(BatchActor):
+
+    def __init__(self, position, size = (25, 25), speed = 120):
+        super().__init__(position, size, speed = speed, color = (255, 0, 0))
+        self.current_action = self.move_to
+        self.target = np.array([position[0] + size[0]/2, np.random.choice([-200, 1000])])
+
+    def logic(self):
+        BenchmarkMover.logic(self)
+
+def make_animation_assets(folder, size = (25, 25), n_frames = 4):
+    """
+    Write a small generated animation strip to disk.
+
+    Args:
+        folder (str): Directory the 'Bench/Bench_walking' animation folder is written to.
+        size (tuple, optional): Size of each frame. Defaults to (25, 25).
+        n_frames (int, optional): Number of frames in the strip. Defaults to 4.
+
+    Returns:
+        str: The asset folder name to pass to AnimatedActor.AddAnimation with path=folder.
+    """
+    animation_dir = os.path.join(folder, 'Bench', 'Bench_walking')
+    os.makedirs(animation_dir, exist_ok = True)
+    for frame in range(n_frames):
+        surf = pg.Surface(size)
+        surf.fill((0, 0, 255))
+        pg.draw.circle(surf, (255, 255, 0), [x//2 for x in size],
+                       1 + frame * min(size) // (2 * n_frames))
+        pg.image.save(surf, os.path.join(animation_dir, 'sprite_' + str(frame) + '.png'))
+    return 'Bench'
+
+def make_scene_func(obj_type, count, widget_size, asset_folder = None):
+    """
+    Get a layer function filling a single widget with count objects of one type.
+
+    Args:
+        obj_type (str): One of 'actors', 'animated_actors', 'batched_actors', 'buttons', 'textboxs' or 'graphics'.
+        count (int): Number of objects in the scene.
+        widget_size (tuple): Size of the widget holding the objects.
+        asset_folder (str, optional): Folder holding the animation made by make_animation_assets,
+            needed for 'animated_actors'. Defaults to None.
+
+    Returns:
+        function: A layer function for Game, building the "Main_menu" layer.
+    """
+    def setup_scene(game):
+        width, height = [int(x) for x in widget_size]
+        xs = np.random.randint(0, width - 25, count)
+        ys = np.random.randint(0, height - 25, count)
+        objs = []
+        for x, y in zip(xs, ys):
+            if obj_type == 'actors':
+                objs.append(BenchmarkMover(np.array([x, y])))
+            elif obj_type == 'animated_actors':
+                act = BenchmarkAnimatedMover(np.array([x, y]))
+                act.AddAnimation('Bench', path = asset_folder)
+                objs.append(act)
+            elif obj_type == 'batched_actors':
+                objs.append(BenchmarkBatchMover(np.array([x, y])))
+            elif obj_type == 'buttons':
+                objs.append(Button([x, y], [60, 20], (100, 100, 255), 255, 'B'))
+            elif obj_type == 'textboxs':
+                objs.append(Textbox([x, y], length = 60, font = ["Arial", 12, (255, 0, 0)],
+                                    default_text = 'text'))
+            elif obj_type == 'graphics':
+                graphic = Graphic([25, 25], [x, y])
+                surf = pg.Surface([15, 15])
+                surf.fill((0, 150, 0))
+                graphic.add_surf(surf, [5, 5])
+                objs.append(graphic)
+            else:
+                raise(Exception("Unknown benchmark object type: " + str(obj_type)))
+        if obj_type == 'batched_actors':
+            batch = ActorBatch(count)
+            for obj in objs:
+                batch.add(obj)
+            objs = [batch]
+        widget_key = 'actors' if obj_type in ['animated_actors', 'batched_actors'] else obj_type
+        widget_dict = make_widget_dict([width, height], [0, 0], (180, 180, 180),
+                                       **{widget_key : objs})
+        widget_dict['id'] = 'widget_bench'
+        return [widget_dict], {"name" : "Main_menu"}
+    return setup_scene
+
+def run_scene(obj_type, count, n_frames = 120, size = (800, 800), seed = 0,
+              asset_folder = None, save_folder = None):
+    """
+    Benchmark one scene headless for a fixed number of frames.
+
+    Args:
+        obj_type (str): The object type filling the scene, see OBJ_TYPES.
+        count (int): Number of objects in the scene.
+        n_frames (int, optional): Number of frames run. Defaults to 120.
+        size (tuple, optional): Size of the game screen. Defaults to (800, 800).
+        seed (int, optional): Seed for object placement and the run. Defaults to 0.
+        asset_folder (str, optional): Folder from make_animation_assets, used by 'animated_actors'. Defaults to None.
+        save_folder (str, optional): Save folder handed to Game. Defaults to None, a temporary folder.
+
+    Returns:
+        dict: Scene description, per frame and per object update and draw timings, and the run summary.
+    """
+    with TemporaryDirectory() as tmp_folder:
+        if save_folder is None:
+            save_folder = os.path.join(tmp_folder, 'Saves')
+        if asset_folder is None and obj_type == 'animated_actors':
+            make_animation_assets(tmp_folder)
+            asset_folder = tmp_folder
+        np.random.seed(seed)
+        game = Game(size[0], size[1], [],
+                    [make_scene_func(obj_type, count, size, asset_folder)],
+                    save_folder = save_folder, assets_folder = asset_folder)
+        handler = GameHandler(game, headless = True)
+        # retained widgets skip unchanged frames, so every frame is forced to draw everything
+        summary = handler.run_frames(n_frames, seed = seed, force_draw = True)
+    frames = max(summary['frames'], 1)
+    return {'obj_type' : obj_type,
+            'count' : count,
+            'frames' : summary['frames'],
+            'draws' : summary['draws'],
+            'fps' : summary['fps'],
+            'update_per_frame' : summary['update']['total']/frames,
+            'draw_per_frame' : summary['draw']['total']/frames,
+            'update_per_object' : summary['update']['total']/(frames * count),
+            'draw_per_object' : summary['draw']['total']/(frames * count),
+            'update_objects_per_second' : frames * count/max(summary['update']['total'], 1e-12),
+            'draw_objects_per_second' : frames * count/max(summary['draw']['total'], 1e-12),
+            'summary' : summary}
+
+def run_benchmarks(obj_types = None, counts = None, n_frames = 120, seed = 0, verbose = True):
+    """
+    Benchmark every object type at every count.
+
+    Args:
+        obj_types (list, optional): Object types to benchmark. Defaults to OBJ_TYPES.
+        counts (list, optional): Object counts to benchmark. Defaults to DEFAULT_COUNTS.
+        n_frames (int, optional): Number of frames run per scene. Defaults to 120.
+        seed (int, optional): Seed for every scene. Defaults to 0.
+        verbose (bool, optional): Print each scene's throughput as it finishes. Defaults to True.
+
+    Returns:
+        dict: Environment details and a list of run_scene results.
+    """
+    if obj_types is None: obj_types = OBJ_TYPES
+    if counts is None: counts = DEFAULT_COUNTS
+    results = {'python' : platform.python_version(),
+               'pygame' : pg.version.ver,
+               'numpy' : np.__version__,
+               'platform' : platform.platform(),
+               'n_frames' : n_frames,
+               'seed' : seed,
+               'scenes' : []}
+    for obj_type in obj_types:
+        for count in counts:
+            result = run_scene(obj_type, count, n_frames, seed = seed)
+            results['scenes'].append(result)
+            if verbose:
+                print(obj_type, count,
+                      'update %.2f us/obj' % (result['update_per_object'] * 1e6),
+                      'draw %.2f us/obj' % (result['draw_per_object'] * 1e6),
+                      'fps %.1f' % result['fps'])
+    return results
+
+def save_results(results, path):
+    """
+    Save benchmark results as JSON.
+
+    Args:
+        results (dict): Results from run_benchmarks.
+        path (str): Path of the JSON file.
+    """
+    with open(path, 'w') as f:
+        json.dump(results, f, indent = 1, sort_keys = True)
+
+def compare_results(old, new):
+    """
+    Get the ratio of new to old per object timings for matching scenes.
+
+    Args:
+        old (dict or str): Baseline results, or the path of their JSON file.
+        new (dict or str): New results, or the path of their JSON file.
+
+    Returns:
+        dict: {(obj_type, count) : {'update' : ratio, 'draw' : ratio}}, ratios above 1 are regressions.
+    """
+    results = []
+    for result in [old, new]:
+        if isinstance(result, str):
+            with open(result) as f:
+                result = json.load(f)
+        results.append({(scene['obj_type'], scene['count']) : scene
+                        for scene in result['scenes']})
+    old_scenes, new_scenes = results
+    return {key : {'update' : new_scenes[key]['update_per_object'] /
+                              max(old_scenes[key]['update_per_object'], 1e-12),
+                   'draw' : new_scenes[key]['draw_per_object'] /
+                            max(old_scenes[key]['draw_per_object'], 1e-12)}
+            for key in old_scenes if key in new_scenes}
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description = "Headless scene benchmarks")
+    parser.add_argument('--types', nargs = '+', default = OBJ_TYPES)
+    parser.add_argument('--counts', nargs = '+', type = int, default = DEFAULT_COUNTS)
+    parser.add_argument('--frames', type = int, default = 120)
+    parser.add_argument('--seed', type = int, default = 0)
+    parser.add_argument('--out', default = 'benchmark_results.json')
+    parser.add_argument('--compare', default = None, help = "baseline JSON to compare against")
+    args = parser.parse_args()
+    pg.init()
+    results = run_benchmarks(args.types, args.counts, args.frames, args.seed)
+    save_results(results, args.out)
+    if not args.compare is None:
+        for key, ratio in compare_results(args.compare, results).items():
+            print(key, 'update x%.2f' % ratio['update'], 'draw x%.2f' % ratio['draw'])
@@ -0,0 +1,234 @@
+# -*- coding: utf-8 -*-
+"""
+PyGame_ClassExt_smongan1 Package Documentation
+
+This module provides a publish/subscribe event bus, so components do work when something they
+care about changes instead of polling state flags every frame.
+
+Classes:
+- Event: A typed event carrying its source and keyword data, readable as attributes.
+- EventBus: Delivers events to subscribed handlers in priority order, either right away or
+  queued until the end of the game update.
+
+Every Game has an EventBus as game.events. Game.update dispatches the queued events after the
+layer has updated and before the deferred structural changes are applied, so handlers may add and
+remove components freely. Queued events can be published from other threads.
+
+Components (and widgets) can list handlers in an event_handlers class attribute, mapping event
+types to method names (or (method name, priority) pairs). They are subscribed when the component
+is added to a widget, and the subscriptions are dropped once the component is destroyed or removed.
+
+Usage Example:
+```python
+class ResultsShower(Actor):
+    event_handlers = {'new_results' : 'show_results'}
+
+    def show_results(self, event):
+        if not event.source is self.widget:
+            return None
+        ...
+
+# anywhere with access to the game, delivered at the end of the update
+game.events.publish('new_results', source = results_widget, count = 10)
+# delivered before publish returns
+game.events.publish('file_loc_changed', source = widget, immediate = True, file_loc = path)
+game.events.subscribe('case_loaded', on_case_loaded, priority = 10)
+```
+"""
+from collections import deque
+from bisect import insort
+from types import MethodType
+import weakref
+
+class Event():
+    """
+    An event published on an EventBus.
+
+    Event types are strings. Subclasses can set the event_type class attribute, otherwise the
+    class name is used, and can be passed to subscribe in place of the string.
+
+    Parameters:
+    - event_type (str, optional): The type of the event. Default is None, the class's event_type.
+    - source (object, optional): The object the event is about or was published by. Default is None.
+    - **data: Values carried by the event, read as attributes of the event.
+
+    Attributes:
+    - event_type (str): The type of the event.
+    - source (object): The object the event is about.
+    - data (dict): Values carried by the event.
+    - handled (bool): Set by a handler to stop lower priority handlers seeing the event.
+    """
+    event_type = None
+
+    def __init__(self, event_type = None, source = None, **data):
+        if not event_type is None:
+            self.event_type = event_type
+        elif self.event_type is None:
+            self.event_type = type(self).__name__
+        self.source = source
+        self.data = data
+        self.handled = False
+
+    def __getattr__(self, name):
+        data = self.__dict__.get('data', dict())
+        if name in data:
+            return data[name]
+        raise(AttributeError(name))
+
+    def __repr__(self):
+        return 'Event(' + repr(self.event_type) + ', ' + repr(self.data) + ')'
+
+def get_event_type(event_type):
+    """
+    Get the string type of an event type, Event subclass or Event.
+
+    Args:
+        event_type (str, type or Event): The event type.
+
+    Returns:
+        str: The event type string.
+    """
+    if isinstance(event_type, str):
+        return event_type
+    if isinstance(event_type, type):
+        return event_type.event_type or event_type.__name__
+    return event_type.event_type
+
+class EventBus():
+    """
+    Publish/subscribe event bus.
+
+    Handlers are called with the Event, higher priorities first and in subscription order for
+    equal priorities. Bound methods are held through weak references, so a subscription never
+    keeps a component alive, and handlers of destroyed components are dropped when they would
+    next be called. Sleeping components and widgets are woken before their handler is called.
+
+    Attributes:
+    - subscriptions (dict): Subscription records per event type, sorted by priority.
+    - queue (collections.deque): Events waiting for the next dispatch.
+    - published (int): Number of events published.
+    - delivered (int): Number of handler calls made.
+
+    Methods:
+    - subscribe(event_type, handler, priority=0, source=None): Call handler with events of a type, optionally only from one source.
+    - subscribe_handlers(obj): Subscribe the methods named in obj.event_handlers.
+    - unsubscribe(event_type, handler): Stop calling a handler.
+    - unsubscribe_owner(owner): Drop every subscription of an object's methods.
+    - publish(event, source=None, immediate=False, **data): Queue an event, or deliver it right away.
+    - deliver(event): Call the handlers subscribed to an event.
+    - dispatch(): Deliver the queued events, including any published while delivering.
+    - has_subscribers(event_type): Check if an event type has any handlers.
+    - clear(): Forget every subscription and queued event.
+    """
+
+    def __init__(self):
+        self.subscriptions = dict()
+        self.queue = deque()
+        self.order = 0
+        self.published = 0
+        self.delivered = 0
+
+    def subscribe(self, event_type, handler, priority = 0, source = None):
+        event_type = get_event_type(event_type)
+        self.unsubscribe(event_type, handler)
+        owner = None
+        handler_ref = handler
+        if isinstance(handler, MethodType):
+            owner = handler.__self__
+            handler_ref = weakref.WeakMethod(handler)
+        if not source is None:
+            try:
+                source = weakref.ref(source)
+            except TypeError:
+                source = [source]
+        self.order += 1
+        # [sort key, order, handler, owner id, source]
+        insort(self.subscriptions.setdefault(event_type, []),
+               [-priority, self.order, handler_ref,
+                None if owner is None else id(owner), source])
+        return handler
+
+    def subscribe_handlers(self, obj):
+        event_handlers = getattr(obj, 'event_handlers', None)
+        if not event_handlers:
+            return None
+        for event_type, handler in event_handlers.items():
+            priority = 0
+            if not isinstance(handler, str):
+                handler, priority = handler
+            self.subscribe(event_type, getattr(obj, handler), priority)
+
+    def unsubscribe(self, event_type, handler):
+        records = self.subscriptions.get(get_event_type(event_type))
+        if not records:
+            return None
+        records[:] = [record for record in records
+                      if not self.get_handler(record) == handler]
+
+    def unsubscribe_owner(self, owner):
+        owner_id = id(owner)
+        for event_type in list(self.subscriptions):
+            records = self.subscriptions[event_type]
+            records[:] = [record for record in records if record[3] != owner_id]
+            if not records:
+                del self.subscriptions[event_type]
+
+    def get_handler(self, record):
+        handler = record[2]
+        if isinstance(handler, weakref.WeakMethod):
+            return handler()
+        return handler
+
+    def publish(self, event, source = None, immediate = False, **data):
+        if not isinstance(event, Event):
+            event = Event(event, source, **data)
+        self.published += 1
+        if immediate:
+            self.deliver(event)
+        else:
+            self.queue.append(event)
+        return event
+
+    def deliver(self, event):
+        records = self.subscriptions.get(event.event_type)
+        if not records:
+            return event
+        dead = []
+        # copied so handlers can subscribe and unsubscribe while the event is delivered
+        for record in list(records):
+            handler = self.get_handler(record)
+            owner = getattr(handler, '__self__', None)
+            if handler is None or getattr(owner, 'destroyed', False):
+                dead.append(record)
+                continue
+            source = record[4]
+            if not source is None:
+                if isinstance(source, list):
+                    if not source[0] is event.source:
+                        continue
+                elif not source() is event.source:
+                    if source() is None:
+                        dead.append(record)
+                    continue
+            if getattr(owner, 'sleeping', False):
+                owner.wake()
+            self.delivered += 1
+            handler(event)
+            if event.handled:
+                break
+        if dead:
+            dead = set(id(record) for record in dead)
+            records[:] = [record for record in records if not id(record) in dead]
+        return event
+
+    def dispatch(self):
+        queue = self.queue
+        while queue:
+            self.deliver(queue.popleft())
+
+    def has_subscribers(self, event_type):
+        return bool(self.subscriptions.get(get_event_type(event_type)))
+
+    def clear(self):
+        self.subscriptions.clear()
+        self.queue.clear()
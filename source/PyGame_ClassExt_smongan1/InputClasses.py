@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+"""
+PyGame_ClassExt_smongan1 Package Documentation
+
+This module provides an event driven input subsystem for the framework.
+
+Classes:
+- InputState: Keyboard and mouse state built from the pygame event queue, with pressed, released
+  and held sets for every key and mouse button, wheel and motion deltas, and O(1) queries.
+
+The GameHandler feeds every event it pumps into game.input, and Game.update clears the per-update
+edges (pressed, released, wheel, motion and typed text) once the update has run, so an edge is seen
+by exactly one update even when the fixed timestep runs several or none in a frame.
+
+Usage Example:
+```python
+# Inside a component's logic
+if self.game.input.was_pressed(pg.K_SPACE):
+    self.jump()
+if self.game.input.is_held(pg.K_d):
+    self.target += np.array([10, 0])
+if self.game.input.mouse_clicked(1):
+    self.select()
+scroll = self.game.input.wheel[1]
+```
+"""
+import numpy as np
+import pygame as pg
+
+class InputState():
+    """
+    Keyboard and mouse state built from the pygame event queue.
+
+    InputState can be indexed by a key constant like the pg.key.get_pressed() result,
+    so it can stand in for Game.pressed_status.
+
+    Attributes:
+    - held_keys (set): Keys currently held down.
+    - pressed_keys (dict): Keys that went down since the last update, in the order they went down.
+    - released_keys (set): Keys that came up since the last update.
+    - held_buttons (set): Mouse buttons currently held down, 1 is the left button.
+    - pressed_buttons (set): Mouse buttons that went down since the last update.
+    - released_buttons (set): Mouse buttons that came up since the last update.
+    - wheel (numpy.ndarray): Mouse wheel movement since the last update.
+    - motion (numpy.ndarray): Mouse movement in display pixels since the last update.
+    - mouse_pos (numpy.ndarray): Last known mouse position in display pixels.
+    - text (str): Text typed since the last update.
+    - mods (int): Keyboard modifier flags from the last key event.
+
+    Methods:
+    - process_event(event): Update the state from a pygame event.
+    - clear_edges(): Forget the pressed, released, wheel, motion and text since the last update.
+    - release_all(): Release every held key and mouse button, e.g. when the window loses focus.
+    - is_held(key): Check if a key is held down.
+    - was_pressed(key): Check if a key went down since the last update.
+    - was_released(key): Check if a key came up since the last update.
+    - mouse_held(button=1): Check if a mouse button is held down.
+    - mouse_clicked(button=1): Check if a mouse button went down since the last update.
+    - mouse_released(button=1): Check if a mouse button came up since the last update.
+    - mouse_active(): Check if the mouse moved, scrolled or had a button go down or up since the last update.
+    - get_mouse_pressed(): Get the held state of the left, middle and right buttons like pg.mouse.get_pressed().
+    - get_prev_held(): Get the keys that were held at the last update.
+    """
+
+    def __init__(self):
+        self.held_keys = set()
+        self.pressed_keys = dict()
+        self.released_keys = set()
+        self.held_buttons = set()
+        self.pressed_buttons = set()
+        self.released_buttons = set()
+        self.wheel = np.zeros(2)
+        self.motion = np.zeros(2)
+        self.mouse_pos = np.zeros(2)
+        self.text = ""
+        self.mods = 0
+
+    def __getitem__(self, key):
+        return key in self.held_keys
+
+    def process_event(self, event):
+        event_type = event.type
+        if event_type == pg.KEYDOWN:
+            if not event.key in self.held_keys:
+                self.pressed_keys[event.key] = None
+                self.held_keys.add(event.key)
+            self.mods = event.mod
+        elif event_type == pg.KEYUP:
+            self.held_keys.discard(event.key)
+            self.released_keys.add(event.key)
+            self.mods = event.mod
+        elif event_type == pg.MOUSEMOTION:
+            self.motion += event.rel
+            self.mouse_pos[:] = event.pos
+        elif event_type == pg.MOUSEBUTTONDOWN:
+            self.pressed_buttons.add(event.button)
+            self.held_buttons.add(event.button)
+            self.mouse_pos[:] = event.pos
+        elif event_type == pg.MOUSEBUTTONUP:
+            self.held_buttons.discard(event.button)
+            self.released_buttons.add(event.button)
+            self.mouse_pos[:] = event.pos
+        elif event_type == pg.MOUSEWHEEL:
+            self.wheel += [event.x, event.y]
+        elif event_type == pg.TEXTINPUT:
+            self.text += event.text
+        elif event_type == pg.WINDOWFOCUSLOST:
+            # key and button up events go to whichever window has focus now
+            self.release_all()
+
+    def clear_edges(self):
+        self.pressed_keys.clear()
+        self.released_keys.clear()
+        self.pressed_buttons.clear()
+        self.released_buttons.clear()
+        self.wheel[:] = 0
+        self.motion[:] = 0
+        self.text = ""
+
+    def release_all(self):
+        self.released_keys |= self.held_keys
+        self.released_buttons |= self.held_buttons
+        self.held_keys.clear()
+        self.held_buttons.clear()
+
+    def is_held(self, key):
+        return key in self.held_keys
+
+    def was_pressed(self, key):
+        return key in self.pressed_keys
+
+    def was_released(self, key):
+        return key in self.released_keys
+
+    def mouse_held(self, button = 1):
+        return button in self.held_buttons
+
+    def mouse_clicked(self, button = 1):
+        return button in self.pressed_buttons
+
+    def mouse_released(self, button = 1):
+        return button in self.released_buttons
+
+    def mouse_active(self):
+        return bool(self.pressed_buttons or self.released_buttons or 
+                    self.motion.any() or self.wheel.any())
+
+    def get_mouse_pressed(self):
+        return (1 in self.held_buttons, 2 in self.held_buttons, 3 in self.held_buttons)
+
+    def get_prev_held(self):
+        return (self.held_keys | self.released_keys).difference(self.pressed_keys)
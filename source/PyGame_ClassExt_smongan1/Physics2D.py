@@ -124,8 +124,7 @@ class PhysicsActor2D(Actor):
                 self.is_jumping = False
             self.velocity += np.array([0, jump_speed_inc])
             
-        if (44 in self.game.held_index and
-            44 not in self.game.prev_held and self.jump_count < self.num_jumps):
+        if self.game.input.was_pressed(pg.K_SPACE) and self.jump_count < self.num_jumps:
             self.is_jumping = True
             self.jump_count += 1
             
@@ -147,6 +146,7 @@ class PhysicsActor2D(Actor):
                 self.velocity[1] += self.fall_speed * self.game.dt * self.fall_inc
     
 class COM():
+    __slots__ = ('mass', 'position_offset')
     
     def __init__(self, mass = 0, position_offset = np.array([0, 0])):
         self.mass = mass
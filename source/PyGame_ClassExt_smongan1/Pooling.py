@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+"""
+PyGame_ClassExt_smongan1 Package Documentation
+
+This module provides object pooling for short-lived actors such as projectiles.
+
+Classes:
+- ActorPool: Keeps destroyed Actors (and AnimatedActors) for reuse. Acquiring an actor resets its
+  per-life state and adds it to a widget, and destroying or killing it hands it back to the pool
+  once it has been removed, so burst spawning costs no construction, disk I/O or AddAnimation calls.
+
+Usage Example:
+```python
+def make_fireball():
+    p = Projectile([0, 0], size = [50, 50], death_timer_limit = .075)
+    p.AddAnimation('fireball', path = game.assets_folder, frame_wait = 10, scale = 2)
+    return p
+
+pool = ActorPool(make_fireball, capacity = 20)
+p = pool.acquire(widget, position = start, target = cursor_loc)
+p.rotate_animations()
+# p.kill() later returns it to the pool at the end of the update
+print(pool.get_stats())
+```
+"""
+
+class ActorPool():
+    """
+    Pool of reusable actors built by a factory.
+
+    Parameters:
+    - factory (function): Called with no arguments, returns a new, unattached actor.
+    - capacity (int, optional): Number of actors built up front. Default is 0.
+    - max_size (int, optional): Most free actors kept, extra released actors are dropped. Default is None, no limit.
+
+    Attributes:
+    - factory (function): Builds a new actor when the pool is empty.
+    - max_size (int or None): Most free actors kept.
+    - free (list): Actors ready to be acquired.
+    - in_use (int): Number of acquired actors not yet released.
+    - created (int): Number of actors built by the factory.
+    - acquired (int): Number of acquire calls.
+    - reused (int): Number of acquire calls served from the free list.
+    - released (int): Number of actors handed back.
+    - dropped (int): Number of released actors discarded because the pool was full.
+    - peak_in_use (int): Largest number of actors in use at once.
+
+    Methods:
+    - preallocate(count): Build actors until count are free.
+    - acquire(widget=None, **attrs): Get a reset actor, set attrs on it and add it to the widget.
+    - release(actor): Hand an actor back, called once a destroyed pooled actor has been removed.
+    - get_stats(): Get the pool counters as a dictionary.
+
+    A pickled pool keeps its counters but not its free actors or its factory, set factory again
+    after loading it.
+    """
+
+    def __init__(self, factory, capacity = 0, max_size = None):
+        self.factory = factory
+        self.max_size = max_size
+        self.free = []
+        self.in_use = 0
+        self.created = 0
+        self.acquired = 0
+        self.reused = 0
+        self.released = 0
+        self.dropped = 0
+        self.peak_in_use = 0
+        self.preallocate(capacity)
+
+    def __len__(self):
+        return len(self.free)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['free'] = []
+        state['factory'] = None
+        return state
+
+    def new_actor(self):
+        if self.factory is None:
+            raise(Exception('ActorPool has no factory, set pool.factory after loading the pool'))
+        actor = self.factory()
+        actor.pool = self
+        self.created += 1
+        return actor
+
+    def preallocate(self, count):
+        while len(self.free) < count:
+            self.free.append(self.new_actor())
+
+    def acquire(self, widget = None, **attrs):
+        self.acquired += 1
+        if self.free:
+            actor = self.free.pop()
+            self.reused += 1
+        else:
+            actor = self.new_actor()
+        actor.reset_state()
+        for attr, value in attrs.items():
+            actor.__setattr__(attr, value)
+        self.in_use += 1
+        self.peak_in_use = max(self.peak_in_use, self.in_use)
+        if not widget is None:
+            widget.add_actor(actor)
+        return actor
+
+    def release(self, actor):
+        self.in_use -= 1
+        self.released += 1
+        if not self.max_size is None and len(self.free) >= self.max_size:
+            actor.pool = None
+            self.dropped += 1
+            return None
+        self.free.append(actor)
+
+    def get_stats(self):
+        return {'free' : len(self.free),
+                'in_use' : self.in_use,
+                'peak_in_use' : self.peak_in_use,
+                'created' : self.created,
+                'acquired' : self.acquired,
+                'reused' : self.reused,
+                'released' : self.released,
+                'dropped' : self.dropped,
+                'hit_rate' : self.reused/self.acquired if self.acquired else 0}
@@ -0,0 +1,288 @@
+# -*- coding: utf-8 -*-
+"""
+PyGame_ClassExt_smongan1 Package Documentation
+
+This module provides an opt-in profiler for timing each phase of the game loop.
+
+Classes:
+- FrameProfiler: Records timed sections of each frame (event pump, Game.update, Layer.update,
+  Widget update passes, component updates and draws, scaling and present), aggregates them
+  per layer, widget and component class, and exports Chrome trace-event JSON.
+- ProfileSection: Context manager timing a single section for a FrameProfiler.
+- FrameStatistics: Fixed-size rolling window of frame, update and draw times with percentiles,
+  jank-frame counts and periodic JSONL dumps.
+
+Usage Example:
+```python
+# Enable the profiler when creating the handler
+handler = GameHandler(game, profile = True)
+handler.run()
+
+# Find which sections blow the frame budget and write a trace for chrome://tracing
+print(handler.profiler.over_budget(1/60))
+handler.profiler.export_chrome_trace('trace.json')
+
+# Rolling frame statistics are always collected by the handler
+print(handler.stats.get_summary()['frame']['p99'])
+```
+"""
+from collections import deque
+from contextlib import nullcontext
+from time import perf_counter
+import numpy as np
+import threading
+import json
+import os
+
+NULL_SECTION = nullcontext()
+
+class ProfileSection():
+    """
+    Context manager timing a single section for a FrameProfiler.
+
+    Parameters:
+    - profiler (FrameProfiler): The profiler the timing is recorded into.
+    - name (str): Name of the section, e.g. a widget id or component class name.
+    - cat (str): Category of the section, e.g. 'widget.update' or 'component.draw'.
+    - args (dict, optional): Extra data stored with the trace event. Default is None.
+    """
+    __slots__ = ('profiler', 'name', 'cat', 'args', 'start')
+
+    def __init__(self, profiler, name, cat, args = None):
+        self.profiler = profiler
+        self.name = name
+        self.cat = cat
+        self.args = args
+
+    def __enter__(self):
+        self.start = perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.profiler.record(self.name, self.cat, self.start, perf_counter(), self.args)
+        return False
+
+class FrameProfiler():
+    """
+    Opt-in per-phase frame profiler.
+
+    While disabled, section() returns a shared no-op context manager so the
+    instrumented game loop only pays for a method call per section.
+
+    Parameters:
+    - enabled (bool, optional): Flag indicating whether sections are recorded. Default is False.
+    - max_events (int, optional): Number of trace events kept for export, oldest are dropped first. Default is 200000.
+
+    Attributes:
+    - enabled (bool): Flag indicating whether sections are recorded.
+    - events (deque): Recorded trace events as (name, cat, start, duration, frame, thread, args) tuples.
+    - stats (dict): Aggregated [count, total, max] seconds keyed by (cat, name).
+    - frame (int): Index of the current frame.
+    - origin (float): perf_counter value trace timestamps are measured from.
+
+    Methods:
+    - enable(): Start recording sections.
+    - disable(): Stop recording sections.
+    - reset(): Clear recorded events and statistics.
+    - section(name, cat='phase', args=None): Get a context manager timing a section.
+    - record(name, cat, start, end, args=None): Record a finished section.
+    - begin_frame(): Mark the start of a frame.
+    - end_frame(): Mark the end of a frame, recording it as a 'frame' section.
+    - get_breakdown(cat=None): Get count, total, mean and max seconds per section, slowest total first.
+    - over_budget(budget=1/60, cat=None): Get the sections whose slowest call exceeded the budget.
+    - to_chrome_trace(): Get the recorded events as a Chrome trace-event dictionary.
+    - export_chrome_trace(path): Write the Chrome trace-event JSON to a file.
+    """
+
+    def __init__(self, enabled = False, max_events = 200000):
+        self.enabled = enabled
+        self.events = deque(maxlen = max_events)
+        self.stats = dict()
+        self.frame = 0
+        self.frame_start = None
+        self.origin = perf_counter()
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def reset(self):
+        self.events.clear()
+        self.stats = dict()
+        self.frame = 0
+        self.frame_start = None
+        self.origin = perf_counter()
+
+    def section(self, name, cat = 'phase', args = None):
+        if not self.enabled:
+            return NULL_SECTION
+        return ProfileSection(self, name, cat, args)
+
+    def record(self, name, cat, start, end, args = None):
+        duration = end - start
+        self.events.append((name, cat, start, duration, self.frame, 
+                            threading.get_ident(), args))
+        key = (cat, name)
+        if key in self.stats:
+            stat = self.stats[key]
+            stat[0] += 1
+            stat[1] += duration
+            if duration > stat[2]:
+                stat[2] = duration
+        else:
+            self.stats[key] = [1, duration, duration]
+
+    def begin_frame(self):
+        if self.enabled:
+            self.frame_start = perf_counter()
+
+    def end_frame(self):
+        if self.enabled and not self.frame_start is None:
+            self.record('frame', 'frame', self.frame_start, perf_counter())
+            self.frame_start = None
+        self.frame += 1
+
+    def get_breakdown(self, cat = None):
+        breakdown = {key : {'count' : count, 'total' : total,
+                            'mean' : total/count, 'max' : max_time}
+                     for key, [count, total, max_time] in self.stats.items()
+                     if cat is None or key[0] == cat}
+        return dict(sorted(breakdown.items(), key = lambda x: -x[1]['total']))
+
+    def over_budget(self, budget = 1/60, cat = None):
+        return {key : stat for key, stat in self.get_breakdown(cat).items()
+                if stat['max'] > budget}
+
+    def to_chrome_trace(self):
+        trace_events = []
+        thread_ids = dict()
+        for name, cat, start, duration, frame, thread, args in self.events:
+            event_args = {'frame' : frame}
+            if args:
+                event_args.update(args)
+            trace_events.append({'name' : str(name), 'cat' : cat, 'ph' : 'X',
+                                 'ts' : (start - self.origin) * 1e6,
+                                 'dur' : duration * 1e6,
+                                 'pid' : os.getpid(), 
+                                 'tid' : thread_ids.setdefault(thread, len(thread_ids)),
+                                 'args' : event_args})
+        return {'traceEvents' : trace_events, 'displayTimeUnit' : 'ms'}
+
+    def export_chrome_trace(self, path):
+        with open(path, 'w') as f:
+            json.dump(self.to_chrome_trace(), f)
+
+class FrameStatistics():
+    """
+    Fixed-size rolling window of per-frame timings.
+
+    Only the last `capacity` frames are kept, so memory stays bounded however long
+    the game runs. All-time frame, jank and max counters are streamed alongside the window.
+
+    Parameters:
+    - capacity (int, optional): Number of frames kept in the rolling window. Default is 3600.
+    - budget (float, optional): Target frame time in seconds. Default is 1/60.
+    - jank_factor (float, optional): Frames longer than jank_factor * budget count as jank. Default is 1.5.
+    - dump_path (str, optional): JSONL file summaries are appended to. Default is None.
+    - dump_interval (int, optional): Append a summary to dump_path every dump_interval frames. Default is None.
+
+    Attributes:
+    - capacity (int): Number of frames kept in the rolling window.
+    - budget (float): Target frame time in seconds.
+    - jank_factor (float): Multiple of the budget above which a frame counts as jank.
+    - series (dict): Ring buffers of 'frame', 'update' and 'draw' times, unrecorded values are nan.
+    - index (int): Position the next frame is written to.
+    - count (int): Number of frames currently in the window.
+    - total_frames (int): Number of frames recorded since the last reset.
+    - jank_frames (int): Number of jank frames recorded since the last reset.
+    - max_times (dict): Slowest time per series since the last reset.
+    - dump_path (str): JSONL file summaries are appended to.
+    - dump_interval (int): Number of frames between automatic dumps.
+
+    Methods:
+    - add(frame=None, update=None, draw=None): Record the timings of one frame.
+    - get_values(name='frame'): Get the window of a series in recording order.
+    - percentile(q, name='frame'): Get a percentile of a series over the window.
+    - get_summary(): Get p50/p95/p99, mean and max per series plus jank counts.
+    - dump_jsonl(path=None): Append the summary to a JSONL file.
+    - reset(): Clear the window and all-time counters.
+    """
+    series_names = ('frame', 'update', 'draw')
+
+    def __init__(self, capacity = 3600, budget = 1/60, jank_factor = 1.5, 
+                 dump_path = None, dump_interval = None):
+        self.capacity = capacity
+        self.budget = budget
+        self.jank_factor = jank_factor
+        self.dump_path = dump_path
+        self.dump_interval = dump_interval
+        self.reset()
+
+    def reset(self):
+        self.series = {name : np.full(self.capacity, np.nan) for name in self.series_names}
+        self.index = 0
+        self.count = 0
+        self.total_frames = 0
+        self.jank_frames = 0
+        self.max_times = {name : 0 for name in self.series_names}
+
+    def __len__(self):
+        return self.count
+
+    def add(self, frame = None, update = None, draw = None):
+        for name, value in zip(self.series_names, [frame, update, draw]):
+            if value is None:
+                self.series[name][self.index] = np.nan
+                continue
+            self.series[name][self.index] = value
+            if value > self.max_times[name]:
+                self.max_times[name] = value
+        if not frame is None and frame > self.jank_factor * self.budget:
+            self.jank_frames += 1
+        self.index = (self.index + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+        self.total_frames += 1
+        if (self.dump_interval and not self.dump_path is None and 
+            self.total_frames % self.dump_interval == 0):
+            self.dump_jsonl()
+
+    def get_values(self, name = 'frame'):
+        values = self.series[name]
+        if self.count < self.capacity:
+            values = values[:self.count]
+        else:
+            values = np.concatenate([values[self.index:], values[:self.index]])
+        return values[~np.isnan(values)]
+
+    def percentile(self, q, name = 'frame'):
+        values = self.get_values(name)
+        if not len(values):
+            return 0
+        return float(np.percentile(values, q))
+
+    def get_summary(self):
+        summary = {'total_frames' : self.total_frames,
+                   'window_frames' : self.count,
+                   'jank_frames' : self.jank_frames}
+        frame_times = self.get_values('frame')
+        summary['window_jank_frames'] = int(np.sum(frame_times > self.jank_factor * self.budget))
+        for name in self.series_names:
+            values = self.get_values(name)
+            if not len(values):
+                continue
+            p50, p95, p99 = np.percentile(values, [50, 95, 99])
+            summary[name] = {'p50' : float(p50), 'p95' : float(p95), 'p99' : float(p99),
+                             'mean' : float(values.mean()), 
+                             'window_max' : float(values.max()),
+                             'max' : float(self.max_times[name])}
+        return summary
+
+    def dump_jsonl(self, path = None):
+        if path is None:
+            path = self.dump_path
+        summary = self.get_summary()
+        summary['time'] = perf_counter()
+        with open(path, 'a') as f:
+            f.write(json.dumps(summary) + '\n')
@@ -198,20 +198,14 @@ class Inventory(Widget):
             AddItem(self, item_name, number - 1)
     
     def get_inventory_locs(self):
-        positions = []
-        for item_name in self.buttons:
-            if item_name.startswith('button_item'):
-                positions.append(self.buttons[item_name])
-        return positions
+        return [item.position for item in self.query('buttons', prefix = 'button_item_')]
     
     def sort_by_name(self, reverse = False):
         item_names = []
         positions = []
-        for item_name in self.buttons:
-            if item_name.startswith('button_item'):
-                item = self.buttons[item_name]
-                item_names.append([item.name, item])
-                positions.append(item.position[1])
+        for item in self.query('buttons', prefix = 'button_item_'):
+            item_names.append([item.name, item])
+            positions.append(item.position[1])
         positions = sorted(positions, reverse = reverse)
         item_names = sorted(item_names, key = lambda x:x[0], reverse = reverse)
         for [item, position] in zip(item_names, positions):
@@ -219,44 +213,28 @@ class Inventory(Widget):
         self.sort_type = self.sort_by_name
         
     def sort_by_type(self, reverse = False):
-        types = set()
-        positions = []
-        for item_name in self.buttons:
-            if item_name.startswith('button_item'):
-                types = self.buttons[item_name]
-        types = sorted(types, reverse = reverse)
-        positions = []
-        pos_ind = 0
         items_dict = self.get_item_type_dictionary()
+        types = sorted(items_dict, reverse = reverse)
+        positions = sorted([item.position[1] for items in items_dict.values() for item in items], 
+                           reverse = reverse)
         for item_type in types:
             for item in sorted(items_dict[item_type], key = lambda x: x.name):
-                item.position = positions[0]
+                item.position[1] = positions[0]
                 positions = positions[1:]
         self.sort_type = self.sort_by_type
         
     def get_item_by_name(self, name):
-        item_name_buttons = []
-        for button_name in self.buttons:
-            if button_name.startswith('button_item_' + name):
-                item_name_buttons.append(self.buttons[button_name])
-        return item_name_buttons
+        return self.query('buttons', prefix = 'button_item_' + name + '_')
     
     def get_item_by_type(self, item_type):
-        item_type_buttons = []
-        for button_name in self.buttons:
-            if (button_name.startswith('button_item_') 
-            and self.buttons[button_name].item_type == item_type):
-                item_type_buttons.append(self.buttons[button_name])
-        return item_type_buttons
+        return self.query('buttons', prefix = 'button_item_', item_type = item_type)
     
     def get_item_type_dictionary(self):
         item_type_buttons_dict = dict()
-        for button_name in self.buttons:
-            if button_name.startswith('button_item_'):
-                item = self.buttons[button_name]
-                if not item.item_type in item_type_buttons:
-                    item_type_buttons_dict[item.item_type] = []
-                item_type_buttons_dict[item.item_type].append(item)
+        for item in self.query('buttons', prefix = 'button_item_'):
+            if not item.item_type in item_type_buttons_dict:
+                item_type_buttons_dict[item.item_type] = []
+            item_type_buttons_dict[item.item_type].append(item)
         return item_type_buttons_dict
     
     def resize(self):
@@ -264,7 +242,7 @@ class Inventory(Widget):
         
     def delete_item(self, item_id):
         self.max_position = self.max_position - self.buttons[item_id].size[1]
-        del self.buttons[item_id]
+        self.remove_component(item_id)
         if hasattr(self, "self.sort_type") and not self.sort_type is None:
             self.sort_type()
 
@@ -282,7 +260,7 @@ class ScrollBar(Actor):
     - logic(self): Handle the logic for scrollbar interactions, such as hover, press, and movement.
     - move_actor_and_widget(self, pos_diff): Move both the scrollbar actor and associated widget.
     - move_widget(self): Move the associated widget based on the scrollbar position.
-    - move_actor(self, pos_diff): Move the scrollbar actor based on cursor interactions.
+    - move_actor(self, pos_diff): Move the scrollbar actor based on cursor interactions, publishing a 'scroll' event with the new relative position when it moves.
     - get_relative_position(self): Get the relative position of the scrollbar within the valid scroll range.
     
     Usage Example:
@@ -296,6 +274,9 @@ class ScrollBar(Actor):
     # Add the scrollbar to a widget
     widget.add_actor(scroll_bar)
     """
+    # set lazily, hasattr is False until they are first assigned
+    __slots__ = ('prev_cursor_loc', 'scroll_range', 'orig_color', 'widget_to_scroll',
+                 'widget_to_scroll_id')
     
     def logic(self):
         if not hasattr(self, 'prev_cursor_loc'):
@@ -310,10 +291,12 @@ class ScrollBar(Actor):
                 if not hasattr(self, 'orig_color'):
                     self.orig_color = self.surf.get_at([0,0])[:3]
                 self.surf.fill([x+20 for x in self.orig_color])
+                self.mark_dirty()
             self.is_pressed = True
         else: 
             if self.is_pressed:
                 self.surf.fill(self.orig_color)
+                self.mark_dirty()
             self.is_pressed = False
             
         if self.is_pressed:
@@ -349,9 +332,13 @@ class ScrollBar(Actor):
         self.widget_to_scroll.position[1] = def_pos +  relative_widget_pos
         
     def move_actor(self, pos_diff):
+        prev_position = self.position[1]
         self.position[1] = max(min((self.position[1] + pos_diff), 
                                    self.scroll_range[1]), 
                                self.scroll_range[0])
+        if self.position[1] != prev_position and self.game:
+            self.game.events.publish('scroll', source = self, 
+                                     position = self.get_relative_position())
     
     def get_relative_position(self):
         if not hasattr(self, 'scroll_range'):
@@ -0,0 +1,337 @@
+# -*- coding: utf-8 -*-
+"""
+PyGame_ClassExt_smongan1 Package Documentation
+
+This module provides the component registry shared by a game, its layers and widgets.
+
+Classes:
+- ComponentRegistry: Registers every layer, widget and component of a game under an integer handle
+  and a string id alias, and keeps the id dicts of the game, layer and widget the component is
+  listed in (e.g. widget.actors, layer.actors, game.actors) in step, so adding or removing a
+  component is a single call and lookups by id, handle, type, layer or widget are O(1).
+  Secondary indexes by class, tag, id prefix and chosen attributes back the query method.
+
+Usage Example:
+```python
+registry = game.registry
+handle = registry.add(actor, 'actors', [widget, widget.layer, game])
+registry.get(handle) is registry.get(actor.id) is actor
+registry.get(actor.id, widget)       # only found if the actor is listed in widget
+registry.get_type('actors')          # every registered actor
+registry.remove(actor)               # drops it from widget, layer and game in one go
+
+registry.add_tag(actor, 'enemy')
+registry.add_index('item_type')
+registry.query(tags = ['enemy'], scope = widget)
+registry.query('buttons', prefix = 'button_item_', item_type = 'Potion')
+```
+"""
+from bisect import bisect_left, insort
+
+MISSING = object()
+
+def remove_from_index(index, key, handle):
+    """
+    Remove a handle from one bucket of a secondary index, dropping the bucket once it is empty.
+
+    Args:
+        index (dict): Buckets of objects keyed by handle, keyed by the indexed key.
+        key: The bucket the handle is stored under.
+        handle (int): The handle to remove.
+    """
+    bucket = index.get(key)
+    if bucket is None:
+        return None
+    bucket.pop(handle, None)
+    if not bucket:
+        del index[key]
+
+class ComponentRegistry():
+    """
+    Registry of a game's layers, widgets and components.
+
+    Every registered object gets an integer handle (stored as obj.handle) and its string id is
+    kept as an alias to that handle, both globally and within each scope (the game, layer or
+    widget objects it is listed in). The registry is the only writer of the scopes' id dicts.
+
+    Attributes:
+    - next_handle (int): The handle given to the next registered object.
+    - records (dict): [obj, comp_type, scopes, id] keyed by handle.
+    - aliases (dict): Handle keyed by string id, the latest registration wins on duplicate ids.
+    - scoped_aliases (dict): Handle keyed by (id(scope), string id).
+    - types (dict): Registered objects keyed by handle, per component type.
+    - indices (dict): Counter used to generate ids, per component type.
+    - classes (dict): Registered objects keyed by handle, per exact class.
+    - tags (dict): Registered objects keyed by handle, per tag in their tags set.
+    - sorted_ids (list): Sorted (id, handle) pairs, searched with bisect for id prefixes.
+    - attr_indexes (dict): Registered objects keyed by handle, per value, per indexed attribute name.
+    - indexed_values (dict): The indexed attribute values of each handle, as last indexed.
+
+    Methods:
+    - new_id(comp_type): Get an unused id with the type's prefix.
+    - make_id(obj, comp_type): Give obj a new id with its type's prefix, or add the prefix to the id it has.
+    - add(obj, comp_type, scopes=()): Register obj and list it in the scopes' comp_type dicts.
+    - remove(key): Unregister a component by object, handle or id and drop it from its scopes.
+    - get_handle(key, scope=None): Get the handle of an object, handle or id.
+    - get(key, scope=None): Get a component by handle or id, optionally only if it is listed in scope.
+    - get_record(key): Get the [obj, comp_type, scopes, id] record of a component.
+    - get_type(comp_type, scope=None): Get every component of a type, optionally within a scope.
+    - get_scopes(key): Get the objects a component is listed in.
+    - get_prefix(prefix): Get the components whose id starts with prefix, keyed by handle.
+    - get_scope_dicts(scope): Get the id dicts a scope holds components in.
+    - add_tag(key, tag): Tag a component, it is stored in the component's tags set.
+    - remove_tag(key, tag): Remove a tag from a component.
+    - add_index(attr): Index every component by the value of an attribute.
+    - reindex(key, attrs=None): Update the attribute indexes of a component after its attributes changed.
+    - set_attr(key, attr, value): Set an attribute of a component and update its index.
+    - query(comp_type=None, cls=None, tags=None, prefix=None, scope=None, **attrs): Get the components matching every criterion.
+
+    Scopes with on_register(obj, comp_type) or on_unregister(obj, comp_type) methods are told
+    when a component is listed in or dropped from them, widgets and layers use this to keep
+    their active sets.
+
+    Indexed attributes are read when a component is registered and when it is reindexed, so
+    code changing an indexed attribute afterwards should use set_attr or reindex. Components
+    whose value changed away from the queried one are still filtered out of query results.
+    """
+    prefixes = {'layers' : '',
+                'widgets' : 'widget_',
+                'actors' : 'actor_',
+                'buttons' : 'button_',
+                'textboxs' : 'textbox_',
+                'graphics' : 'graphic_'}
+
+    def __init__(self):
+        self.next_handle = 0
+        self.records = dict()
+        self.aliases = dict()
+        self.scoped_aliases = dict()
+        self.types = {comp_type : dict() for comp_type in self.prefixes}
+        self.indices = {comp_type : 0 for comp_type in self.prefixes}
+        self.classes = dict()
+        self.tags = dict()
+        self.sorted_ids = []
+        self.attr_indexes = dict()
+        self.indexed_values = dict()
+
+    def __len__(self):
+        return len(self.records)
+
+    def __contains__(self, key):
+        return not self.get_handle(key) is None
+
+    def new_id(self, comp_type):
+        prefix = self.prefixes.get(comp_type, comp_type[:-1] + '_')
+        while True:
+            new_id = prefix + str(self.indices.get(comp_type, 0))
+            self.indices[comp_type] = self.indices.get(comp_type, 0) + 1
+            if not new_id in self.aliases:
+                return new_id
+
+    def make_id(self, obj, comp_type):
+        prefix = self.prefixes.get(comp_type, comp_type[:-1] + '_')
+        if getattr(obj, 'id', None) is None:
+            obj.id = self.new_id(comp_type)
+        elif not obj.id.startswith(prefix):
+            obj.id = prefix + obj.id
+        return obj.id
+
+    def add(self, obj, comp_type, scopes = ()):
+        if comp_type not in self.types:
+            self.types[comp_type] = dict()
+            self.indices[comp_type] = 0
+        if not self.get_handle(obj) is None:
+            self.remove(obj)
+        handle = self.next_handle
+        self.next_handle += 1
+        obj.handle = handle
+        scopes = tuple(scopes)
+        self.records[handle] = [obj, comp_type, scopes, obj.id]
+        self.types[comp_type][handle] = obj
+        self.aliases[obj.id] = handle
+        for scope in scopes:
+            self.scoped_aliases[(id(scope), obj.id)] = handle
+            scope.__getattribute__(comp_type)[obj.id] = obj
+            on_register = getattr(scope, 'on_register', None)
+            if not on_register is None:
+                on_register(obj, comp_type)
+        self.classes.setdefault(type(obj), dict())[handle] = obj
+        insort(self.sorted_ids, (obj.id, handle))
+        for tag in getattr(obj, 'tags', ()):
+            self.tags.setdefault(tag, dict())[handle] = obj
+        self.indexed_values[handle] = dict()
+        self.reindex(handle)
+        return handle
+
+    def remove(self, key):
+        handle = self.get_handle(key)
+        if handle is None:
+            return None
+        obj, comp_type, scopes, obj_id = self.records.pop(handle)
+        del self.types[comp_type][handle]
+        if self.aliases.get(obj_id) == handle:
+            del self.aliases[obj_id]
+        for scope in scopes:
+            if self.scoped_aliases.get((id(scope), obj_id)) == handle:
+                del self.scoped_aliases[(id(scope), obj_id)]
+            store = scope.__getattribute__(comp_type)
+            if store.get(obj_id) is obj:
+                del store[obj_id]
+            on_unregister = getattr(scope, 'on_unregister', None)
+            if not on_unregister is None:
+                on_unregister(obj, comp_type)
+        remove_from_index(self.classes, type(obj), handle)
+        ind = bisect_left(self.sorted_ids, (obj_id, handle))
+        if ind < len(self.sorted_ids) and self.sorted_ids[ind] == (obj_id, handle):
+            del self.sorted_ids[ind]
+        for tag in getattr(obj, 'tags', ()):
+            remove_from_index(self.tags, tag, handle)
+        for attr, value in self.indexed_values.pop(handle).items():
+            remove_from_index(self.attr_indexes[attr], value, handle)
+        return obj
+
+    def get_handle(self, key, scope = None):
+        if isinstance(key, int):
+            handle = key
+        elif isinstance(key, str) or key is None:
+            if scope is None:
+                return self.aliases.get(key)
+            return self.scoped_aliases.get((id(scope), key))
+        else:
+            # a registered object, checked against the record so stale handles are ignored
+            handle = getattr(key, 'handle', None)
+            if not handle in self.records or not self.records[handle][0] is key:
+                return None
+        if not handle in self.records:
+            return None
+        if not scope is None and not any(x is scope for x in self.records[handle][2]):
+            return None
+        return handle
+
+    def get(self, key, scope = None):
+        handle = self.get_handle(key, scope)
+        if handle is None:
+            return None
+        return self.records[handle][0]
+
+    def get_record(self, key):
+        handle = self.get_handle(key)
+        if handle is None:
+            return None
+        return self.records[handle]
+
+    def get_type(self, comp_type, scope = None):
+        if scope is None:
+            return list(self.types.get(comp_type, dict()).values())
+        return list(scope.__getattribute__(comp_type).values())
+
+    def get_scopes(self, key):
+        record = self.get_record(key)
+        if record is None:
+            return ()
+        return record[2]
+
+    def add_tag(self, key, tag):
+        handle = self.get_handle(key)
+        if handle is None:
+            return None
+        obj = self.records[handle][0]
+        if not hasattr(obj, 'tags'):
+            obj.tags = set()
+        obj.tags.add(tag)
+        self.tags.setdefault(tag, dict())[handle] = obj
+
+    def remove_tag(self, key, tag):
+        handle = self.get_handle(key)
+        if handle is None:
+            return None
+        obj = self.records[handle][0]
+        getattr(obj, 'tags', set()).discard(tag)
+        remove_from_index(self.tags, tag, handle)
+
+    def add_index(self, attr):
+        if attr in self.attr_indexes:
+            return None
+        self.attr_indexes[attr] = dict()
+        for handle in self.records:
+            self.reindex(handle, [attr])
+
+    def reindex(self, key, attrs = None):
+        handle = self.get_handle(key)
+        if handle is None:
+            return None
+        obj = self.records[handle][0]
+        values = self.indexed_values[handle]
+        if attrs is None:
+            attrs = self.attr_indexes
+        for attr in attrs:
+            index = self.attr_indexes[attr]
+            if attr in values:
+                remove_from_index(index, values.pop(attr), handle)
+            value = getattr(obj, attr, MISSING)
+            if value is MISSING:
+                continue
+            try:
+                index.setdefault(value, dict())[handle] = obj
+            except TypeError:
+                # unhashable values are left to the attribute filter in query
+                continue
+            values[attr] = value
+
+    def set_attr(self, key, attr, value):
+        obj = self.get(key)
+        if obj is None:
+            return None
+        obj.__setattr__(attr, value)
+        if attr in self.attr_indexes:
+            self.reindex(obj, [attr])
+
+    def get_prefix(self, prefix):
+        start = bisect_left(self.sorted_ids, (prefix,))
+        end = bisect_left(self.sorted_ids, (prefix + '\uffff',))
+        return {handle : self.records[handle][0] for _, handle in self.sorted_ids[start:end]}
+
+    def query(self, comp_type = None, cls = None, tags = None, prefix = None, scope = None, **attrs):
+        # every indexed criterion gives a bucket of candidates, only the smallest one is walked
+        buckets = []
+        if not comp_type is None:
+            buckets.append(self.types.get(comp_type, dict()))
+        if not tags is None:
+            if isinstance(tags, str):
+                tags = [tags]
+            buckets += [self.tags.get(tag, dict()) for tag in tags]
+        if not prefix is None:
+            buckets.append(self.get_prefix(prefix))
+        for attr, value in attrs.items():
+            if attr in self.attr_indexes:
+                try:
+                    buckets.append(self.attr_indexes[attr].get(value, dict()))
+                except TypeError:
+                    continue
+        if buckets:
+            candidates = min(buckets, key = len).items()
+        elif not cls is None:
+            candidates = [(handle, obj) for klass, bucket in self.classes.items()
+                          if issubclass(klass, cls) for handle, obj in bucket.items()]
+        elif not scope is None:
+            candidates = [(obj.handle, obj) for comp_dict in self.get_scope_dicts(scope)
+                          for obj in comp_dict.values()]
+        else:
+            candidates = [(handle, record[0]) for handle, record in self.records.items()]
+        out = []
+        for handle, obj in candidates:
+            if not all(handle in bucket for bucket in buckets):
+                continue
+            if not cls is None and not isinstance(obj, cls):
+                continue
+            if not scope is None and not any(x is scope for x in self.records[handle][2]):
+                continue
+            if not all(getattr(obj, attr, MISSING) == value for attr, value in attrs.items()):
+                continue
+            out.append(obj)
+        if not prefix is None:
+            out.sort(key = lambda x: x.id)
+        return out
+
+    def get_scope_dicts(self, scope):
+        return [scope.__getattribute__(x) for x in self.types if hasattr(scope, x)]
@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+"""
+PyGame_ClassExt_smongan1 Package Documentation
+
+This module provides active-set scheduling, so idle components cost nothing per frame.
+
+Classes:
+- Sleepable: A mixin letting components and widgets sleep, skipping their updates until they are
+  woken by a timer, an event, the mouse or an explicit wake.
+- Scheduler: Keeps the game time and the timed wakes, and moves objects between the active and
+  sleeping sets of their widget (or layer, for widgets).
+
+Every Widget keeps its awake components per type in widget.active and its sleeping ones in
+widget.asleep, and only updates the awake ones. Every Layer does the same for its widgets.
+Sleeping components are still drawn each frame, a sleeping widget skips its updates and reuses
+the surface its components were last drawn onto.
+
+Objects are woken by:
+- wake(), or sleep(duration) once the duration has passed.
+- An event delivered to one of their methods subscribed on game.events.
+- The mouse moving, scrolling or clicking over them, when wake_on_hover is True.
+- mark_dirty(), or to_update_attrs being assigned.
+- A component of a sleeping widget waking.
+
+Components with auto_sleep set go back to sleep after any update in which is_idle() is True.
+Graphics sleep while they have no update passes, textboxes while they are not selected and
+buttons while they are neither hovered nor pressed, actors and widgets only sleep when asked to
+(or when auto_sleep is set on them).
+
+Usage Example:
+```python
+# a background widget nothing will change, woken by clicks over it
+widget.sleep()
+# an enemy waiting for two seconds
+enemy.sleep(2)
+# a widget that goes to sleep whenever all of its components are asleep
+class StaticPanel(Widget):
+    auto_sleep = True
+print(game.scheduler.get_stats())
+```
+"""
+from heapq import heappush, heappop
+import weakref
+
+class Sleepable():
+    """
+    A mixin class letting an object be taken out of its widget's (or layer's) active set.
+
+    Attributes:
+    - slot_names (tuple): Names of the per-object attributes kept by the mixin, for classes using __slots__.
+    - sleeping (bool): Flag indicating whether the object is asleep and skipped by the update loops.
+    - wake_time (float or None): Game time the object wakes at, None if it sleeps until woken.
+    - auto_sleep (bool): Flag indicating whether the object goes to sleep after an update in which it is idle.
+    - wake_on_hover (bool): Flag indicating whether mouse activity over the object wakes it.
+    - sleep_scope (str): Name of the attribute holding the widget or layer keeping the active set.
+
+    Methods:
+    - sleep(self, duration=None): Stop updating the object, until woken or for duration seconds of game time.
+    - wake(self): Start updating the object again.
+    - is_idle(self): Check if an update would do nothing, used by auto_sleep.
+    """
+    __slots__ = ()
+    slot_names = ('sleeping', 'wake_time')
+    sleeping = False
+    wake_time = None
+    auto_sleep = False
+    wake_on_hover = True
+    sleep_scope = 'widget'
+
+    def sleep(self, duration = None):
+        game = self.game
+        if game is None:
+            self.sleeping = True
+            return None
+        game.scheduler.sleep(self, duration)
+
+    def wake(self):
+        game = self.game
+        if game is None:
+            self.sleeping = False
+            return None
+        game.scheduler.wake(self)
+
+    def is_idle(self):
+        return False
+
+class Scheduler():
+    """
+    Game clock and timed wakes of the sleeping objects of a game.
+
+    Moving an object between the active and sleeping sets is a structural change, so it is
+    deferred to the end of the update while the game updates, like registry adds and removals.
+
+    Attributes:
+    - time (float): Game time in seconds, advanced by dt at the start of every update.
+    - timers (list): Heap of (wake time, order, weak reference) timed wakes.
+    - sleeps (int): Number of times an object was put to sleep.
+    - wakes (int): Number of times an object was woken.
+    - timed_wakes (int): Number of wakes made by timers.
+
+    Methods:
+    - advance(dt): Advance the game time and wake the objects whose timers ran out.
+    - sleep(obj, duration=None): Put an object to sleep, until woken or for duration seconds.
+    - wake(obj, immediate=False): Wake an object, moving it into the active set now if immediate.
+    - move(obj): Put an object in the active or sleeping set matching its sleeping flag.
+    - get_stats(): Get the scheduler counters as a dictionary.
+    """
+
+    def __init__(self):
+        self.time = 0
+        self.timers = []
+        self.order = 0
+        self.sleeps = 0
+        self.wakes = 0
+        self.timed_wakes = 0
+
+    def advance(self, dt):
+        self.time += dt
+        timers = self.timers
+        while timers and timers[0][0] <= self.time:
+            wake_time, order, obj = heappop(timers)
+            obj = obj()
+            # timers replaced by a later sleep or an earlier wake are skipped
+            if obj is None or not obj.sleeping or obj.wake_time != wake_time:
+                continue
+            if getattr(obj, 'destroyed', False):
+                continue
+            self.timed_wakes += 1
+            self.wake(obj)
+
+    def sleep(self, obj, duration = None):
+        self.sleeps += 1
+        obj.sleeping = True
+        obj.wake_time = None
+        if not duration is None:
+            obj.wake_time = self.time + duration
+            self.order += 1
+            heappush(self.timers, (obj.wake_time, self.order, weakref.ref(obj)))
+        self.defer(obj, self.move, obj)
+
+    def wake(self, obj, immediate = False):
+        if not obj.sleeping:
+            return None
+        self.wakes += 1
+        obj.sleeping = False
+        obj.wake_time = None
+        if immediate:
+            self.move(obj)
+        else:
+            self.defer(obj, self.move, obj)
+        container = getattr(obj, obj.sleep_scope)
+        if getattr(container, 'sleeping', False):
+            self.wake(container, immediate)
+
+    def defer(self, obj, func, *args):
+        game = obj.game
+        if game is None:
+            return func(*args)
+        return game.defer(func, *args)
+
+    def move(self, obj):
+        container = getattr(obj, obj.sleep_scope)
+        if container is None:
+            return None
+        container.set_active(obj, not obj.sleeping)
+
+    def get_stats(self):
+        return {'time' : self.time,
+                'sleeps' : self.sleeps,
+                'wakes' : self.wakes,
+                'timed_wakes' : self.timed_wakes,
+                'pending_timers' : len(self.timers)}
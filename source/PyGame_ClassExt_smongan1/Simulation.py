@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+"""
+PyGame_ClassExt_smongan1 Package Documentation
+
+This module provides helpers for running many independent headless games, one after another in
+a single process or spread over a process pool. Each run builds its own Game from a factory, so
+no layers, components or ids are shared between runs.
+
+Functions:
+- `run_simulation(game_factory, n_frames, seed=None, dt=None, handler_kwargs=None)`: Build a game and run it headless for a fixed number of frames.
+- `run_simulations(game_factory, seeds, n_frames, dt=None, n_jobs=1, handler_kwargs=None)`: Run one simulation per seed, optionally in parallel processes.
+
+Usage Example:
+```python
+from PyGame_ClassExt_smongan1.BaseClasses import Game
+from PyGame_ClassExt_smongan1.Simulation import run_simulations
+
+def make_game():
+    return Game(800, 800, [], [setup_main_menu], always_draw = True)
+
+summaries = run_simulations(make_game, seeds = range(16), n_frames = 600, n_jobs = 4)
+print([summary['state'] for summary in summaries])
+```
+
+The factory is sent to the worker processes, so with n_jobs other than 1 it should be
+a module level function (or anything else joblib can pickle).
+"""
+from PyGame_ClassExt_smongan1.BaseClasses import GameHandler
+from joblib import Parallel, delayed
+import numpy as np
+import random
+
+def run_simulation(game_factory, n_frames, seed = None, dt = None, handler_kwargs = None):
+    """
+    Build a game and run it headless for a fixed number of frames.
+
+    Args:
+        game_factory (function): Called with no arguments, returns a new Game.
+        n_frames (int): Number of frames run.
+        seed (int, optional): Seed for random and numpy.random, set before the game is built. Defaults to None.
+        dt (float, optional): Fixed update step in seconds. Defaults to None, 1/framerate.
+        handler_kwargs (dict, optional): Extra keyword arguments for the GameHandler. Defaults to None.
+
+    Returns:
+        dict: The GameHandler.run_frames summary, with the seed added.
+    """
+    if not seed is None:
+        random.seed(seed)
+        np.random.seed(seed)
+    if handler_kwargs is None:
+        handler_kwargs = dict()
+    game = game_factory()
+    handler = GameHandler(game, headless = True, **handler_kwargs)
+    summary = handler.run_frames(n_frames, dt = dt, seed = seed)
+    summary['seed'] = seed
+    return summary
+
+def run_simulations(game_factory, seeds, n_frames, dt = None, n_jobs = 1, handler_kwargs = None):
+    """
+    Run one independent simulation per seed.
+
+    Args:
+        game_factory (function): Called with no arguments in each run, returns a new Game.
+        seeds (iterable): One seed per simulation.
+        n_frames (int): Number of frames run per simulation.
+        dt (float, optional): Fixed update step in seconds. Defaults to None, 1/framerate.
+        n_jobs (int, optional): Number of worker processes, 1 runs everything in this process
+            and -1 uses every core. Defaults to 1.
+        handler_kwargs (dict, optional): Extra keyword arguments for each GameHandler. Defaults to None.
+
+    Returns:
+        list: The run_simulation summaries, in the order of seeds.
+    """
+    if n_jobs == 1:
+        return [run_simulation(game_factory, n_frames, seed, dt, handler_kwargs)
+                for seed in seeds]
+    return Parallel(n_jobs = n_jobs)(delayed(run_simulation)(game_factory, n_frames, seed,
+                                                             dt, handler_kwargs)
+                                     for seed in seeds)
@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+"""
+PyGame_ClassExt_smongan1 Package Documentation
+
+This module provides a process-wide cache of rendered text surfaces, so text that is drawn
+again (a caret blinking, a button rebuilt with the same label, the same label on many buttons)
+is rendered by the font only once.
+
+Classes:
+- TextCache: Rendered text surfaces keyed by (font family, size, bold, italic, colour,
+  antialias, background, string), kept in least recently used order within a memory budget,
+  with hit and miss statistics. Also keeps one SysFont per (family, size, bold, italic).
+
+Functions:
+- `render_text(text, font_details, antialias=True, background=None, font=None)`: Render text through the shared cache.
+- `get_text_cache()`: Get the shared TextCache.
+
+Surfaces returned by the cache are shared by everything drawing the same text, so they must
+not be drawn onto or have their alpha or colorkey changed, copy them first.
+
+Usage Example:
+```python
+font_surf = render_text('Start', ['Arial', 25, (255, 0, 0)])
+get_text_cache().set_budget(16 * 2**20)
+print(get_text_cache().get_stats())
+```
+"""
+from collections import OrderedDict
+import pygame as pg
+
+class TextCache():
+    """
+    Least recently used cache of rendered text surfaces within a memory budget.
+
+    Parameters:
+    - max_bytes (int, optional): Memory budget for the cached surfaces' pixels. Default is 8 MB.
+
+    Attributes:
+    - max_bytes (int): Memory budget for the cached surfaces' pixels.
+    - surfs (collections.OrderedDict): Rendered surfaces by key, least recently used first.
+    - fonts (dict): SysFonts by (family, size, bold, italic).
+    - bytes (int): Memory used by the cached surfaces' pixels.
+    - hits (int): Number of renders served from the cache.
+    - misses (int): Number of renders made by a font.
+    - evictions (int): Number of surfaces dropped to stay within the budget.
+
+    Methods:
+    - render(text, font_details, antialias=True, background=None, font=None): Get the rendered text, rendering it on a miss.
+    - get_font(family, size, bold=False, italic=False): Get a shared SysFont.
+    - set_budget(max_bytes): Change the memory budget, evicting surfaces to fit it.
+    - clear(): Drop every cached surface.
+    - get_stats(): Get the cache counters as a dictionary.
+    """
+
+    def __init__(self, max_bytes = 8 * 2**20):
+        self.max_bytes = max_bytes
+        self.surfs = OrderedDict()
+        self.fonts = dict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self.surfs)
+
+    def get_font(self, family, size, bold = False, italic = False):
+        key = (family, size, bold, italic)
+        font = self.fonts.get(key)
+        if font is None:
+            font = pg.font.SysFont(family, size, bold, italic)
+            self.fonts[key] = font
+        return font
+
+    def render(self, text, font_details, antialias = True, background = None, font = None):
+        family, size, color = font_details[:3]
+        bold = italic = False
+        if not font is None:
+            bold = font.get_bold()
+            italic = font.get_italic()
+        key = (family, size, bold, italic, tuple(color), antialias,
+               None if background is None else tuple(background), text)
+        surfs = self.surfs
+        surf = surfs.get(key)
+        if not surf is None:
+            self.hits += 1
+            surfs.move_to_end(key)
+            return surf
+        self.misses += 1
+        if font is None:
+            font = self.get_font(family, size)
+        surf = font.render(text, antialias, color, background)
+        surf_bytes = surf.get_pitch() * surf.get_height()
+        if surf_bytes > self.max_bytes:
+            return surf
+        surfs[key] = surf
+        self.bytes += surf_bytes
+        self.evict()
+        return surf
+
+    def evict(self):
+        surfs = self.surfs
+        while self.bytes > self.max_bytes and surfs:
+            key, surf = surfs.popitem(last = False)
+            self.bytes -= surf.get_pitch() * surf.get_height()
+            self.evictions += 1
+
+    def set_budget(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.evict()
+
+    def clear(self):
+        self.surfs.clear()
+        self.bytes = 0
+
+    def get_stats(self):
+        lookups = self.hits + self.misses
+        return {'entries' : len(self.surfs),
+                'bytes' : self.bytes,
+                'max_bytes' : self.max_bytes,
+                'hits' : self.hits,
+                'misses' : self.misses,
+                'evictions' : self.evictions,
+                'hit_rate' : self.hits/lookups if lookups else 0}
+
+TEXT_CACHE = TextCache()
+
+def get_text_cache():
+    """
+    Get the shared TextCache used by the package's components.
+
+    Returns:
+        TextCache: The process-wide text cache.
+    """
+    return TEXT_CACHE
+
+def render_text(text, font_details, antialias = True, background = None, font = None):
+    """
+    Render text through the shared cache.
+
+    Args:
+        text (str): The text to render.
+        font_details (list): The font family, size and colour, as kept by components.
+        antialias (bool, optional): Whether to antialias the text. Default is True.
+        background (tuple, optional): Background colour, None for a transparent background. Default is None.
+        font (pygame.font.Font, optional): The font to render with on a miss, its bold and italic
+            flags are part of the key. Default is None, a shared SysFont of the family and size.
+
+    Returns:
+        pygame.Surface: The rendered text, shared and not to be drawn onto.
+    """
+    return TEXT_CACHE.render(text, font_details, antialias, background, font)
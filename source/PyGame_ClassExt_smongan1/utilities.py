@@ -11,6 +11,7 @@ Functions:
 - `load_image_strip(name, data_dir, colorkey=None, scale=1, size=None)`: Load an image strip from a file with optional scaling and colorkey.
 - `simple_sheer_arr(img, coordinate, direction=1, pixels=None, scale=None, with_smoothing=None)`: Apply a simple shear transformation to an image along a specified coordinate.
 - `is_same_vec(vec1, vec2)`: Compare two vectors element-wise and determine if they are identical.
+- `vec_key(vec)`: Get a snapshot of a vector that compares equal only while its values are unchanged.
 - `centered_buttons_locs_vert(button_size, num_buttons, screen_dim, num_cols=None, spacing=None, hori_offset=0, vert_offset=0, padding=100)`: Calculate the positions of vertically centered buttons.
 - `centered_buttons_locs_hori(button_size, num_buttons, screen_dim, spacing=None, vert_offset=0, hori_offset=0, padding=100)`: Calculate the positions of horizontally centered buttons.
 - `make_subset_surf(surf, subset_color, subset_alpha, padding)`: Create a subset surface with a colored background.
@@ -23,12 +24,18 @@ Functions:
 - `convert_str_to_fonts(x)`: Convert string representations of pygame fonts back to pygame fonts.
 - `point_in_rect(point, rect)`: Check if a point is within a pygame Rect.
 - `point_in_obj(point, obj, greater_than_0_check=True)`: Check if a point is within a custom object.
-- `run_updates(obj)`: Run update methods of an object based on predefined attributes.
+- `merge_rects(rects)`: Merge overlapping rectangles into a smaller set of disjoint rectangles.
+- `copy_area(dest, source, rect)`: Copy the pixels of a region of one surface onto the same region of another.
+- `run_updates(obj, profiler=None)`: Run update methods of an object based on predefined attributes.
+- `weak_parent(name)`: Get a property holding a parent object through a weak reference.
 - `blackwhite(img, sheer_amt=None)`: Convert an image to black and white with optional shearing.
 - `make_shadow(surf, sheer_amt=None)`: Create a shadow surface from an image with optional shearing.
 
 Classes:
 - `timer`: Timer class for measuring time intervals.
+- `FramePacer`: Hybrid sleep/spin frame pacing engine with overshoot reporting.
+- `UpdateAttrs`: Dictionary of extra update method names that counts its changes.
+- `Updatable`: Mixin compiling the update_* methods run by run_updates once per class.
 
 For detailed usage instructions and examples, refer to the individual function and class docstrings.
 
@@ -38,6 +45,7 @@ Created on Wed Jul 13 22:18:44 2022
 """
 import pygame as pg
 import os
+import weakref
 import numpy as np
 from scipy.ndimage.filters import gaussian_filter
 
@@ -220,6 +228,23 @@ def is_same_vec(vec1, vec2):
         
     return ii >= len(vec1)
 
+def vec_key(vec):
+    """
+    Get a snapshot of a vector that compares equal only while its values are unchanged.
+
+    Used in draw keys, NumPy arrays are snapshot as their bytes which is several times
+    cheaper than converting them to tuples.
+
+    Args:
+        vec (numpy.ndarray, list or tuple): The vector, e.g. a position or blit offset.
+
+    Returns:
+        bytes or tuple: The snapshot.
+    """
+    if isinstance(vec, np.ndarray):
+        return vec.tobytes()
+    return tuple(vec)
+
 class timer():
     """
     Timer class for measuring time intervals.
@@ -255,6 +280,100 @@ class timer():
     def reset(self):
         self.clk = 0
 
+class FramePacer():
+    """
+    Frame pacing engine for holding a game loop to a target framerate.
+
+    The pacer works against absolute frame deadlines measured with the monotonic
+    time.perf_counter clock. It sleeps in one coarse step until it is close to the
+    deadline and then spins for the last fraction of a millisecond, so the loop keeps
+    its timing accuracy without pinning a core. The coarse sleep is shortened by a
+    running estimate of how late the OS wakes the thread up. When vsync is enabled
+    the display flip already blocks on the monitor refresh, so the pacer only
+    measures the frame.
+
+    Parameters:
+    - framerate (int): Target frames per second.
+    - spin_time (float, optional): Time in seconds before the deadline at which sleeping stops and spinning starts. Default is 0.0005.
+    - vsync (bool, optional): Flag indicating whether presentation is synchronised to the display. Default is False.
+
+    Attributes:
+    - frame_time (float): Target duration of one frame in seconds.
+    - deadline (float or None): perf_counter time at which the current frame ends.
+    - frame_start (float or None): perf_counter time at which the current frame started.
+    - last_frame_time (float): Duration of the last completed frame in seconds.
+    - last_overshoot (float): How far the last frame ran past its deadline in seconds.
+    - max_overshoot (float): Largest overshoot seen since the last reset.
+    - total_overshoot (float): Sum of all overshoots since the last reset.
+    - frames (int): Number of frames paced since the last reset.
+    - sleep_error (float): Running estimate of how late the OS returns from sleep.
+
+    Methods:
+    - restart(self): Start pacing from the current time.
+    - wait(self): Block until the end of the current frame and return its duration.
+    - set_framerate(self, framerate): Change the target framerate.
+    - mean_overshoot(self): Get the average overshoot per frame.
+    - reset_stats(self): Reset the overshoot statistics.
+    """
+    def __init__(self, framerate, spin_time = 0.0005, vsync = False):
+        from time import perf_counter, sleep
+        self.perf_counter = perf_counter
+        self.sleep = sleep
+        self.spin_time = spin_time
+        self.vsync = vsync
+        self.sleep_error = 0
+        self.deadline = None
+        self.frame_start = None
+        self.last_frame_time = 0
+        self.set_framerate(framerate)
+        self.reset_stats()
+
+    def set_framerate(self, framerate):
+        self.framerate = framerate
+        self.frame_time = 1/framerate
+
+    def restart(self):
+        self.frame_start = self.perf_counter()
+        self.deadline = self.frame_start + self.frame_time
+
+    def wait(self):
+        if self.deadline is None:
+            self.restart()
+        now = self.perf_counter()
+        if not self.vsync:
+            remaining = self.deadline - now - self.spin_time - self.sleep_error
+            if remaining > 0:
+                self.sleep(remaining)
+                woke = self.perf_counter()
+                # exponential average of how much later than asked the OS woke us
+                self.sleep_error = max(0, 0.9 * self.sleep_error +
+                                       0.1 * (woke - now - remaining))
+            now = self.perf_counter()
+            while now < self.deadline:
+                now = self.perf_counter()
+        self.last_overshoot = max(0, now - self.deadline)
+        self.max_overshoot = max(self.max_overshoot, self.last_overshoot)
+        self.total_overshoot += self.last_overshoot
+        self.frames += 1
+        self.last_frame_time = now - self.frame_start
+        self.frame_start = now
+        self.deadline += self.frame_time
+        if self.deadline < now:
+            # too far behind to catch up, schedule from now instead of bursting
+            self.deadline = now + self.frame_time
+        return self.last_frame_time
+
+    def mean_overshoot(self):
+        if self.frames == 0:
+            return 0
+        return self.total_overshoot/self.frames
+
+    def reset_stats(self):
+        self.last_overshoot = 0
+        self.max_overshoot = 0
+        self.total_overshoot = 0
+        self.frames = 0
+
 def centered_buttons_locs_vert(button_size, 
                               num_buttons, 
                                screen_dim, 
@@ -450,8 +569,9 @@ def convert_surfs_to_str(x):
     """
     
     for attr_name in dir(x):
-        if isinstance(x.__getattribute__(attr_name), pg.Surface):
-            surf = x.__getattribute__(attr_name)
+        # unset __slots__ entries are listed by dir but have no value
+        surf = getattr(x, attr_name, None)
+        if isinstance(surf, pg.Surface):
             x.__setattr__(attr_name, ['is_surf', 
                               pg.image.tostring(surf, "RGBA"),
                               surf.get_size()])
@@ -467,8 +587,8 @@ def convert_str_to_surfs(x):
        x: Modifies the input object by converting string representations to pygame Surfaces.
    """
     for attr_name in dir(x):
-        if isinstance(x.__getattribute__(attr_name), list):
-            attr = x.__getattribute__(attr_name)
+        attr = getattr(x, attr_name, None)
+        if isinstance(attr, list):
             if 'is_surf' in attr[:1]:
                 surf = pg.image.fromstring(attr[1], attr[2], 'RGBA')
                 x.__setattr__(attr_name, surf)
@@ -542,21 +662,201 @@ def point_in_obj(point, obj, greater_than_0_check = True):
                     (point[1] - bottom) <= 0 and
                     (point[1] - top) >= 0)
 
-def run_updates(obj):
+def merge_rects(rects):
+    """
+    Merge overlapping rectangles into a smaller set of disjoint rectangles.
+
+    Args:
+        rects (list): The pygame Rects to merge.
+
+    Returns:
+        list: Rectangles covering the same area, none of which overlap.
+    """
+    merged = []
+    for rect in rects:
+        rect = pg.Rect(rect)
+        if rect.width <= 0 or rect.height <= 0:
+            continue
+        ind = rect.collidelist(merged)
+        while ind != -1:
+            rect.union_ip(merged.pop(ind))
+            ind = rect.collidelist(merged)
+        merged.append(rect)
+    return merged
+
+def copy_area(dest, source, rect):
+    """
+    Copy the pixels of a region of one surface onto the same region of another.
+
+    Unlike a plain blit, the source's alpha and colorkey are ignored, so the region ends up
+    exactly as it is in the source, as if that part of the source had been copied.
+
+    Args:
+        dest (pygame.Surface): The surface to copy onto.
+        source (pygame.Surface): The surface to copy from.
+        rect (pygame.Rect): The region to copy.
+
+    Returns:
+        pygame.Rect: The region of dest that changed.
+    """
+    dest.fill((0, 0, 0, 0), rect)
+    return dest.blit(source, rect, rect, special_flags = pg.BLEND_RGBA_ADD)
+
+class UpdateAttrs(dict):
+    """
+    Dictionary of extra update method names that counts its changes.
+
+    Updatable objects keep their to_update_attrs in an UpdateAttrs, so the compiled
+    update methods are only rebuilt after a name has been added or removed.
+
+    Attributes:
+        version (int): Number of changes made to the dictionary.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.version = 0
+    def __setitem__(self, key, value):
+        self.version += 1
+        super().__setitem__(key, value)
+    def __delitem__(self, key):
+        self.version += 1
+        super().__delitem__(key)
+    def __ior__(self, other):
+        self.update(other)
+        return self
+    def update(self, *args, **kwargs):
+        self.version += 1
+        super().update(*args, **kwargs)
+    def setdefault(self, key, default = None):
+        self.version += 1
+        return super().setdefault(key, default)
+    def pop(self, *args):
+        self.version += 1
+        return super().pop(*args)
+    def popitem(self):
+        self.version += 1
+        return super().popitem()
+    def clear(self):
+        self.version += 1
+        super().clear()
+
+class Updatable():
+    """
+    A mixin class compiling the update_* methods run by run_updates.
+
+    The update_* method names are resolved once per class when the class is defined.
+    Each object merges them with the names in its to_update_attrs and any update_*
+    callables set on the object itself, and keeps the bound methods in a tuple that is
+    only rebuilt when to_update_attrs changes. Callables set on the object after its
+    first update are picked up the next time to_update_attrs changes. Assigning to_update_attrs
+    wakes a sleeping object.
+
+    The mixin has empty __slots__, classes using __slots__ declare slot_names in theirs.
+
+    Attributes:
+        slot_names (tuple): Names of the per-object attributes kept by the mixin.
+        compiled_update_names (tuple): Sorted update_* method names of the class.
+        to_update_attrs (UpdateAttrs): Extra method names run with the update_* methods.
+        compiled_updates (tuple): The names and bound methods run by run_updates.
+
+    Methods:
+        get_update_methods(self): Get the names and bound methods run by run_updates, in name order.
+    """
+    __slots__ = ()
+    slot_names = ('to_update_attrs_dict', 'compiled_updates', 'compiled_updates_key')
+    compiled_update_names = ()
+    compiled_updates = None
+    compiled_updates_key = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.compiled_update_names = tuple(name for name in dir(cls) 
+                                          if name.startswith('update_') and 
+                                          callable(getattr(cls, name, None)))
+
+    @property
+    def to_update_attrs(self):
+        attrs = getattr(self, 'to_update_attrs_dict', None)
+        if attrs is None:
+            attrs = self.to_update_attrs_dict = UpdateAttrs()
+        return attrs
+
+    @to_update_attrs.setter
+    def to_update_attrs(self, attrs):
+        if not isinstance(attrs, UpdateAttrs):
+            attrs = UpdateAttrs(attrs)
+        self.to_update_attrs_dict = attrs
+        self.compiled_updates_key = None
+        if getattr(self, 'sleeping', False):
+            self.wake()
+
+    def get_update_methods(self):
+        attrs = self.to_update_attrs
+        key = (type(self), id(attrs), attrs.version)
+        if self.compiled_updates_key != key:
+            names = set(type(self).compiled_update_names)
+            names.update(name for name in getattr(self, '__dict__', ()) 
+                         if name.startswith('update_'))
+            names.update(name for name in attrs if hasattr(self, name))
+            methods = [(name, getattr(self, name)) for name in sorted(names)]
+            self.compiled_updates = (tuple(name for name, method in methods if callable(method)),
+                                     tuple(method for name, method in methods if callable(method)))
+            self.compiled_updates_key = key
+        return self.compiled_updates
+
+def run_updates(obj, profiler = None):
     """
     Run update methods of an object based on predefined attributes.
 
+    Updatable objects run their compiled update methods, any other object has its
+    update_* methods and to_update_attrs names looked up with dir() on every call.
+
     Args:
         obj: The object to update.
+        profiler (FrameProfiler, optional): Profiler timing each update pass. Defaults to None.
 
     Modifies:
         obj: Modifies the object by running update methods.
     """
-    obj.__setattr__('to_update_attrs', {x : None for x in dir(obj) 
-                           if x in obj.to_update_attrs or 
-                           x.startswith('update_')})
-    for update_attr in obj.to_update_attrs:
-        obj.__getattribute__(update_attr)()
+    if isinstance(obj, Updatable):
+        names, methods = obj.get_update_methods()
+    else:
+        obj.__setattr__('to_update_attrs', {x : None for x in dir(obj) 
+                               if x in obj.to_update_attrs or 
+                               x.startswith('update_')})
+        names = tuple(obj.to_update_attrs)
+        methods = tuple(obj.__getattribute__(x) for x in names)
+    if profiler is None or not profiler.enabled:
+        for method in methods:
+            method()
+        return None
+    for update_attr, method in zip(names, methods):
+        with profiler.section(type(obj).__name__ + '.' + update_attr, 'update_pass', 
+                              {'id' : getattr(obj, 'id', None)}):
+            method()
+
+def weak_parent(name):
+    """
+    Get a property holding a parent object (e.g. the game, layer or widget) through a weak reference.
+
+    The property reads None when the parent was never set, was set to None or has been freed,
+    so back-references never keep a removed layer, widget or game alive.
+
+    Args:
+        name (str): Name of the attribute, the weak reference is stored as name + '_ref'.
+
+    Returns:
+        property: The property to assign to the class attribute name.
+    """
+    ref_name = name + '_ref'
+    def get_parent(self):
+        ref = getattr(self, ref_name, None)
+        if ref is None:
+            return None
+        return ref()
+    def set_parent(self, parent):
+        setattr(self, ref_name, None if parent is None else weakref.ref(parent))
+    return property(get_parent, set_parent)
 
 def blackwhite(img, sheer_amt = None):
     
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+"""
+Shared setup for the package tests, which run headless on the SDL dummy video driver.
+
+Fixtures:
+- make_game: Get a factory building a started headless game with one widget, 'widget_main',
+  holding the given components, returning the game and its handler.
+"""
+import os
+import sys
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pytest
+from PyGame_ClassExt_smongan1.BaseClasses import Game, GameHandler
+from PyGame_ClassExt_smongan1.utilities import make_widget_dict
+
+@pytest.fixture
+def make_game(tmp_path):
+    handlers = []
+    def make(size = (200, 200), handler_kwargs = None, **components):
+        # components are lists, or functions returning lists for those needing a display
+        def setup_scene(game):
+            comps = {key : value() if callable(value) else value 
+                     for key, value in components.items()}
+            widget_dict = make_widget_dict(list(size), [0, 0], (180, 180, 180), **comps)
+            widget_dict['id'] = 'widget_main'
+            return [widget_dict], {'name' : 'Main_menu'}
+        game = Game(size[0], size[1], ['Main_menu'], [setup_scene], 
+                    save_folder = str(tmp_path) + os.sep)
+        handler = GameHandler(game, headless = True, **(handler_kwargs or dict()))
+        handler.start()
+        handler.cursor_loc = np.zeros(2)
+        handlers.append(handler)
+        return game, handler
+    yield make
+    for handler in handlers:
+        handler.stop_present_thread()
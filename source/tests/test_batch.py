@@ -0,0 +1,19 @@
+# -*- coding: utf-8 -*-
+"""
+Tests of the struct-of-arrays actor batch.
+"""
+from PyGame_ClassExt_smongan1.BatchClasses import ActorBatch, BatchActor
+
+def test_swap_remove():
+    batch = ActorBatch(2)
+    members = [BatchActor([10. * i, 0.], [5, 5]) for i in range(3)]
+    for member in members:
+        batch.add(member)
+    assert len(batch) == 3 and batch.capacity == 4
+    removed = batch.remove(members[0])
+    assert removed is members[0] and len(batch) == 2
+    # the last member is moved into the freed row
+    assert batch.members == [members[2], members[1]]
+    assert members[2].slot == 0 and list(batch.positions[0]) == [20, 0]
+    assert list(members[2].position) == [20, 0]
+    assert removed.batch is None and list(removed.position) == [0, 0]
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+"""
+Tests of presenting only the changed regions of the screen.
+"""
+import numpy as np
+import pygame as pg
+from PyGame_ClassExt_smongan1.BaseClasses import Actor
+from PyGame_ClassExt_smongan1.utilities import merge_rects
+
+def test_merge_rects():
+    rects = [(0, 0, 10, 10), (5, 5, 10, 10), (30, 30, 5, 5), (50, 50, 0, 4)]
+    assert merge_rects(rects) == [pg.Rect(0, 0, 15, 15), pg.Rect(30, 30, 5, 5)]
+    # a union growing over earlier rectangles swallows them too
+    rects = [(0, 0, 5, 5), (20, 0, 5, 5), (3, 0, 20, 5)]
+    assert merge_rects(rects) == [pg.Rect(0, 0, 25, 5)]
+
+def test_moving_actor_presents_its_old_and_new_area(make_game):
+    actor = Actor([20, 20], [10, 10])
+    game, handler = make_game(actors = [actor], handler_kwargs = {'dirty_rect_updates' : True})
+    handler.run_frames(1, force_draw = True)
+    handler.present()
+    assert handler.get_present_rects() == []
+    actor.position = np.array([60., 20.])
+    actor.mark_dirty()
+    game.update()
+    game.draw()
+    rects = handler.get_present_rects()
+    assert pg.Rect(20, 20, 10, 10).collidelist(rects) != -1
+    assert pg.Rect(60, 20, 10, 10).collidelist(rects) != -1
+    assert sum(rect.width * rect.height for rect in rects) < 200 * 200 / 4
+
+def test_large_changes_fall_back_to_a_full_update(make_game):
+    game, handler = make_game(handler_kwargs = {'dirty_rect_updates' : True, 
+                                                'full_update_ratio' : 0.5})
+    handler.dirty_rects = []
+    handler.mark_dirty(pg.Rect(0, 0, 150, 150))
+    assert handler.get_present_rects() is None
+    handler.dirty_rects = []
+    handler.mark_dirty(pg.Rect(-10, -10, 50, 50))
+    assert handler.get_present_rects() == [pg.Rect(0, 0, 40, 40)]
+    handler.mark_all_dirty()
+    assert handler.get_present_rects() is None
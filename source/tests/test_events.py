@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""
+Tests of the event bus and of components subscribing through event_handlers.
+"""
+import gc
+from PyGame_ClassExt_smongan1.BaseClasses import Actor
+from PyGame_ClassExt_smongan1.Events import EventBus
+
+class Listener(Actor):
+    event_handlers = {'ping' : 'on_ping'}
+
+    def on_ping(self, event):
+        self.pings += 1
+
+def test_priority_order_and_weak_methods():
+    bus = EventBus()
+    calls = []
+    class Receiver():
+        def on_ping(self, event):
+            calls.append('method')
+    receiver = Receiver()
+    bus.subscribe('ping', lambda event: calls.append('low'), priority = -1)
+    bus.subscribe('ping', lambda event: calls.append('high'), priority = 10)
+    bus.subscribe('ping', receiver.on_ping)
+    bus.publish('ping')
+    assert calls == []
+    bus.dispatch()
+    assert calls == ['high', 'method', 'low']
+    # bound methods are held weakly
+    del receiver
+    gc.collect()
+    calls.clear()
+    bus.publish('ping', immediate = True)
+    assert calls == ['high', 'low']
+    assert len(bus.subscriptions['ping']) == 2
+    def stop(event):
+        calls.append('stop')
+        event.handled = True
+    bus.subscribe('ping', stop, priority = 20)
+    calls.clear()
+    bus.publish('ping', immediate = True)
+    assert calls == ['stop']
+
+def test_destroyed_components_are_unsubscribed(make_game):
+    listener = Listener([0, 0], [5, 5])
+    listener.pings = 0
+    game, handler = make_game(actors = [listener])
+    game.events.publish('ping', immediate = True)
+    assert listener.pings == 1
+    listener.destroy()
+    handler.run_frames(1)
+    game.events.publish('ping', immediate = True)
+    assert listener.pings == 1 and not game.events.has_subscribers('ping')
@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+"""
+Tests of the input state fed from the event queue.
+"""
+import pygame as pg
+from PyGame_ClassExt_smongan1.InputClasses import InputState
+
+def test_key_edges_and_repeat():
+    state = InputState()
+    state.process_event(pg.event.Event(pg.KEYDOWN, key = pg.K_a, mod = 0))
+    assert state.was_pressed(pg.K_a) and state.is_held(pg.K_a) and state[pg.K_a]
+    state.clear_edges()
+    # key repeat does not press the key again
+    state.process_event(pg.event.Event(pg.KEYDOWN, key = pg.K_a, mod = 0))
+    assert not state.was_pressed(pg.K_a) and state.is_held(pg.K_a)
+    assert pg.K_a in state.get_prev_held()
+    state.process_event(pg.event.Event(pg.KEYUP, key = pg.K_a, mod = 0))
+    assert state.was_released(pg.K_a) and not state.is_held(pg.K_a)
+
+def test_mouse_buttons_and_focus_loss():
+    state = InputState()
+    assert not state.mouse_active()
+    state.process_event(pg.event.Event(pg.MOUSEBUTTONDOWN, button = 1, pos = (3, 4)))
+    assert state.mouse_clicked() and state.mouse_held() and state.mouse_active()
+    assert state.get_mouse_pressed() == (True, False, False)
+    assert list(state.mouse_pos) == [3, 4]
+    state.clear_edges()
+    # held buttons are released when the window loses focus
+    state.process_event(pg.event.Event(pg.WINDOWFOCUSLOST))
+    assert not state.mouse_held() and state.mouse_released()
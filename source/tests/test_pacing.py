@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+"""
+Tests of the frame pacer, run on a fake clock.
+"""
+import pytest
+from PyGame_ClassExt_smongan1.utilities import FramePacer
+
+class Clock():
+    now = 0.
+
+    def perf_counter(self):
+        self.now += 1e-4
+        return self.now
+
+    def sleep(self, duration):
+        self.now += duration
+
+def test_holds_the_framerate():
+    clock = Clock()
+    pacer = FramePacer(100, spin_time = 0)
+    pacer.perf_counter = clock.perf_counter
+    pacer.sleep = clock.sleep
+    pacer.restart()
+    durations = [pacer.wait() for _ in range(10)]
+    assert durations == pytest.approx([0.01] * 10, abs = 1e-3)
+    # a long frame schedules the next one from now instead of bursting to catch up
+    clock.now += 0.05
+    assert pacer.wait() >= 0.05
+    assert pacer.deadline == pytest.approx(clock.now + 0.01, abs = 1e-3)
+    assert pacer.max_overshoot >= 0.04 and pacer.frames == 11
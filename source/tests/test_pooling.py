@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""
+Tests of the actor pool, the animation frame cache and saving games holding pooled actors.
+"""
+import os
+import joblib
+import numpy as np
+import pygame as pg
+from PyGame_ClassExt_smongan1.AnimationClasses import Animation
+from PyGame_ClassExt_smongan1.BaseClasses import Actor
+from PyGame_ClassExt_smongan1.Pooling import ActorPool
+
+def make_pooled_actor():
+    actor = Actor([0, 0], [5, 5])
+    # frames the save drops from saved components but not from free pooled ones
+    actor.animations = {'idle' : [pg.Surface((5, 5))]}
+    return actor
+
+def test_actor_pool_reuse(make_game):
+    game, handler = make_game()
+    widget = game.widgets['widget_main']
+    pool = ActorPool(make_pooled_actor, capacity = 1)
+    actor = pool.acquire(widget, position = np.array([10., 10.]))
+    assert actor.id in widget.actors and pool.get_stats()['reused'] == 1
+    actor.destroy()
+    assert actor.destroyed and not actor.id in widget.actors
+    assert len(pool) == 1 and pool.get_stats()['released'] == 1
+    again = pool.acquire(widget)
+    assert again is actor and not again.destroyed and again.id in widget.actors
+    assert pool.get_stats()['created'] == 1
+
+def test_save_after_acquire_and_release(make_game, tmp_path, monkeypatch):
+    # Game.save writes its log to the working directory
+    monkeypatch.chdir(tmp_path)
+    holder = Actor([100, 100], [10, 10])
+    game, handler = make_game(actors = [holder])
+    widget = game.widgets['widget_main']
+    # a pool kept on a saved actor, as the example game used to keep its fireballs
+    holder.pool_kept = ActorPool(make_pooled_actor, capacity = 2)
+    released = holder.pool_kept.acquire(widget)
+    handler.run_frames(2, force_draw = True)
+    released.destroy()
+    in_use = holder.pool_kept.acquire(widget)
+    handler.run_frames(2, force_draw = True)
+    assert len(holder.pool_kept) == 1
+    game.save_name = 'pooled'
+    game.save()
+    saved = joblib.load(os.path.join(str(tmp_path), 'pooled.sav'))
+    saved_actors = saved['Main_menu'][0]['actors']
+    saved_holder = [x for x in saved_actors if hasattr(x, 'pool_kept')][0]
+    assert len(saved_holder.pool_kept) == 0 and saved_holder.pool_kept.factory is None
+    assert saved_holder.pool_kept.get_stats()['released'] == 1
+    assert all(x.pool is None for x in saved_actors)
+    # the live pooled actor still goes back to its pool
+    assert in_use.pool is holder.pool_kept
+    in_use.destroy()
+    assert len(holder.pool_kept) == 2
+
+def test_frame_cache_is_bounded(make_game, tmp_path, monkeypatch):
+    game, handler = make_game()
+    animation_dir = os.path.join(str(tmp_path), 'hero_idle_')
+    os.mkdir(animation_dir)
+    pg.image.save(pg.Surface((4, 4)), os.path.join(animation_dir, 'frame_0.png'))
+    monkeypatch.setattr(Animation, 'frame_cache', type(Animation.frame_cache)())
+    monkeypatch.setattr(Animation, 'max_cached_animations', 2)
+    first = Animation(animation_dir, 1, [4, 4])
+    again = Animation(animation_dir, 1, [4, 4])
+    # the frames are decoded once and shared
+    assert again.base_frames is first.base_frames and len(Animation.frame_cache) == 1
+    for size in ([6, 6], [8, 8]):
+        Animation(animation_dir, 1, size)
+    assert len(Animation.frame_cache) == 2
+    assert not any(key[2] == '[4, 4]' for key in Animation.frame_cache)
+    Animation.clear_frame_cache()
+    assert len(Animation.frame_cache) == 0
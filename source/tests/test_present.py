@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+"""
+Tests of presenting finished frames on a worker thread.
+"""
+import numpy as np
+import pygame as pg
+from PyGame_ClassExt_smongan1.BaseClasses import Actor
+
+def run_moving_actor(make_game, threaded_present, n_frames = 6):
+    actor = Actor([10, 20], [10, 10], color = (255, 0, 0))
+    game, handler = make_game(actors = [actor], 
+                              handler_kwargs = {'resolution' : [400, 400],
+                                                'threaded_present' : threaded_present})
+    if threaded_present:
+        handler.start_present_thread()
+    windows = []
+    for frame in range(n_frames):
+        actor.position = actor.position + np.array([15., 0.])
+        actor.mark_dirty()
+        game.update()
+        game.draw()
+        drawn = handler.screen
+        handler.present()
+        handler.wait_present()
+        if threaded_present:
+            # the next frame is drawn into the other buffer
+            assert not handler.screen is drawn
+        windows.append(pg.image.tostring(handler.screen_display, 'RGB'))
+    return windows
+
+def test_threaded_present_matches_serial(make_game):
+    serial = run_moving_actor(make_game, False)
+    threaded = run_moving_actor(make_game, True)
+    assert threaded == serial
+    assert len(set(serial)) == len(serial)
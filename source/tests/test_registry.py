@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+"""
+Tests of the component registry: handles, id aliases, indexed queries and removal.
+"""
+from PyGame_ClassExt_smongan1.BaseClasses import Actor
+
+def make_actor(actor_id = None):
+    actor = Actor([0, 0], [5, 5])
+    actor.id = actor_id
+    return actor
+
+def test_handles_and_aliases(make_game):
+    actors = [make_actor('hero'), make_actor()]
+    game, handler = make_game(actors = actors)
+    widget = game.widgets['widget_main']
+    assert actors[0].id == 'actor_hero' and actors[1].id.startswith('actor_')
+    assert game.registry.get(actors[0].handle) is actors[0]
+    assert game.get_component('actor_hero') is actors[0]
+    assert widget.get_component('actor_hero') is actors[0]
+    assert any(scope is widget for scope in game.registry.get_scopes(actors[0]))
+    assert actors[1] in game.registry and len(game.registry.get_type('actors')) == 2
+
+def test_removal_is_deferred_during_updates(make_game):
+    actor = make_actor('hero')
+    game, handler = make_game(actors = [actor])
+    widget = game.widgets['widget_main']
+    game.deferring = True
+    widget.remove_component('actor_hero')
+    assert game.get_component('actor_hero') is actor
+    game.deferring = False
+    game.flush_deferred()
+    assert game.get_component('actor_hero') is None
+    assert not 'actor_hero' in widget.actors and not 'actor_hero' in game.actors
+    # stale handles are not resolved
+    assert game.registry.get(actor.handle) is None
+
+def test_queries_by_prefix_tag_and_attribute(make_game):
+    actors = [make_actor('enemy_1'), make_actor('enemy_0'), make_actor('hero')]
+    game, handler = make_game(actors = actors)
+    widget = game.widgets['widget_main']
+    assert [x.id for x in game.query(prefix = 'actor_enemy_')] == ['actor_enemy_0', 'actor_enemy_1']
+    game.registry.add_tag(actors[0], 'hostile')
+    assert game.query('actors', tags = 'hostile') == [actors[0]]
+    game.registry.add_index('speed')
+    game.registry.set_attr(actors[1], 'speed', 300)
+    assert game.query(speed = 300) == [actors[1]]
+    assert set(widget.query('actors')) == set(actors)
+    widget.remove_component('actor_enemy_1')
+    assert game.query(prefix = 'actor_enemy_') == [actors[1]]
+    assert game.query(tags = 'hostile') == []
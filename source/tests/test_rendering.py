@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+"""
+Tests of retained rendering: widget composition, layer redraws and the buffers they draw into.
+"""
+import numpy as np
+import pygame as pg
+import pytest
+from PyGame_ClassExt_smongan1.BaseClasses import Actor, Graphic
+
+RED = (255, 0, 0)
+GREEN = (0, 255, 0)
+BLUE = (0, 0, 255)
+
+def screen_bytes(game):
+    return pg.image.tostring(game.screen, 'RGB')
+
+def run_presented_frames(handler, n_frames, pixel):
+    # the frame order of GameHandler.run, reading the pixel of each frame handed to present
+    pixels = []
+    for frame in range(n_frames):
+        handler.game.update()
+        handler.game.draw()
+        pixels.append(tuple(handler.screen.get_at(pixel))[:3])
+        handler.present()
+    handler.wait_present()
+    return pixels
+
+@pytest.mark.parametrize('threaded_present', [False, True])
+def test_idle_frames_after_one_change(make_game, threaded_present):
+    graphics = []
+    def make_graphics():
+        graphics.append(Graphic([20, 20], [10, 10]))
+        return graphics
+    game, handler = make_game(graphics = make_graphics,
+                              handler_kwargs = {'threaded_present' : threaded_present})
+    if threaded_present:
+        handler.start_present_thread()
+    run_presented_frames(handler, 2, (15, 15))
+    graphics[0].surf.fill(RED)
+    graphics[0].mark_dirty()
+    # the buffers alternate when presenting on a thread, each has to show the change
+    assert run_presented_frames(handler, 6, (15, 15)) == [RED] * 6
+
+def test_incremental_compose_matches_a_full_compose(make_game):
+    actors = [Actor([20, 20], [30, 30], color = RED), Actor([40, 30], [30, 30], color = GREEN),
+              Actor([120, 120], [20, 20], color = BLUE)]
+    game, handler = make_game(actors = actors)
+    widget = game.widgets['widget_main']
+    layer = game.layers[game.current_layer]
+    game.draw()
+    for frame in range(5):
+        actors[0].position = actors[0].position + np.array([7., 3.])
+        assert not widget.get_changed_regions() is None
+        game.draw()
+        incremental = screen_bytes(game)
+        widget.mark_dirty()
+        layer.mark_dirty()
+        game.draw()
+        assert screen_bytes(game) == incremental
+
+def test_changed_regions(make_game):
+    actors = [Actor([20, 20], [10, 10], color = RED), Actor([0, 0], [150, 150], color = GREEN)]
+    game, handler = make_game(actors = actors)
+    widget = game.widgets['widget_main']
+    game.draw()
+    assert widget.get_changed_regions()[0] == []
+    actors[0].position = np.array([40., 20.])
+    regions, components, rects = widget.get_changed_regions()
+    # the old and new area of the moved actor, with the components overlapping them
+    assert regions == [pg.Rect(20, 20, 10, 10), pg.Rect(40, 20, 10, 10)]
+    assert actors[0] in components
+    game.draw()
+    # changes covering more than half the widget redraw it whole
+    actors[1].position = np.array([30., 30.])
+    assert widget.get_changed_regions() is None
+
+class SelfDrawnActor(Actor):
+    # overriding draw only, so it cannot be batched with the blits around it
+
+    def draw(self):
+        self.widget.surf.fill(BLUE, pg.Rect(self.position, self.size))
+
+def test_batched_blits_keep_the_draw_order(make_game):
+    actors = [Actor([10, 10], [20, 20], color = RED), SelfDrawnActor([15, 15], [20, 20]),
+              Actor([25, 25], [20, 20], color = GREEN)]
+    game, handler = make_game(actors = actors)
+    assert actors[0].batched and not actors[1].batched
+    game.draw()
+    assert game.screen.get_at((12, 12))[:3] == RED
+    assert game.screen.get_at((20, 20))[:3] == BLUE
+    assert game.screen.get_at((30, 30))[:3] == GREEN
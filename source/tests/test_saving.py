@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""
+Tests of saving a drawn game: the retained draw state is dropped from the save and rebuilt
+in the live game.
+"""
+import os
+import joblib
+import pygame as pg
+from PyGame_ClassExt_smongan1.BaseClasses import Actor, Button, Textbox
+from PyGame_ClassExt_smongan1.utilities import convert_str_to_surfs
+
+def save_and_load(game, save_name):
+    game.save_name = save_name
+    game.save()
+    return joblib.load(game.save_folder + save_name + '.sav')
+
+def test_save_round_trip(make_game, tmp_path, monkeypatch):
+    # Game.save writes its log to the working directory
+    monkeypatch.chdir(tmp_path)
+    pg.font.init()
+    actor = Actor([100, 100], [10, 10])
+    textbox = Textbox([10, 60])
+    game, handler = make_game(actors = [actor], textboxs = [textbox])
+    handler.run_frames(3, force_draw = True)
+    assert not actor.drawn_key is None
+    saved = save_and_load(game, 'round_trip')
+    saved_actor = saved['Main_menu'][0]['actors'][0]
+    assert saved_actor.drawn_key is None and saved_actor.drawn_rect is None
+    convert_str_to_surfs(saved_actor)
+    assert saved_actor.surf.get_size() == (10, 10)
+    # the live game gets its references and surfaces back and keeps drawing
+    assert actor.game is game and isinstance(actor.surf, pg.Surface)
+    handler.run_frames(2, force_draw = True)
+    assert not actor.drawn_key is None
+
+def test_button_state_surfaces_are_rebuilt(make_game, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    pg.font.init()
+    button = Button([10, 10], [80, 30], (50, 50, 150), 255, 'Go')
+    game, handler = make_game(buttons = [button])
+    handler.run_frames(3, force_draw = True)
+    assert not button.state_surfs is None
+    saved = save_and_load(game, 'button')
+    saved_button = saved['Main_menu'][0]['buttons'][0]
+    assert saved_button.state_surfs is None and saved_button.state_key is None
+    convert_str_to_surfs(saved_button)
+    assert saved_button.surf.get_size() == (80, 30) and saved_button.text == 'Go'
+    handler.run_frames(2, force_draw = True)
+    assert not button.state_surfs is None
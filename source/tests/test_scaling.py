@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+"""
+Tests of scaling the game screen into the window.
+"""
+import pygame as pg
+
+RED = (255, 0, 0)
+
+def test_dirty_regions_scale_like_the_full_screen(make_game):
+    game, handler = make_game(handler_kwargs = {'resolution' : [400, 400]})
+    assert list(handler.scale_xy) == [2, 2] and handler.integer_scale
+    scaled_screen = handler.scaled_screen
+    assert handler.scale_rect(pg.Rect(3, 5, 10, 10)) == pg.Rect(6, 10, 20, 20)
+    handler.scale_screen()
+    handler.screen.fill(RED, pg.Rect(20, 30, 4, 4))
+    display_rects = handler.scale_screen([pg.Rect(20, 30, 4, 4)])
+    assert display_rects == [pg.Rect(40, 60, 8, 8)]
+    partial = handler.screen_display.copy()
+    handler.scale_screen()
+    assert partial.get_at((47, 67))[:3] == RED and partial.get_at((48, 68))[:3] != RED
+    # updating only the changed region gives the same window as scaling the whole screen
+    assert pg.image.tostring(partial, 'RGB') == pg.image.tostring(handler.screen_display, 'RGB')
+    # the destination surface is built once and reused
+    assert handler.scaled_screen is scaled_screen
+
+def test_fractional_scale_covers_every_touched_pixel(make_game):
+    game, handler = make_game(handler_kwargs = {'resolution' : [300, 300]})
+    assert not handler.integer_scale
+    assert handler.scale_rect(pg.Rect(1, 1, 3, 3)) == pg.Rect(1, 1, 5, 5)
+    # rectangles are kept inside the scaled screen
+    assert handler.scale_rect(pg.Rect(190, 190, 20, 20)) == pg.Rect(285, 285, 15, 15)
@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+"""
+Tests of active-set scheduling: sleeping components, timed wakes and early wakes.
+"""
+from PyGame_ClassExt_smongan1.BaseClasses import Actor
+
+def test_timers_and_wake(make_game):
+    actor = Actor([0, 0], [5, 5])
+    game, handler = make_game(actors = [actor])
+    widget = game.widgets['widget_main']
+    handler.run_frames(1, dt = 1/60)
+    actor.sleep(0.04)
+    assert actor.sleeping and actor in widget.asleep
+    handler.run_frames(2)
+    assert actor.sleeping
+    handler.run_frames(1)
+    assert not actor.sleeping
+    assert actor in widget.active['actors']
+    assert game.scheduler.timed_wakes == 1
+    # a wake before the timer runs out leaves the timer to be skipped
+    actor.sleep(0.04)
+    actor.wake()
+    assert not actor.sleeping and actor in widget.active['actors']
+    actor.sleep()
+    handler.run_frames(5)
+    assert actor.sleeping and game.scheduler.timed_wakes == 1
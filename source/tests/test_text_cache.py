@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+"""
+Tests of the shared LRU cache of rendered text.
+"""
+import pygame as pg
+from PyGame_ClassExt_smongan1.TextCache import TextCache
+
+FONT = ['Arial', 20, (0, 0, 0)]
+
+def test_lru_and_byte_budget():
+    pg.font.init()
+    cache = TextCache()
+    surf = cache.render('a', FONT)
+    assert cache.render('a', FONT) is surf
+    assert cache.hits == 1 and cache.misses == 1
+    sizes = {text : cache.render(text, FONT).get_pitch() * cache.render(text, FONT).get_height()
+             for text in 'abc'}
+    cache.clear()
+    cache.render('a', FONT)
+    cache.render('b', FONT)
+    cache.set_budget(max(sizes['a'] + sizes['b'], sizes['a'] + sizes['c']))
+    cache.render('a', FONT)
+    cache.render('c', FONT)
+    assert [key[-1] for key in cache.surfs] == ['a', 'c']
+    assert cache.evictions == 1 and cache.bytes == sizes['a'] + sizes['c']
+    cache.set_budget(0)
+    assert len(cache) == 0
+    cache.render('a', FONT)
+    assert len(cache) == 0
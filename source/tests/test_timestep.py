@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+"""
+Tests of the fixed-timestep update loop and render interpolation.
+"""
+import numpy as np
+import pytest
+from PyGame_ClassExt_smongan1.BaseClasses import Actor
+
+def make_fixed_game(make_game, **components):
+    game, handler = make_game(handler_kwargs = {'fixed_timestep' : True, 
+                                                'max_updates_per_frame' : 5}, **components)
+    updates = []
+    game.update = lambda: updates.append(1)
+    return game, handler, updates
+
+def run_frame(handler, frame_time):
+    handler.pacer.last_frame_time = frame_time
+    return handler.update_game()
+
+def test_alpha_carries_the_leftover_time(make_game):
+    game, handler, updates = make_fixed_game(make_game)
+    dt = game.dt
+    assert run_frame(handler, 0.5 * dt) == pytest.approx(0.5)
+    assert len(updates) == 0
+    assert run_frame(handler, 0.75 * dt) == pytest.approx(0.25)
+    assert len(updates) == 1
+    assert run_frame(handler, 2 * dt) == pytest.approx(0.25)
+    assert len(updates) == 3 and handler.dropped_time == 0
+
+def test_slow_frames_drop_time_past_the_update_limit(make_game):
+    game, handler, updates = make_fixed_game(make_game)
+    dt = game.dt
+    run_frame(handler, 0.25 * dt)
+    # a 20 step stall runs at most max_updates_per_frame updates and drops the rest
+    assert run_frame(handler, 20 * dt) == pytest.approx(0.25)
+    assert len(updates) == 5
+    assert handler.dropped_time == pytest.approx(15 * dt)
+    run_frame(handler, dt)
+    assert len(updates) == 6 and handler.dropped_time == pytest.approx(15 * dt)
+
+def test_actors_draw_between_their_last_two_positions(make_game):
+    actor = Actor([10, 0], [5, 5])
+    game, handler = make_game(actors = [actor])
+    actor.prev_position = np.array([0., 0.])
+    game.alpha = 0.25
+    assert list(actor.draw_position()) == [2.5, 0]
+    game.alpha = 1
+    assert list(actor.draw_position()) == [10, 0]